@@ -4,12 +4,23 @@ Validation modules for Word document processing.
 
 from .base import BaseSchemaValidator
 from .docx import DOCXSchemaValidator
+from .graph import PackageGraph
 from .pptx import PPTXSchemaValidator
 from .redlining import RedliningValidator
+from .results import Issue, ValidationReport, render_json, render_junit, render_text
+from .source import DirectorySource, ZipSource
 
 __all__ = [
     "BaseSchemaValidator",
     "DOCXSchemaValidator",
+    "PackageGraph",
     "PPTXSchemaValidator",
     "RedliningValidator",
+    "Issue",
+    "ValidationReport",
+    "render_json",
+    "render_junit",
+    "render_text",
+    "DirectorySource",
+    "ZipSource",
 ]
@@ -3,10 +3,14 @@ Base validator with common validation logic for document files.
 """
 
 import re
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 
 import lxml.etree
 
+from .graph import CONTENT_TYPES_PART, PackageGraph, rels_part_for
+from .results import StopValidation, ValidationReport, render_text
+from .source import ZipSource, open_source, parse_part
+
 
 class BaseSchemaValidator:
     """Base validator with common validation logic for document files."""
@@ -66,6 +70,10 @@ class BaseSchemaValidator:
         "drawing": "ISO-IEC29500-4_2016/dml-main.xsd",
     }
 
+    # Compiled XMLSchema objects keyed by schema path, shared by all instances
+    # so that a process validating many documents compiles each schema once
+    _compiled_schemas = {}
+
     # Unified namespace constants
     MC_NAMESPACE = "http://schemas.openxmlformats.org/markup-compatibility/2006"
     XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
@@ -103,297 +111,288 @@ class BaseSchemaValidator:
         "http://www.w3.org/XML/1998/namespace",
     }
 
-    def __init__(self, unpacked_dir, original_file, verbose=False):
-        self.unpacked_dir = Path(unpacked_dir).resolve()
+    def __init__(
+        self, unpacked_dir, original_file, verbose=False, max_errors=None, fail_fast=False
+    ):
+        # unpacked_dir may also be a packed Office file; parts are then read
+        # straight from the archive and nothing is extracted to disk
+        self.source = open_source(unpacked_dir)
+        self.unpacked_dir = self.source.path
         self.original_file = Path(original_file)
+        self._original_source = None
         self.verbose = verbose
+        self.max_errors = max_errors
+        self.fail_fast = fail_fast
+        self.report = None
 
         # Set schemas directory
         self.schemas_dir = Path(__file__).parent.parent.parent / "schemas"
 
-        # Get all XML and .rels files
-        patterns = ["*.xml", "*.rels"]
+        # Index the package once; relationship and content type checks query it
+        try:
+            self.graph = PackageGraph.from_source(self.source)
+        except Exception:
+            self.source.close()
+            raise
+
+        # Get all XML and .rels files as part names relative to the package root
+        parts = sorted(self.graph.parts)
         self.xml_files = [
-            f for pattern in patterns for f in self.unpacked_dir.rglob(pattern)
+            PurePosixPath(part)
+            for suffix in (".xml", ".rels")
+            for part in parts
+            if part.endswith(suffix)
         ]
 
-        if not self.xml_files:
-            print(f"Warning: No XML files found in {self.unpacked_dir}")
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def close(self):
+        """Close the archives opened for the document and the original file."""
+        self.source.close()
+        if self._original_source is not None:
+            self._original_source.close()
+            self._original_source = None
+
+    def run(self):
+        """Run all validation checks and return the ValidationReport without printing it."""
+        self.report = ValidationReport(
+            type(self).__name__,
+            self.unpacked_dir,
+            max_errors=self.max_errors,
+            fail_fast=self.fail_fast,
+        )
+        try:
+            if not self.xml_files:
+                with self.report.check("package") as check:
+                    check.warning(f"No XML files found in {self.unpacked_dir}")
+            self.run_checks()
+        except StopValidation:
+            pass
+        return self.report
 
     def validate(self):
-        """Run all validation checks and return True if all pass."""
-        raise NotImplementedError("Subclasses must implement the validate method")
+        """Run all validation checks, print the text report and return True if all pass."""
+        text = render_text(self.run(), verbose=self.verbose)
+        if text:
+            print(text)
+        return self.report.passed
+
+    def run_checks(self):
+        """Run the format-specific checks, recording findings in self.report."""
+        raise NotImplementedError("Subclasses must implement the run_checks method")
+
+    def _parse(self, xml_file):
+        """Parse a part of the document being validated."""
+        return parse_part(self.source, str(xml_file))
+
+    @property
+    def original_source(self):
+        """ZipSource for the original file, opened on first use."""
+        if self._original_source is None:
+            self._original_source = ZipSource(self.original_file)
+        return self._original_source
 
     def validate_xml(self):
         """Validate that all XML files are well-formed."""
-        errors = []
-
-        for xml_file in self.xml_files:
-            try:
-                # Try to parse the XML file
-                lxml.etree.parse(str(xml_file))
-            except lxml.etree.XMLSyntaxError as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                    f"Line {e.lineno}: {e.msg}"
-                )
-            except Exception as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                    f"Unexpected error: {str(e)}"
-                )
+        with self.report.check(
+            "xml",
+            passed="All XML files are well-formed",
+            failed="Found {count} XML violations:",
+        ) as check:
+            for xml_file in self.xml_files:
+                try:
+                    # Try to parse the XML file
+                    self._parse(xml_file)
+                except lxml.etree.XMLSyntaxError as e:
+                    check.error(e.msg, xml_file, e.lineno)
+                except Exception as e:
+                    check.error(f"Unexpected error: {str(e)}", xml_file)
 
-        if errors:
-            print(f"FAILED - Found {len(errors)} XML violations:")
-            for error in errors:
-                print(error)
-            return False
-        else:
-            if self.verbose:
-                print("PASSED - All XML files are well-formed")
-            return True
+            return check.passed
 
     def validate_namespaces(self):
         """Validate that namespace prefixes in Ignorable attributes are declared."""
-        errors = []
-
-        for xml_file in self.xml_files:
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                declared = set(root.nsmap.keys()) - {None}  # Exclude default namespace
-
-                for attr_val in [
-                    v for k, v in root.attrib.items() if k.endswith("Ignorable")
-                ]:
-                    undeclared = set(attr_val.split()) - declared
-                    errors.extend(
-                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                        f"Namespace '{ns}' in Ignorable but not declared"
-                        for ns in undeclared
-                    )
-            except lxml.etree.XMLSyntaxError:
-                continue
+        with self.report.check(
+            "namespaces",
+            passed="All namespace prefixes properly declared",
+            failed="{count} namespace issues:",
+        ) as check:
+            for xml_file in self.xml_files:
+                try:
+                    root = self._parse(xml_file).getroot()
+                    declared = set(root.nsmap.keys()) - {None}  # Exclude default namespace
+
+                    for attr_val in [
+                        v for k, v in root.attrib.items() if k.endswith("Ignorable")
+                    ]:
+                        for ns in set(attr_val.split()) - declared:
+                            check.error(
+                                f"Namespace '{ns}' in Ignorable but not declared",
+                                xml_file,
+                            )
+                except lxml.etree.XMLSyntaxError:
+                    continue
 
-        if errors:
-            print(f"FAILED - {len(errors)} namespace issues:")
-            for error in errors:
-                print(error)
-            return False
-        if self.verbose:
-            print("PASSED - All namespace prefixes properly declared")
-        return True
+            return check.passed
 
     def validate_unique_ids(self):
         """Validate that specific IDs are unique according to OOXML requirements."""
-        errors = []
         global_ids = {}  # Track globally unique IDs across all files
 
-        for xml_file in self.xml_files:
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                file_ids = {}  # Track IDs that must be unique within this file
+        with self.report.check(
+            "unique-ids",
+            passed="All required IDs are unique",
+            failed="Found {count} ID uniqueness violations:",
+        ) as check:
+            for xml_file in self.xml_files:
+                try:
+                    root = self._parse(xml_file).getroot()
+                    file_ids = {}  # Track IDs that must be unique within this file
 
-                # Remove all mc:AlternateContent elements from the tree
-                mc_elements = root.xpath(
-                    ".//mc:AlternateContent", namespaces={"mc": self.MC_NAMESPACE}
-                )
-                for elem in mc_elements:
-                    elem.getparent().remove(elem)
-
-                # Now check IDs in the cleaned tree
-                for elem in root.iter():
-                    # Get the element name without namespace
-                    tag = (
-                        elem.tag.split("}")[-1].lower()
-                        if "}" in elem.tag
-                        else elem.tag.lower()
+                    # Remove all mc:AlternateContent elements from the tree
+                    mc_elements = root.xpath(
+                        ".//mc:AlternateContent", namespaces={"mc": self.MC_NAMESPACE}
                     )
+                    for elem in mc_elements:
+                        elem.getparent().remove(elem)
+
+                    # Now check IDs in the cleaned tree
+                    for elem in root.iter():
+                        # Get the element name without namespace
+                        tag = (
+                            elem.tag.split("}")[-1].lower()
+                            if "}" in elem.tag
+                            else elem.tag.lower()
+                        )
 
-                    # Check if this element type has ID uniqueness requirements
-                    if tag in self.UNIQUE_ID_REQUIREMENTS:
-                        attr_name, scope = self.UNIQUE_ID_REQUIREMENTS[tag]
-
-                        # Look for the specified attribute
-                        id_value = None
-                        for attr, value in elem.attrib.items():
-                            attr_local = (
-                                attr.split("}")[-1].lower()
-                                if "}" in attr
-                                else attr.lower()
-                            )
-                            if attr_local == attr_name:
-                                id_value = value
-                                break
-
-                        if id_value is not None:
-                            if scope == "global":
-                                # Check global uniqueness
-                                if id_value in global_ids:
-                                    prev_file, prev_line, prev_tag = global_ids[
-                                        id_value
-                                    ]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Global ID '{id_value}' in <{tag}> "
-                                        f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
-                                    )
-                                else:
-                                    global_ids[id_value] = (
-                                        xml_file.relative_to(self.unpacked_dir),
-                                        elem.sourceline,
-                                        tag,
-                                    )
-                            elif scope == "file":
-                                # Check file-level uniqueness
-                                key = (tag, attr_name)
-                                if key not in file_ids:
-                                    file_ids[key] = {}
-
-                                if id_value in file_ids[key]:
-                                    prev_line = file_ids[key][id_value]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Duplicate {attr_name}='{id_value}' in <{tag}> "
-                                        f"(first occurrence at line {prev_line})"
-                                    )
-                                else:
-                                    file_ids[key][id_value] = elem.sourceline
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
-
-        if errors:
-            print(f"FAILED - Found {len(errors)} ID uniqueness violations:")
-            for error in errors:
-                print(error)
-            return False
-        else:
-            if self.verbose:
-                print("PASSED - All required IDs are unique")
-            return True
+                        # Check if this element type has ID uniqueness requirements
+                        if tag in self.UNIQUE_ID_REQUIREMENTS:
+                            attr_name, scope = self.UNIQUE_ID_REQUIREMENTS[tag]
+
+                            # Look for the specified attribute
+                            id_value = None
+                            for attr, value in elem.attrib.items():
+                                attr_local = (
+                                    attr.split("}")[-1].lower()
+                                    if "}" in attr
+                                    else attr.lower()
+                                )
+                                if attr_local == attr_name:
+                                    id_value = value
+                                    break
+
+                            if id_value is not None:
+                                if scope == "global":
+                                    # Check global uniqueness
+                                    if id_value in global_ids:
+                                        prev_file, prev_line, prev_tag = global_ids[
+                                            id_value
+                                        ]
+                                        check.error(
+                                            f"Global ID '{id_value}' in <{tag}> "
+                                            f"already used in {prev_file} at line {prev_line} in <{prev_tag}>",
+                                            xml_file,
+                                            elem.sourceline,
+                                        )
+                                    else:
+                                        global_ids[id_value] = (
+                                            xml_file,
+                                            elem.sourceline,
+                                            tag,
+                                        )
+                                elif scope == "file":
+                                    # Check file-level uniqueness
+                                    key = (tag, attr_name)
+                                    if key not in file_ids:
+                                        file_ids[key] = {}
+
+                                    if id_value in file_ids[key]:
+                                        prev_line = file_ids[key][id_value]
+                                        check.error(
+                                            f"Duplicate {attr_name}='{id_value}' in <{tag}> "
+                                            f"(first occurrence at line {prev_line})",
+                                            xml_file,
+                                            elem.sourceline,
+                                        )
+                                    else:
+                                        file_ids[key][id_value] = elem.sourceline
+
+                except (lxml.etree.XMLSyntaxError, Exception) as e:
+                    check.error(f"Error: {e}", xml_file)
+
+            return check.passed
 
     def validate_file_references(self):
         """
         Validate that all .rels files properly reference files and that all files are referenced.
         """
-        errors = []
-
-        # Find all .rels files
-        rels_files = list(self.unpacked_dir.rglob("*.rels"))
-
-        if not rels_files:
-            if self.verbose:
-                print("PASSED - No .rels files found")
-            return True
-
-        # Get all files in the unpacked directory (excluding reference files)
-        all_files = []
-        for file_path in self.unpacked_dir.rglob("*"):
-            if (
-                file_path.is_file()
-                and file_path.name != "[Content_Types].xml"
-                and not file_path.name.endswith(".rels")
-            ):  # This file is not referenced by .rels
-                all_files.append(file_path.resolve())
-
-        # Track all files that are referenced by any .rels file
-        all_referenced_files = set()
-
-        if self.verbose:
-            print(
-                f"Found {len(rels_files)} .rels files and {len(all_files)} target files"
-            )
-
-        # Check each .rels file
-        for rels_file in rels_files:
-            try:
-                # Parse relationships file
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
-
-                # Get the directory where this .rels file is located
-                rels_dir = rels_file.parent
-
-                # Find all relationships and their targets
-                referenced_files = set()
-                broken_refs = []
-
-                for rel in rels_root.findall(
-                    ".//ns:Relationship",
-                    namespaces={"ns": self.PACKAGE_RELATIONSHIPS_NAMESPACE},
-                ):
-                    target = rel.get("Target")
-                    if target and not target.startswith(
-                        ("http", "mailto:")
-                    ):  # Skip external URLs
-                        # Resolve the target path relative to the .rels file location
-                        if rels_file.name == ".rels":
-                            # Root .rels file - targets are relative to unpacked_dir
-                            target_path = self.unpacked_dir / target
-                        else:
-                            # Other .rels files - targets are relative to their parent's parent
-                            # e.g., word/_rels/document.xml.rels -> targets relative to word/
-                            base_dir = rels_dir.parent
-                            target_path = base_dir / target
-
-                        # Normalize the path and check if it exists
-                        try:
-                            target_path = target_path.resolve()
-                            if target_path.exists() and target_path.is_file():
-                                referenced_files.add(target_path)
-                                all_referenced_files.add(target_path)
-                            else:
-                                broken_refs.append((target, rel.sourceline))
-                        except (OSError, ValueError):
-                            broken_refs.append((target, rel.sourceline))
-
-                # Report broken references
-                if broken_refs:
-                    rel_path = rels_file.relative_to(self.unpacked_dir)
-                    for broken_ref, line_num in broken_refs:
-                        errors.append(
-                            f"  {rel_path}: Line {line_num}: Broken reference to {broken_ref}"
-                        )
-
-            except Exception as e:
-                rel_path = rels_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Error parsing {rel_path}: {e}")
-
-        # Check for unreferenced files (files that exist but are not referenced anywhere)
-        unreferenced_files = set(all_files) - all_referenced_files
-
-        if unreferenced_files:
-            for unref_file in sorted(unreferenced_files):
-                unref_rel_path = unref_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Unreferenced file: {unref_rel_path}")
-
-        if errors:
-            print(f"FAILED - Found {len(errors)} relationship validation errors:")
-            for error in errors:
-                print(error)
-            print(
+        rels_parts = self.graph.rels_parts
+        if not rels_parts:
+            with self.report.check("file-references", passed="No .rels files found"):
+                return True
+
+        with self.report.check(
+            "file-references",
+            passed="All references are valid and all files are properly referenced",
+            failed="Found {count} relationship validation errors:",
+            notes=[
                 "CRITICAL: These errors will cause the document to appear corrupt. "
                 + "Broken references MUST be fixed, "
                 + "and unreferenced files MUST be referenced or removed."
+            ],
+        ) as check:
+            target_count = sum(
+                1
+                for part in self.graph.parts
+                if part != CONTENT_TYPES_PART and not part.endswith(".rels")
             )
-            return False
-        else:
-            if self.verbose:
-                print(
-                    "PASSED - All references are valid and all files are properly referenced"
+            check.detail(
+                f"Found {len(rels_parts)} .rels files and {target_count} target files"
+            )
+
+            for rels_part in rels_parts:
+                if rels_part in self.graph.rels_errors:
+                    error = self.graph.rels_errors[rels_part]
+                    check.error(
+                        f"Error parsing: {error}",
+                        rels_part,
+                        text=f"  Error parsing {rels_part}: {error}",
+                    )
+
+            # Report broken references
+            for rel in self.graph.broken_relationships():
+                check.error(
+                    f"Broken reference to {rel.target}", rel.rels_part, rel.line
+                )
+
+            # Check for unreferenced files (files that exist but are not referenced anywhere)
+            for part in self.graph.unreferenced_parts():
+                check.error(
+                    "Unreferenced file", part, text=f"  Unreferenced file: {part}"
                 )
-            return True
+
+            return check.passed
 
     def validate_all_relationship_ids(self):
         """
         Validate that all r:id attributes in XML files reference existing IDs
         in their corresponding .rels files, and optionally validate relationship types.
         """
-        import lxml.etree
-
-        errors = []
-
+        with self.report.check(
+            "relationship-ids",
+            passed="All relationship ID references are valid",
+            failed="Found {count} relationship ID reference errors:",
+            notes=["\nThese ID mismatches will cause the document to appear corrupt!"],
+        ) as check:
+            self._check_relationship_ids(check)
+            return check.passed
+
+    def _check_relationship_ids(self, check):
         # Process each XML file that might contain r:id references
         for xml_file in self.xml_files:
             # Skip .rels files themselves
@@ -402,56 +401,57 @@ class BaseSchemaValidator:
 
             # Determine the corresponding .rels file
             # For dir/file.xml, it's dir/_rels/file.xml.rels
-            rels_dir = xml_file.parent / "_rels"
-            rels_file = rels_dir / f"{xml_file.name}.rels"
+            xml_rel_path = xml_file
+            part = str(xml_file)
+            rels_part = rels_part_for(part)
 
             # Skip if there's no corresponding .rels file (that's okay)
-            if not rels_file.exists():
+            if not self.graph.has_part(rels_part):
+                continue
+
+            if rels_part in self.graph.rels_errors:
+                error = self.graph.rels_errors[rels_part]
+                check.error(
+                    f"Error processing: {error}",
+                    xml_rel_path,
+                    text=f"  Error processing {xml_rel_path}: {error}",
+                )
                 continue
 
             try:
-                # Parse the .rels file to get valid relationship IDs and their types
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
+                # Collect valid relationship IDs and their types from the graph
                 rid_to_type = {}
-
-                for rel in rels_root.findall(
-                    f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
-                ):
-                    rid = rel.get("Id")
-                    rel_type = rel.get("Type", "")
-                    if rid:
+                for rel in self.graph.relationships_from(part):
+                    if rel.id:
                         # Check for duplicate rIds
-                        if rid in rid_to_type:
-                            rels_rel_path = rels_file.relative_to(self.unpacked_dir)
-                            errors.append(
-                                f"  {rels_rel_path}: Line {rel.sourceline}: "
-                                f"Duplicate relationship ID '{rid}' (IDs must be unique)"
+                        if rel.id in rid_to_type:
+                            check.error(
+                                f"Duplicate relationship ID '{rel.id}' (IDs must be unique)",
+                                rels_part,
+                                rel.line,
                             )
                         # Extract just the type name from the full URL
-                        type_name = (
-                            rel_type.split("/")[-1] if "/" in rel_type else rel_type
-                        )
-                        rid_to_type[rid] = type_name
+                        rid_to_type[rel.id] = rel.type.split("/")[-1]
 
                 # Parse the XML file to find all r:id references
-                xml_root = lxml.etree.parse(str(xml_file)).getroot()
+                xml_root = self._parse(xml_file).getroot()
 
                 # Find all elements with r:id attributes
                 for elem in xml_root.iter():
                     # Check for r:id attribute (relationship ID)
                     rid_attr = elem.get(f"{{{self.OFFICE_RELATIONSHIPS_NAMESPACE}}}id")
                     if rid_attr:
-                        xml_rel_path = xml_file.relative_to(self.unpacked_dir)
                         elem_name = (
                             elem.tag.split("}")[-1] if "}" in elem.tag else elem.tag
                         )
 
                         # Check if the ID exists
                         if rid_attr not in rid_to_type:
-                            errors.append(
-                                f"  {xml_rel_path}: Line {elem.sourceline}: "
+                            check.error(
                                 f"<{elem_name}> references non-existent relationship '{rid_attr}' "
-                                f"(valid IDs: {', '.join(sorted(rid_to_type.keys())[:5])}{'...' if len(rid_to_type) > 5 else ''})"
+                                f"(valid IDs: {', '.join(sorted(rid_to_type.keys())[:5])}{'...' if len(rid_to_type) > 5 else ''})",
+                                xml_rel_path,
+                                elem.sourceline,
                             )
                         # Check if we have type expectations for this element
                         elif self.ELEMENT_RELATIONSHIP_TYPES:
@@ -462,26 +462,19 @@ class BaseSchemaValidator:
                                 actual_type = rid_to_type[rid_attr]
                                 # Check if the actual type matches or contains the expected type
                                 if expected_type not in actual_type.lower():
-                                    errors.append(
-                                        f"  {xml_rel_path}: Line {elem.sourceline}: "
+                                    check.error(
                                         f"<{elem_name}> references '{rid_attr}' which points to '{actual_type}' "
-                                        f"but should point to a '{expected_type}' relationship"
+                                        f"but should point to a '{expected_type}' relationship",
+                                        xml_rel_path,
+                                        elem.sourceline,
                                     )
 
             except Exception as e:
-                xml_rel_path = xml_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Error processing {xml_rel_path}: {e}")
-
-        if errors:
-            print(f"FAILED - Found {len(errors)} relationship ID reference errors:")
-            for error in errors:
-                print(error)
-            print("\nThese ID mismatches will cause the document to appear corrupt!")
-            return False
-        else:
-            if self.verbose:
-                print("PASSED - All relationship ID references are valid")
-            return True
+                check.error(
+                    f"Error processing: {e}",
+                    xml_rel_path,
+                    text=f"  Error processing {xml_rel_path}: {e}",
+                )
 
     def _get_expected_relationship_type(self, element_name):
         """
@@ -521,35 +514,32 @@ class BaseSchemaValidator:
 
     def validate_content_types(self):
         """Validate that all content files are properly declared in [Content_Types].xml."""
-        errors = []
-
         # Find [Content_Types].xml file
-        content_types_file = self.unpacked_dir / "[Content_Types].xml"
-        if not content_types_file.exists():
-            print("FAILED - [Content_Types].xml file not found")
-            return False
-
-        try:
-            # Parse and get all declared parts and extensions
-            root = lxml.etree.parse(str(content_types_file)).getroot()
-            declared_parts = set()
-            declared_extensions = set()
-
-            # Get Override declarations (specific files)
-            for override in root.findall(
-                f".//{{{self.CONTENT_TYPES_NAMESPACE}}}Override"
-            ):
-                part_name = override.get("PartName")
-                if part_name is not None:
-                    declared_parts.add(part_name.lstrip("/"))
-
-            # Get Default declarations (by extension)
-            for default in root.findall(
-                f".//{{{self.CONTENT_TYPES_NAMESPACE}}}Default"
-            ):
-                extension = default.get("Extension")
-                if extension is not None:
-                    declared_extensions.add(extension.lower())
+        if not self.graph.has_part(CONTENT_TYPES_PART):
+            with self.report.check("content-types") as check:
+                check.error("[Content_Types].xml file not found", CONTENT_TYPES_PART)
+                return False
+
+        with self.report.check(
+            "content-types",
+            passed="All content files are properly declared in [Content_Types].xml",
+            failed="Found {count} content type declaration errors:",
+        ) as check:
+            self._check_content_types(check)
+            return check.passed
+
+    def _check_content_types(self, check):
+        if self.graph.content_types_error is not None:
+            error = self.graph.content_types_error
+            check.error(
+                f"Error parsing: {error}",
+                CONTENT_TYPES_PART,
+                text=f"  Error parsing {CONTENT_TYPES_PART}: {error}",
+            )
+        else:
+            # Declared parts (Override) and extensions (Default) from the graph
+            declared_parts = self.graph.override_types
+            declared_extensions = self.graph.default_types
 
             # Root elements that require content type declaration
             declarable_roots = {
@@ -575,15 +565,9 @@ class BaseSchemaValidator:
                 "emf": "image/x-emf",
             }
 
-            # Get all files in the unpacked directory
-            all_files = list(self.unpacked_dir.rglob("*"))
-            all_files = [f for f in all_files if f.is_file()]
-
             # Check all XML files for Override declarations
             for xml_file in self.xml_files:
-                path_str = str(xml_file.relative_to(self.unpacked_dir)).replace(
-                    "\\", "/"
-                )
+                path_str = str(xml_file)
 
                 # Skip non-content files
                 if any(
@@ -593,69 +577,57 @@ class BaseSchemaValidator:
                     continue
 
                 try:
-                    root_tag = lxml.etree.parse(str(xml_file)).getroot().tag
+                    root_tag = self._get_root_tag(xml_file)
                     root_name = root_tag.split("}")[-1] if "}" in root_tag else root_tag
 
                     if root_name in declarable_roots and path_str not in declared_parts:
-                        errors.append(
-                            f"  {path_str}: File with <{root_name}> root not declared in [Content_Types].xml"
+                        check.error(
+                            f"File with <{root_name}> root not declared in [Content_Types].xml",
+                            path_str,
                         )
 
                 except Exception:
                     continue  # Skip unparseable files
 
             # Check all non-XML files for Default extension declarations
-            for file_path in all_files:
+            for part in sorted(self.graph.parts):
                 # Skip XML files and metadata files (already checked above)
-                if file_path.suffix.lower() in {".xml", ".rels"}:
+                folders = part.split("/")[:-1]
+                extension = Path(part).suffix.lstrip(".").lower()
+                if extension in {"xml", "rels"}:
                     continue
-                if file_path.name == "[Content_Types].xml":
-                    continue
-                if "_rels" in file_path.parts or "docProps" in file_path.parts:
+                if "_rels" in folders or "docProps" in folders:
                     continue
 
-                extension = file_path.suffix.lstrip(".").lower()
                 if extension and extension not in declared_extensions:
                     # Check if it's a known media extension that should be declared
                     if extension in media_extensions:
-                        relative_path = file_path.relative_to(self.unpacked_dir)
-                        errors.append(
-                            f'  {relative_path}: File with extension \'{extension}\' not declared in [Content_Types].xml - should add: <Default Extension="{extension}" ContentType="{media_extensions[extension]}"/>'
+                        check.error(
+                            f'File with extension \'{extension}\' not declared in [Content_Types].xml - should add: <Default Extension="{extension}" ContentType="{media_extensions[extension]}"/>',
+                            part,
                         )
 
-        except Exception as e:
-            errors.append(f"  Error parsing [Content_Types].xml: {e}")
-
-        if errors:
-            print(f"FAILED - Found {len(errors)} content type declaration errors:")
-            for error in errors:
-                print(error)
-            return False
-        else:
-            if self.verbose:
-                print(
-                    "PASSED - All content files are properly declared in [Content_Types].xml"
-                )
-            return True
+    def _get_root_tag(self, xml_file):
+        """Return the root element tag of an XML file without building the whole tree."""
+        with self.source.open(str(xml_file)) as f:
+            for _, elem in lxml.etree.iterparse(f, events=("start",)):
+                return elem.tag
+        return ""
 
     def validate_file_against_xsd(self, xml_file, verbose=False):
         """Validate a single XML file against XSD schema, comparing with original.
 
         Args:
-            xml_file: Path to XML file to validate
+            xml_file: Part name of the XML file to validate
             verbose: Enable verbose output
 
         Returns:
             tuple: (is_valid, new_errors_set) where is_valid is True/False/None (skipped)
         """
-        # Resolve both paths to handle symlinks
-        xml_file = Path(xml_file).resolve()
-        unpacked_dir = self.unpacked_dir.resolve()
+        xml_file = PurePosixPath(xml_file)
 
         # Validate current file
-        is_valid, current_errors = self._validate_single_file_xsd(
-            xml_file, unpacked_dir
-        )
+        is_valid, current_errors = self._validate_single_file_xsd(self.source, xml_file)
 
         if is_valid is None:
             return None, set()  # Skipped
@@ -671,8 +643,7 @@ class BaseSchemaValidator:
 
         if new_errors:
             if verbose:
-                relative_path = xml_file.relative_to(unpacked_dir)
-                print(f"FAILED - {relative_path}: {len(new_errors)} new error(s)")
+                print(f"FAILED - {xml_file}: {len(new_errors)} new error(s)")
                 for error in list(new_errors)[:3]:
                     truncated = error[:250] + "..." if len(error) > 250 else error
                     print(f"  - {truncated}")
@@ -687,56 +658,52 @@ class BaseSchemaValidator:
 
     def validate_against_xsd(self):
         """Validate XML files against XSD schemas, showing only new errors compared to original."""
-        new_errors = []
         original_error_count = 0
         valid_count = 0
         skipped_count = 0
+        failed_count = 0
+
+        with self.report.check(
+            "xsd",
+            passed="No new XSD validation errors introduced",
+            failed="Found NEW validation errors:",
+            group_label="new error(s)",
+            spaced=True,
+        ) as check:
+            try:
+                for xml_file in self.xml_files:
+                    is_valid, new_file_errors = self.validate_file_against_xsd(
+                        xml_file, verbose=False
+                    )
 
-        for xml_file in self.xml_files:
-            relative_path = str(xml_file.relative_to(self.unpacked_dir))
-            is_valid, new_file_errors = self.validate_file_against_xsd(
-                xml_file, verbose=False
-            )
-
-            if is_valid is None:
-                skipped_count += 1
-                continue
-            elif is_valid and not new_file_errors:
-                valid_count += 1
-                continue
-            elif is_valid:
-                # Had errors but all existed in original
-                original_error_count += 1
-                valid_count += 1
-                continue
-
-            # Has new errors
-            new_errors.append(f"  {relative_path}: {len(new_file_errors)} new error(s)")
-            for error in list(new_file_errors)[:3]:  # Show first 3 errors
-                new_errors.append(
-                    f"    - {error[:250]}..." if len(error) > 250 else f"    - {error}"
-                )
-
-        # Print summary
-        if self.verbose:
-            print(f"Validated {len(self.xml_files)} files:")
-            print(f"  - Valid: {valid_count}")
-            print(f"  - Skipped (no schema): {skipped_count}")
-            if original_error_count:
-                print(f"  - With original errors (ignored): {original_error_count}")
-            print(
-                f"  - With NEW errors: {len(new_errors) > 0 and len([e for e in new_errors if not e.startswith('    ')]) or 0}"
-            )
+                    if is_valid is None:
+                        skipped_count += 1
+                        continue
+                    elif is_valid and not new_file_errors:
+                        valid_count += 1
+                        continue
+                    elif is_valid:
+                        # Had errors but all existed in original
+                        original_error_count += 1
+                        valid_count += 1
+                        continue
+
+                    # Has new errors
+                    failed_count += 1
+                    for error in new_file_errors:
+                        check.error(error, xml_file)
+            finally:
+                # Summary for the verbose renderer
+                check.detail(f"Validated {len(self.xml_files)} files:")
+                check.detail(f"  - Valid: {valid_count}")
+                check.detail(f"  - Skipped (no schema): {skipped_count}")
+                if original_error_count:
+                    check.detail(
+                        f"  - With original errors (ignored): {original_error_count}"
+                    )
+                check.detail(f"  - With NEW errors: {failed_count}")
 
-        if new_errors:
-            print("\nFAILED - Found NEW validation errors:")
-            for error in new_errors:
-                print(error)
-            return False
-        else:
-            if self.verbose:
-                print("\nPASSED - No new XSD validation errors introduced")
-            return True
+            return check.passed
 
     def _get_schema_path(self, xml_file):
         """Determine the appropriate schema path for an XML file."""
@@ -762,96 +729,104 @@ class BaseSchemaValidator:
 
         return None
 
-    def _clean_ignorable_namespaces(self, xml_doc):
-        """Remove attributes and elements not in allowed namespaces."""
-        # Create a clean copy
-        xml_string = lxml.etree.tostring(xml_doc, encoding="unicode")
-        xml_copy = lxml.etree.fromstring(xml_string)
+    @classmethod
+    def _load_schema(cls, schema_path):
+        """Return the compiled XMLSchema for a schema path, compiling it on first use."""
+        key = str(schema_path)
+        schema = cls._compiled_schemas.get(key)
+        if schema is None:
+            with open(schema_path, "rb") as xsd_file:
+                parser = lxml.etree.XMLParser()
+                xsd_doc = lxml.etree.parse(xsd_file, parser=parser, base_url=key)
+                schema = lxml.etree.XMLSchema(xsd_doc)
+            cls._compiled_schemas[key] = schema
+        return schema
+
+    @classmethod
+    def preload_schemas(cls):
+        """Compile every mapped schema up front, e.g. to warm a worker process."""
+        schemas_dir = Path(__file__).parent.parent.parent / "schemas"
+        for schema_file in sorted(set(cls.SCHEMA_MAPPINGS.values())):
+            try:
+                cls._load_schema(schemas_dir / schema_file)
+            except Exception:
+                # Reported when a file that needs this schema is validated
+                continue
 
-        # Remove attributes not in allowed namespaces
-        for elem in xml_copy.iter():
-            attrs_to_remove = []
+    # Template placeholders ({{ ... }}) stripped from text before XSD validation
+    TEMPLATE_TAG_PATTERN = re.compile(r"\{\{[^}]*\}\}")
 
-            for attr in elem.attrib:
-                # Check if attribute is from a namespace other than allowed ones
-                if "{" in attr:
-                    ns = attr.split("}")[0][1:]
-                    if ns not in self.OOXML_NAMESPACES:
-                        attrs_to_remove.append(attr)
+    def _prepare_for_xsd(self, xml_doc, clean_namespaces):
+        """Prepare a freshly parsed document for XSD validation, in place.
 
-            # Remove collected attributes
-            for attr in attrs_to_remove:
-                del elem.attrib[attr]
+        A single pass over the tree removes template tags from text nodes (other
+        than w:t text), drops mc:Ignorable from the root and, if requested,
+        strips attributes and elements outside the OOXML namespaces. Namespace
+        lookups are memoized per tag/attribute name, which repeat heavily.
+        """
+        root = xml_doc.getroot()
+        root.attrib.pop(f"{{{self.MC_NAMESPACE}}}Ignorable", None)
 
-        # Remove elements not in allowed namespaces
-        self._remove_ignorable_elements(xml_copy)
+        allowed = {}  # tag or attribute name -> bool
 
-        return lxml.etree.ElementTree(xml_copy)
+        def is_allowed(name):
+            result = allowed.get(name)
+            if result is None:
+                result = allowed[name] = (
+                    not name.startswith("{")
+                    or name[1 : name.index("}")] in self.OOXML_NAMESPACES
+                )
+            return result
 
-    def _remove_ignorable_elements(self, root):
-        """Recursively remove all elements not in allowed namespaces."""
+        template_pattern = self.TEMPLATE_TAG_PATTERN
         elements_to_remove = []
-
-        # Find elements to remove
-        for elem in list(root):
-            # Skip non-element nodes (comments, processing instructions, etc.)
-            if not hasattr(elem, "tag") or callable(elem.tag):
+        for elem in root.iter(lxml.etree.Element):
+            tag = elem.tag
+            # Skip processing text of w:t elements
+            if not (tag.endswith("}t") or tag == "t"):
+                text = elem.text
+                if text and "{{" in text:
+                    elem.text = template_pattern.sub("", text)
+                tail = elem.tail
+                if tail and "{{" in tail:
+                    elem.tail = template_pattern.sub("", tail)
+
+            if not clean_namespaces:
                 continue
+            if elem is not root and not is_allowed(tag):
+                elements_to_remove.append(elem)
+                continue
+            attrs_to_remove = [attr for attr in elem.attrib if not is_allowed(attr)]
+            for attr in attrs_to_remove:
+                del elem.attrib[attr]
 
-            tag_str = str(elem.tag)
-            if tag_str.startswith("{"):
-                ns = tag_str.split("}")[0][1:]
-                if ns not in self.OOXML_NAMESPACES:
-                    elements_to_remove.append(elem)
-                    continue
-
-            # Recursively clean child elements
-            self._remove_ignorable_elements(elem)
-
-        # Remove collected elements
+        # Remove elements not in allowed namespaces (with their subtrees)
         for elem in elements_to_remove:
-            root.remove(elem)
-
-    def _preprocess_for_mc_ignorable(self, xml_doc):
-        """Preprocess XML to handle mc:Ignorable attribute properly."""
-        # Remove mc:Ignorable attributes before validation
-        root = xml_doc.getroot()
-
-        # Remove mc:Ignorable attribute from root
-        if f"{{{self.MC_NAMESPACE}}}Ignorable" in root.attrib:
-            del root.attrib[f"{{{self.MC_NAMESPACE}}}Ignorable"]
+            parent = elem.getparent()
+            if parent is not None:
+                parent.remove(elem)
 
         return xml_doc
 
-    def _validate_single_file_xsd(self, xml_file, base_path):
-        """Validate a single XML file against XSD schema. Returns (is_valid, errors_set)."""
+    def _validate_single_file_xsd(self, source, xml_file):
+        """Validate a single part of a source against XSD schema. Returns (is_valid, errors_set)."""
         schema_path = self._get_schema_path(xml_file)
         if not schema_path:
             return None, None  # Skip file
 
         try:
-            # Load schema
-            with open(schema_path, "rb") as xsd_file:
-                parser = lxml.etree.XMLParser()
-                xsd_doc = lxml.etree.parse(
-                    xsd_file, parser=parser, base_url=str(schema_path)
-                )
-                schema = lxml.etree.XMLSchema(xsd_doc)
+            # Load schema (compiled once per process)
+            schema = self._load_schema(schema_path)
 
             # Load and preprocess XML
-            with open(xml_file, "r") as f:
-                xml_doc = lxml.etree.parse(f)
-
-            xml_doc, _ = self._remove_template_tags_from_text_nodes(xml_doc)
-            xml_doc = self._preprocess_for_mc_ignorable(xml_doc)
+            xml_doc = parse_part(source, str(xml_file))
 
-            # Clean ignorable namespaces if needed
-            relative_path = xml_file.relative_to(base_path)
-            if (
-                relative_path.parts
-                and relative_path.parts[0] in self.MAIN_CONTENT_FOLDERS
-            ):
-                xml_doc = self._clean_ignorable_namespaces(xml_doc)
+            # Strip template tags and, in main content folders, ignorable namespaces
+            self._prepare_for_xsd(
+                xml_doc,
+                clean_namespaces=bool(xml_file.parts)
+                and xml_file.parts[0] in self.MAIN_CONTENT_FOLDERS,
+            )
 
             # Validate
             if schema.validate(xml_doc):
@@ -870,81 +845,20 @@ class BaseSchemaValidator:
         """Get XSD validation errors from a single file in the original document.
 
         Args:
-            xml_file: Path to the XML file in unpacked_dir to check
+            xml_file: Part name of the XML file to check
 
         Returns:
             set: Set of error messages from the original file
         """
-        import tempfile
-        import zipfile
-
-        # Resolve both paths to handle symlinks (e.g., /var vs /private/var on macOS)
-        xml_file = Path(xml_file).resolve()
-        unpacked_dir = self.unpacked_dir.resolve()
-        relative_path = xml_file.relative_to(unpacked_dir)
+        if not self.original_source.exists(str(xml_file)):
+            # File didn't exist in original, so no original errors
+            return set()
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Extract original file
-            with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                zip_ref.extractall(temp_path)
-
-            # Find corresponding file in original
-            original_xml_file = temp_path / relative_path
-
-            if not original_xml_file.exists():
-                # File didn't exist in original, so no original errors
-                return set()
-
-            # Validate the specific file in original
-            is_valid, errors = self._validate_single_file_xsd(
-                original_xml_file, temp_path
-            )
-            return errors if errors else set()
-
-    def _remove_template_tags_from_text_nodes(self, xml_doc):
-        """Remove template tags from XML text nodes and collect warnings.
-
-        Template tags follow the pattern {{ ... }} and are used as placeholders
-        for content replacement. They should be removed from text content before
-        XSD validation while preserving XML structure.
-
-        Returns:
-            tuple: (cleaned_xml_doc, warnings_list)
-        """
-        warnings = []
-        template_pattern = re.compile(r"\{\{[^}]*\}\}")
-
-        # Create a copy of the document to avoid modifying the original
-        xml_string = lxml.etree.tostring(xml_doc, encoding="unicode")
-        xml_copy = lxml.etree.fromstring(xml_string)
-
-        def process_text_content(text, content_type):
-            if not text:
-                return text
-            matches = list(template_pattern.finditer(text))
-            if matches:
-                for match in matches:
-                    warnings.append(
-                        f"Found template tag in {content_type}: {match.group()}"
-                    )
-                return template_pattern.sub("", text)
-            return text
-
-        # Process all text nodes in the document
-        for elem in xml_copy.iter():
-            # Skip processing if this is a w:t element
-            if not hasattr(elem, "tag") or callable(elem.tag):
-                continue
-            tag_str = str(elem.tag)
-            if tag_str.endswith("}t") or tag_str == "t":
-                continue
-
-            elem.text = process_text_content(elem.text, "text content")
-            elem.tail = process_text_content(elem.tail, "tail content")
-
-        return lxml.etree.ElementTree(xml_copy), warnings
+        # Validate the specific file in original, read straight from the archive
+        is_valid, errors = self._validate_single_file_xsd(
+            self.original_source, PurePosixPath(xml_file)
+        )
+        return errors if errors else set()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,165 @@
+"""
+Batch validation of many documents with warm worker processes.
+"""
+
+import json
+import multiprocessing
+import os
+import sys
+import time
+from pathlib import Path
+
+from .base import BaseSchemaValidator
+from .docx import DOCXSchemaValidator
+from .pptx import PPTXSchemaValidator
+from .redlining import RedliningValidator
+from .results import render_text
+
+# Validators to run for each original file extension
+VALIDATORS = {
+    ".docx": [DOCXSchemaValidator, RedliningValidator],
+    ".pptx": [PPTXSchemaValidator],
+}
+
+
+def load_manifest(manifest_path):
+    """Load (unpacked_dir, original) pairs from a manifest file.
+
+    The manifest is either a JSON array or JSON Lines. Each entry is an object
+    with "unpacked_dir" and "original" keys, or a two-element list. The
+    unpacked_dir may also be a packed Office file.
+    """
+    text = Path(manifest_path).read_text(encoding="utf-8")
+    try:
+        entries = json.loads(text)
+        if not isinstance(entries, list):
+            entries = [entries]
+    except json.JSONDecodeError:
+        entries = [json.loads(line) for line in text.splitlines() if line.strip()]
+
+    pairs = []
+    for entry in entries:
+        if isinstance(entry, dict):
+            pairs.append((entry["unpacked_dir"], entry["original"]))
+        else:
+            unpacked_dir, original = entry
+            pairs.append((unpacked_dir, original))
+    return pairs
+
+
+def validate_document(
+    unpacked_dir, original_file, verbose=False, max_errors=None, fail_fast=False
+):
+    """Validate one document and return a JSON-serializable result dict.
+
+    The result carries each validator's structured report along with the text
+    the validators would have printed.
+    """
+    start = time.perf_counter()
+    result = {"unpacked_dir": str(unpacked_dir), "original": str(original_file)}
+    reports = []
+    try:
+        validators = VALIDATORS.get(Path(original_file).suffix.lower())
+        if validators is None:
+            raise ValueError(
+                f"Validation not supported for file type {Path(original_file).suffix}"
+            )
+        for V in validators:
+            # Close each validator's archives now rather than when the warm
+            # worker's garbage collector gets to them
+            with V(
+                unpacked_dir,
+                original_file,
+                verbose=verbose,
+                max_errors=max_errors,
+                fail_fast=fail_fast,
+            ) as validator:
+                reports.append(validator.run())
+        result["valid"] = all(report.passed for report in reports)
+    except Exception as e:
+        result["valid"] = False
+        result["error"] = str(e)
+    result["seconds"] = round(time.perf_counter() - start, 3)
+    result["output"] = "\n".join(
+        text for text in (render_text(report, verbose) for report in reports) if text
+    )
+    result["reports"] = [report.to_dict() for report in reports]
+    return result
+
+
+def _warm_worker():
+    """Pool initializer: compile all schemas once per worker process."""
+    BaseSchemaValidator.preload_schemas()
+
+
+def _validate_pair(args):
+    unpacked_dir, original_file, options = args
+    return validate_document(unpacked_dir, original_file, **options)
+
+
+def validate_batch(pairs, jobs=None, verbose=False, max_errors=None, fail_fast=False):
+    """Validate many (unpacked_dir, original) pairs, yielding results as they finish.
+
+    Args:
+        pairs: Iterable of (unpacked_dir, original_file) tuples
+        jobs: Number of worker processes (default: CPU count). 1 runs in-process.
+        verbose: Include verbose validator output
+        max_errors: Stop validating a document after this many errors per validator
+        fail_fast: Stop validating a document after its first failing check
+
+    Yields:
+        dict: Result from validate_document for each document, in completion order
+    """
+    jobs = jobs or os.cpu_count() or 1
+    options = {"verbose": verbose, "max_errors": max_errors, "fail_fast": fail_fast}
+    tasks = [(str(d), str(o), options) for d, o in pairs]
+
+    if jobs == 1 or len(tasks) <= 1:
+        _warm_worker()
+        for task in tasks:
+            yield _validate_pair(task)
+        return
+
+    with multiprocessing.Pool(
+        processes=min(jobs, len(tasks)), initializer=_warm_worker
+    ) as pool:
+        yield from pool.imap_unordered(_validate_pair, tasks)
+
+
+def run_batch(
+    pairs,
+    jobs=None,
+    verbose=False,
+    out=None,
+    summary=None,
+    max_errors=None,
+    fail_fast=False,
+):
+    """Stream one JSON line per document to out and report throughput to summary.
+
+    Returns:
+        bool: True if every document passed
+    """
+    out = out or sys.stdout
+    start = time.perf_counter()
+    total = passed = 0
+    for result in validate_batch(
+        pairs, jobs=jobs, verbose=verbose, max_errors=max_errors, fail_fast=fail_fast
+    ):
+        total += 1
+        passed += result["valid"]
+        out.write(json.dumps(result) + "\n")
+        out.flush()
+
+    elapsed = time.perf_counter() - start
+    if summary is not None:
+        rate = total / elapsed if elapsed > 0 else 0.0
+        summary.write(
+            f"Validated {total} documents in {elapsed:.2f}s "
+            f"({rate:.1f} documents/s): {passed} passed, {total - passed} failed\n"
+        )
+    return passed == total
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
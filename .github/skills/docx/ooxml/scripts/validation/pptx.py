@@ -5,6 +5,7 @@ Validator for PowerPoint presentation XML files against XSD schemas.
 import re
 
 from .base import BaseSchemaValidator
+from .graph import rels_part_for, source_part_for_rels
 
 
 class PPTXSchemaValidator(BaseSchemaValidator):
@@ -25,7 +26,7 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         "tablestyleid": "tablestyles",
     }
 
-    def validate(self):
+    def run_checks(self):
         """Run all validation checks and return True if all pass."""
         # Test 0: XML well-formedness
         if not self.validate_xml():
@@ -76,17 +77,25 @@ class PPTXSchemaValidator(BaseSchemaValidator):
 
     def validate_uuid_ids(self):
         """Validate that ID attributes that look like UUIDs contain only hex values."""
-        import lxml.etree
-
-        errors = []
         # UUID pattern: 8-4-4-4-12 hex digits with optional braces/hyphens
         uuid_pattern = re.compile(
             r"^[\{\(]?[0-9A-Fa-f]{8}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{12}[\}\)]?$"
         )
 
+        with self.report.check(
+            "uuid-ids",
+            passed="All UUID-like IDs contain valid hex values",
+            failed="Found {count} UUID ID validation errors:",
+        ) as check:
+            self._check_uuid_ids(check, uuid_pattern)
+            return check.passed
+
+    def _check_uuid_ids(self, check, uuid_pattern):
+        import lxml.etree
+
         for xml_file in self.xml_files:
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._parse(xml_file).getroot()
 
                 # Check all elements for ID attributes
                 for elem in root.iter():
@@ -98,25 +107,14 @@ class PPTXSchemaValidator(BaseSchemaValidator):
                             if self._looks_like_uuid(value):
                                 # Validate that it contains only hex characters in the right positions
                                 if not uuid_pattern.match(value):
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: ID '{value}' appears to be a UUID but contains invalid hex characters"
+                                    check.error(
+                                        f"ID '{value}' appears to be a UUID but contains invalid hex characters",
+                                        xml_file,
+                                        elem.sourceline,
                                     )
 
             except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
-
-        if errors:
-            print(f"FAILED - Found {len(errors)} UUID ID validation errors:")
-            for error in errors:
-                print(error)
-            return False
-        else:
-            if self.verbose:
-                print("PASSED - All UUID-like IDs contain valid hex values")
-            return True
+                check.error(f"Error: {e}", xml_file)
 
     def _looks_like_uuid(self, value):
         """Check if a value has the general structure of a UUID."""
@@ -127,44 +125,57 @@ class PPTXSchemaValidator(BaseSchemaValidator):
 
     def validate_slide_layout_ids(self):
         """Validate that sldLayoutId elements in slide masters reference valid slide layouts."""
-        import lxml.etree
-
-        errors = []
-
         # Find all slide master files
-        slide_masters = list(self.unpacked_dir.glob("ppt/slideMasters/*.xml"))
+        slide_masters = sorted(
+            part
+            for part in self.graph.parts
+            if part.startswith("ppt/slideMasters/")
+            and part.endswith(".xml")
+            and part.count("/") == 2
+        )
 
         if not slide_masters:
-            if self.verbose:
-                print("PASSED - No slide masters found")
-            return True
+            with self.report.check("slide-layout-ids", passed="No slide masters found"):
+                return True
+
+        with self.report.check(
+            "slide-layout-ids",
+            passed="All slide layout IDs reference valid slide layouts",
+            failed="Found {count} slide layout ID validation errors:",
+            notes=[
+                "Remove invalid references or add missing slide layouts to the relationships file."
+            ],
+        ) as check:
+            self._check_slide_layout_ids(check, slide_masters)
+            return check.passed
+
+    def _check_slide_layout_ids(self, check, slide_masters):
+        import lxml.etree
 
         for slide_master in slide_masters:
             try:
-                # Parse the slide master file
-                root = lxml.etree.parse(str(slide_master)).getroot()
-
                 # Find the corresponding _rels file for this slide master
-                rels_file = slide_master.parent / "_rels" / f"{slide_master.name}.rels"
+                rels_part = rels_part_for(slide_master)
 
-                if not rels_file.exists():
-                    errors.append(
-                        f"  {slide_master.relative_to(self.unpacked_dir)}: "
-                        f"Missing relationships file: {rels_file.relative_to(self.unpacked_dir)}"
-                    )
+                if not self.graph.has_part(rels_part):
+                    check.error(f"Missing relationships file: {rels_part}", slide_master)
                     continue
 
-                # Parse the relationships file
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
+                if rels_part in self.graph.rels_errors:
+                    check.error(
+                        f"Error: {self.graph.rels_errors[rels_part]}", slide_master
+                    )
+                    continue
 
                 # Build a set of valid relationship IDs that point to slide layouts
-                valid_layout_rids = set()
-                for rel in rels_root.findall(
-                    f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
-                ):
-                    rel_type = rel.get("Type", "")
-                    if "slideLayout" in rel_type:
-                        valid_layout_rids.add(rel.get("Id"))
+                valid_layout_rids = {
+                    rel.id
+                    for rel in self.graph.relationships_from(slide_master)
+                    if "slideLayout" in rel.type
+                }
+
+                # Parse the slide master file
+                root = self._parse(slide_master).getroot()
 
                 # Find all sldLayoutId elements in the slide master
                 for sld_layout_id in root.findall(
@@ -176,139 +187,117 @@ class PPTXSchemaValidator(BaseSchemaValidator):
                     layout_id = sld_layout_id.get("id")
 
                     if r_id and r_id not in valid_layout_rids:
-                        errors.append(
-                            f"  {slide_master.relative_to(self.unpacked_dir)}: "
-                            f"Line {sld_layout_id.sourceline}: sldLayoutId with id='{layout_id}' "
-                            f"references r:id='{r_id}' which is not found in slide layout relationships"
+                        check.error(
+                            f"sldLayoutId with id='{layout_id}' "
+                            f"references r:id='{r_id}' which is not found in slide layout relationships",
+                            slide_master,
+                            sld_layout_id.sourceline,
                         )
 
             except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {slide_master.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
-
-        if errors:
-            print(f"FAILED - Found {len(errors)} slide layout ID validation errors:")
-            for error in errors:
-                print(error)
-            print(
-                "Remove invalid references or add missing slide layouts to the relationships file."
-            )
-            return False
-        else:
-            if self.verbose:
-                print("PASSED - All slide layout IDs reference valid slide layouts")
-            return True
+                check.error(f"Error: {e}", slide_master)
+
+    def _slide_rels_parts(self):
+        """Return the .rels part names of all slides."""
+        return sorted(
+            part
+            for part in self.graph.rels_parts
+            if part.startswith("ppt/slides/_rels/")
+            and part.endswith(".xml.rels")
+            and part.count("/") == 3
+        )
 
     def validate_no_duplicate_slide_layouts(self):
         """Validate that each slide has exactly one slideLayout reference."""
-        import lxml.etree
-
-        errors = []
-        slide_rels_files = list(self.unpacked_dir.glob("ppt/slides/_rels/*.xml.rels"))
-
-        for rels_file in slide_rels_files:
-            try:
-                root = lxml.etree.parse(str(rels_file)).getroot()
+        with self.report.check(
+            "duplicate-slide-layouts",
+            passed="All slides have exactly one slideLayout reference",
+            failed="Found slides with duplicate slideLayout references:",
+        ) as check:
+            for rels_part in self._slide_rels_parts():
+                if rels_part in self.graph.rels_errors:
+                    check.error(f"Error: {self.graph.rels_errors[rels_part]}", rels_part)
+                    continue
 
                 # Find all slideLayout relationships
+                source, _ = source_part_for_rels(rels_part)
                 layout_rels = [
                     rel
-                    for rel in root.findall(
-                        f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
-                    )
-                    if "slideLayout" in rel.get("Type", "")
+                    for rel in self.graph.relationships_from(source)
+                    if "slideLayout" in rel.type
                 ]
 
                 if len(layout_rels) > 1:
-                    errors.append(
-                        f"  {rels_file.relative_to(self.unpacked_dir)}: has {len(layout_rels)} slideLayout references"
+                    check.error(
+                        f"has {len(layout_rels)} slideLayout references", rels_part
                     )
 
-            except Exception as e:
-                errors.append(
-                    f"  {rels_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
-
-        if errors:
-            print("FAILED - Found slides with duplicate slideLayout references:")
-            for error in errors:
-                print(error)
-            return False
-        else:
-            if self.verbose:
-                print("PASSED - All slides have exactly one slideLayout reference")
-            return True
+            return check.passed
 
     def validate_notes_slide_references(self):
         """Validate that each notesSlide file is referenced by only one slide."""
-        import lxml.etree
-
-        errors = []
         notes_slide_references = {}  # Track which slides reference each notesSlide
 
         # Find all slide relationship files
-        slide_rels_files = list(self.unpacked_dir.glob("ppt/slides/_rels/*.xml.rels"))
-
-        if not slide_rels_files:
-            if self.verbose:
-                print("PASSED - No slide relationship files found")
-            return True
-
-        for rels_file in slide_rels_files:
-            try:
-                # Parse the relationships file
-                root = lxml.etree.parse(str(rels_file)).getroot()
-
-                # Find all notesSlide relationships
-                for rel in root.findall(
-                    f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
-                ):
-                    rel_type = rel.get("Type", "")
-                    if "notesSlide" in rel_type:
-                        target = rel.get("Target", "")
-                        if target:
-                            # Normalize the target path to handle relative paths
-                            normalized_target = target.replace("../", "")
-
-                            # Track which slide references this notesSlide
-                            slide_name = rels_file.stem.replace(
-                                ".xml", ""
-                            )  # e.g., "slide1"
-
-                            if normalized_target not in notes_slide_references:
-                                notes_slide_references[normalized_target] = []
-                            notes_slide_references[normalized_target].append(
-                                (slide_name, rels_file)
-                            )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {rels_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+        slide_rels_parts = self._slide_rels_parts()
+
+        if not slide_rels_parts:
+            with self.report.check(
+                "notes-slide-references", passed="No slide relationship files found"
+            ):
+                return True
+
+        with self.report.check(
+            "notes-slide-references",
+            passed="All notes slide references are unique",
+            failed="Found {count} notes slide reference validation errors:",
+            notes=["Each slide may optionally have its own slide file."],
+        ) as check:
+            self._check_notes_slide_references(
+                check, slide_rels_parts, notes_slide_references
+            )
+            return check.passed
+
+    def _check_notes_slide_references(
+        self, check, slide_rels_parts, notes_slide_references
+    ):
+        for rels_part in slide_rels_parts:
+            if rels_part in self.graph.rels_errors:
+                check.error(f"Error: {self.graph.rels_errors[rels_part]}", rels_part)
+                continue
+
+            # Find all notesSlide relationships
+            source, _ = source_part_for_rels(rels_part)
+            for rel in self.graph.relationships_from(source):
+                if "notesSlide" in rel.type and rel.target:
+                    # Use the resolved part name so relative paths compare equal
+                    target = rel.part or rel.target
+
+                    # Track which slide references this notesSlide
+                    slide_name = source.rsplit("/", 1)[-1].replace(
+                        ".xml", ""
+                    )  # e.g., "slide1"
+                    notes_slide_references.setdefault(target, []).append(
+                        (slide_name, rels_part)
+                    )
 
         # Check for duplicate references
         for target, references in notes_slide_references.items():
             if len(references) > 1:
                 slide_names = [ref[0] for ref in references]
-                errors.append(
-                    f"  Notes slide '{target}' is referenced by multiple slides: {', '.join(slide_names)}"
+                rels_parts = [ref[1] for ref in references]
+                check.error(
+                    f"Notes slide is referenced by multiple slides: {', '.join(slide_names)} "
+                    f"({', '.join(rels_parts)})",
+                    target,
+                    text="\n".join(
+                        [
+                            f"  Notes slide '{target}' is referenced by multiple "
+                            f"slides: {', '.join(slide_names)}"
+                        ]
+                        + [f"    - {rels_part}" for rels_part in rels_parts]
+                    ),
                 )
-                for slide_name, rels_file in references:
-                    errors.append(f"    - {rels_file.relative_to(self.unpacked_dir)}")
-
-        if errors:
-            print(
-                f"FAILED - Found {len([e for e in errors if not e.startswith('    ')])} notes slide reference validation errors:"
-            )
-            for error in errors:
-                print(error)
-            print("Each slide may optionally have its own slide file.")
-            return False
-        else:
-            if self.verbose:
-                print("PASSED - All notes slide references are unique")
-            return True
 
 
 if __name__ == "__main__":
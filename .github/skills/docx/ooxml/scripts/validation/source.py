@@ -0,0 +1,97 @@
+"""
+Package sources that let validators read parts from an unpacked directory or
+directly from a packed Office file.
+"""
+
+import os
+import zipfile
+from pathlib import Path
+
+import lxml.etree
+
+
+class DirectorySource:
+    """Parts of an unpacked Office document directory."""
+
+    def __init__(self, path):
+        self.path = Path(path).resolve()
+        self._names = None
+        self._name_set = None
+
+    def __str__(self):
+        return str(self.path)
+
+    def names(self):
+        """Return all part names (posix paths relative to the package root)."""
+        if self._names is None:
+            names = []
+            for dir_path, dir_names, file_names in os.walk(self.path):
+                dir_names.sort()
+                rel_dir = os.path.relpath(dir_path, self.path).replace(os.sep, "/")
+                for file_name in sorted(file_names):
+                    names.append(
+                        file_name if rel_dir == "." else f"{rel_dir}/{file_name}"
+                    )
+            self._names = names
+            self._name_set = set(names)
+        return self._names
+
+    def exists(self, name):
+        self.names()
+        return name in self._name_set
+
+    def open(self, name):
+        """Open a part for binary reading."""
+        return open(self.path.joinpath(*name.split("/")), "rb")
+
+    def close(self):
+        pass
+
+
+class ZipSource:
+    """Parts of a packed Office file, read with ZipFile.open and never extracted."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._zip = zipfile.ZipFile(self.path, "r")
+        self._names = [
+            info.filename for info in self._zip.infolist() if not info.is_dir()
+        ]
+        self._name_set = set(self._names)
+
+    def __str__(self):
+        return str(self.path)
+
+    def names(self):
+        """Return all part names (posix paths relative to the package root)."""
+        return self._names
+
+    def exists(self, name):
+        return name in self._name_set
+
+    def open(self, name):
+        """Open a part for binary reading as a stream from the archive."""
+        return self._zip.open(name)
+
+    def close(self):
+        self._zip.close()
+
+
+def open_source(path):
+    """Return a DirectorySource or ZipSource for an unpacked directory or packed file."""
+    path = Path(path)
+    if path.is_dir():
+        return DirectorySource(path)
+    if zipfile.is_zipfile(path):
+        return ZipSource(path)
+    raise ValueError(f"{path} is neither a directory nor an Office file")
+
+
+def parse_part(source, name):
+    """Parse a part from a source into an lxml ElementTree."""
+    with source.open(name) as f:
+        return lxml.etree.parse(f)
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
@@ -4,24 +4,39 @@ Command line tool to validate Office document XML files against XSD schemas and
 
 Usage:
     python validate.py <dir> --original <original_file>
+    python validate.py <office_file> --original <original_file>
+    python validate.py <dir> --original <original_file> --graph graph.json
+    python validate.py <dir> --original <original_file> --format junit > report.xml
+    python validate.py --batch manifest.jsonl [--jobs N]
+    python validate.py --pair <dir> <original_file> --pair <dir> <original_file>
+
+Batch mode keeps schemas compiled in warm worker processes and streams one
+JSON result per document to stdout as it finishes, followed by a throughput
+summary (documents per second) on stderr.
+
+--format json|junit writes the structured results instead of the text report;
+--max-errors and --fail-fast stop validation early once the budget is reached.
 """
 
 import argparse
+import json
 import sys
 from pathlib import Path
 
-from validation import DOCXSchemaValidator, PPTXSchemaValidator, RedliningValidator
+from validation import PackageGraph, render_json, render_junit
+from validation.batch import VALIDATORS, load_manifest, run_batch
+from validation.source import open_source
 
 
 def main():
     parser = argparse.ArgumentParser(description="Validate Office document XML files")
     parser.add_argument(
         "unpacked_dir",
-        help="Path to unpacked Office document directory",
+        nargs="?",
+        help="Path to unpacked Office document directory, or a packed .docx/.pptx/.xlsx to validate in place",
     )
     parser.add_argument(
         "--original",
-        required=True,
         help="Path to original file (.docx/.pptx/.xlsx)",
     )
     parser.add_argument(
@@ -30,34 +45,117 @@ def main():
         action="store_true",
         help="Enable verbose output",
     )
+    parser.add_argument(
+        "--format",
+        choices=["text", "json", "junit"],
+        default="text",
+        help="Output format for validation results (default: text)",
+    )
+    parser.add_argument(
+        "--max-errors",
+        type=int,
+        default=None,
+        help="Stop each validator after this many errors",
+    )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop each validator after its first failing check",
+    )
+    parser.add_argument(
+        "--graph",
+        metavar="PATH",
+        help="Write the package relationship graph as JSON to PATH ('-' for stdout)",
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="MANIFEST",
+        help="Validate every (unpacked_dir, original) pair listed in a JSON or JSON Lines manifest",
+    )
+    parser.add_argument(
+        "--pair",
+        nargs=2,
+        action="append",
+        metavar=("UNPACKED_DIR", "ORIGINAL"),
+        help="Add a document to batch mode (repeatable)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes for batch mode (default: CPU count)",
+    )
     args = parser.parse_args()
 
+    # Batch mode
+    if args.batch or args.pair:
+        pairs = list(args.pair or [])
+        if args.batch:
+            pairs.extend(load_manifest(args.batch))
+        success = run_batch(
+            pairs,
+            jobs=args.jobs,
+            verbose=args.verbose,
+            out=sys.stdout,
+            summary=sys.stderr,
+            max_errors=args.max_errors,
+            fail_fast=args.fail_fast,
+        )
+        sys.exit(0 if success else 1)
+
+    if not args.unpacked_dir or not args.original:
+        parser.error("unpacked_dir and --original are required (or use --batch/--pair)")
+
     # Validate paths
     unpacked_dir = Path(args.unpacked_dir)
     original_file = Path(args.original)
     file_extension = original_file.suffix.lower()
-    assert unpacked_dir.is_dir(), f"Error: {unpacked_dir} is not a directory"
+    assert unpacked_dir.is_dir() or unpacked_dir.is_file(), (
+        f"Error: {unpacked_dir} is not a directory or Office file"
+    )
     assert original_file.is_file(), f"Error: {original_file} is not a file"
     assert file_extension in [".docx", ".pptx", ".xlsx"], (
         f"Error: {original_file} must be a .docx, .pptx, or .xlsx file"
     )
 
+    # Dump the package graph for debugging
+    if args.graph:
+        source = open_source(unpacked_dir)
+        try:
+            graph_json = json.dumps(PackageGraph.from_source(source).to_dict(), indent=2)
+        finally:
+            source.close()
+        if args.graph == "-":
+            print(graph_json)
+        else:
+            Path(args.graph).write_text(graph_json, encoding="utf-8")
+
     # Run validations
-    match file_extension:
-        case ".docx":
-            validators = [DOCXSchemaValidator, RedliningValidator]
-        case ".pptx":
-            validators = [PPTXSchemaValidator]
-        case _:
-            print(f"Error: Validation not supported for file type {file_extension}")
-            sys.exit(1)
+    validators = VALIDATORS.get(file_extension)
+    if validators is None:
+        print(f"Error: Validation not supported for file type {file_extension}")
+        sys.exit(1)
 
     # Run validators
+    options = {
+        "verbose": args.verbose,
+        "max_errors": args.max_errors,
+        "fail_fast": args.fail_fast,
+    }
+    if args.format != "text":
+        reports = []
+        for V in validators:
+            with V(unpacked_dir, original_file, **options) as validator:
+                reports.append(validator.run())
+        render = render_json if args.format == "json" else render_junit
+        print(render(reports))
+        sys.exit(0 if all(report.passed for report in reports) else 1)
+
     success = True
     for V in validators:
-        validator = V(unpacked_dir, original_file, verbose=args.verbose)
-        if not validator.validate():
-            success = False
+        with V(unpacked_dir, original_file, **options) as validator:
+            if not validator.validate():
+                success = False
 
     if success:
         print("All validations PASSED!")
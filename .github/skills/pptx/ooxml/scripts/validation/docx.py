@@ -3,12 +3,11 @@ Validator for Word document XML files against XSD schemas.
 """
 
 import re
-import tempfile
-import zipfile
 
 import lxml.etree
 
 from .base import BaseSchemaValidator
+from .source import parse_part
 
 
 class DOCXSchemaValidator(BaseSchemaValidator):
@@ -21,7 +20,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
     # Start with empty mapping - add specific cases as we discover them
     ELEMENT_RELATIONSHIP_TYPES = {}
 
-    def validate(self):
+    def run_checks(self):
         """Run all validation checks and return True if all pass."""
         # Test 0: XML well-formedness
         if not self.validate_xml():
@@ -73,15 +72,22 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         """
         Validate that w:t elements with whitespace have xml:space='preserve'.
         """
-        errors = []
-
+        with self.report.check(
+            "whitespace-preservation",
+            passed="All whitespace is properly preserved",
+            failed="Found {count} whitespace preservation violations:",
+        ) as check:
+            self._check_whitespace_preservation(check)
+            return check.passed
+
+    def _check_whitespace_preservation(self, check):
         for xml_file in self.xml_files:
             # Only check document.xml files
             if xml_file.name != "document.xml":
                 continue
 
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._parse(xml_file).getroot()
 
                 # Find all w:t elements
                 for elem in root.iter(f"{{{self.WORD_2006_NAMESPACE}}}t"):
@@ -101,40 +107,36 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                                     if len(repr(text)) > 50
                                     else repr(text)
                                 )
-                                errors.append(
-                                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                    f"Line {elem.sourceline}: w:t element with whitespace missing xml:space='preserve': {text_preview}"
+                                check.error(
+                                    f"w:t element with whitespace missing xml:space='preserve': {text_preview}",
+                                    xml_file,
+                                    elem.sourceline,
                                 )
 
             except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
-
-        if errors:
-            print(f"FAILED - Found {len(errors)} whitespace preservation violations:")
-            for error in errors:
-                print(error)
-            return False
-        else:
-            if self.verbose:
-                print("PASSED - All whitespace is properly preserved")
-            return True
+                check.error(f"Error: {e}", xml_file)
 
     def validate_deletions(self):
         """
         Validate that w:t elements are not within w:del elements.
         For some reason, XSD validation does not catch this, so we do it manually.
         """
-        errors = []
-
+        with self.report.check(
+            "deletions",
+            passed="No w:t elements found within w:del elements",
+            failed="Found {count} deletion validation violations:",
+        ) as check:
+            self._check_deletions(check)
+            return check.passed
+
+    def _check_deletions(self, check):
         for xml_file in self.xml_files:
             # Only check document.xml files
             if xml_file.name != "document.xml":
                 continue
 
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._parse(xml_file).getroot()
 
                 # Find all w:t elements that are descendants of w:del elements
                 namespaces = {"w": self.WORD_2006_NAMESPACE}
@@ -150,27 +152,16 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                             if len(repr(t_elem.text)) > 50
                             else repr(t_elem.text)
                         )
-                        errors.append(
-                            f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                            f"Line {t_elem.sourceline}: <w:t> found within <w:del>: {text_preview}"
+                        check.error(
+                            f"<w:t> found within <w:del>: {text_preview}",
+                            xml_file,
+                            t_elem.sourceline,
                         )
 
             except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
-
-        if errors:
-            print(f"FAILED - Found {len(errors)} deletion validation violations:")
-            for error in errors:
-                print(error)
-            return False
-        else:
-            if self.verbose:
-                print("PASSED - No w:t elements found within w:del elements")
-            return True
+                check.error(f"Error: {e}", xml_file)
 
-    def count_paragraphs_in_unpacked(self):
+    def count_paragraphs_in_unpacked(self, check=None):
         """Count the number of paragraphs in the unpacked document."""
         count = 0
 
@@ -180,36 +171,33 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 continue
 
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._parse(xml_file).getroot()
                 # Count all w:p elements
                 paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
                 count = len(paragraphs)
             except Exception as e:
-                print(f"Error counting paragraphs in unpacked document: {e}")
+                if check is not None:
+                    message = f"Error counting paragraphs in unpacked document: {e}"
+                    check.warning(message, xml_file, text=message)
 
         return count
 
-    def count_paragraphs_in_original(self):
+    def count_paragraphs_in_original(self, check=None):
         """Count the number of paragraphs in the original docx file."""
         count = 0
 
         try:
-            # Create temporary directory to unpack original
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # Unpack original docx
-                with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                    zip_ref.extractall(temp_dir)
+            # Parse document.xml straight from the original archive
+            root = parse_part(self.original_source, "word/document.xml").getroot()
 
-                # Parse document.xml
-                doc_xml_path = temp_dir + "/word/document.xml"
-                root = lxml.etree.parse(doc_xml_path).getroot()
-
-                # Count all w:p elements
-                paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
-                count = len(paragraphs)
+            # Count all w:p elements
+            paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
+            count = len(paragraphs)
 
         except Exception as e:
-            print(f"Error counting paragraphs in original document: {e}")
+            if check is not None:
+                message = f"Error counting paragraphs in original document: {e}"
+                check.warning(message, text=message)
 
         return count
 
@@ -218,14 +206,21 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         Validate that w:delText elements are not within w:ins elements.
         w:delText is only allowed in w:ins if nested within a w:del.
         """
-        errors = []
-
+        with self.report.check(
+            "insertions",
+            passed="No w:delText elements within w:ins elements",
+            failed="Found {count} insertion validation violations:",
+        ) as check:
+            self._check_insertions(check)
+            return check.passed
+
+    def _check_insertions(self, check):
         for xml_file in self.xml_files:
             if xml_file.name != "document.xml":
                 continue
 
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._parse(xml_file).getroot()
                 namespaces = {"w": self.WORD_2006_NAMESPACE}
 
                 # Find w:delText in w:ins that are NOT within w:del
@@ -240,34 +235,25 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                         if len(repr(elem.text or "")) > 50
                         else repr(elem.text or "")
                     )
-                    errors.append(
-                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                        f"Line {elem.sourceline}: <w:delText> within <w:ins>: {text_preview}"
+                    check.error(
+                        f"<w:delText> within <w:ins>: {text_preview}",
+                        xml_file,
+                        elem.sourceline,
                     )
 
             except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
-
-        if errors:
-            print(f"FAILED - Found {len(errors)} insertion validation violations:")
-            for error in errors:
-                print(error)
-            return False
-        else:
-            if self.verbose:
-                print("PASSED - No w:delText elements within w:ins elements")
-            return True
+                check.error(f"Error: {e}", xml_file)
 
     def compare_paragraph_counts(self):
         """Compare paragraph counts between original and new document."""
-        original_count = self.count_paragraphs_in_original()
-        new_count = self.count_paragraphs_in_unpacked()
-
-        diff = new_count - original_count
-        diff_str = f"+{diff}" if diff > 0 else str(diff)
-        print(f"\nParagraphs: {original_count} → {new_count} ({diff_str})")
+        with self.report.check("paragraph-count") as check:
+            original_count = self.count_paragraphs_in_original(check)
+            new_count = self.count_paragraphs_in_unpacked(check)
+
+            diff = new_count - original_count
+            diff_str = f"+{diff}" if diff > 0 else str(diff)
+            message = f"Paragraphs: {original_count} → {new_count} ({diff_str})"
+            check.info(message, "word/document.xml", text=f"\n{message}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,280 @@
+"""
+Package relationship graph shared by the relationship and content type checks.
+"""
+
+import posixpath
+from collections import namedtuple
+from types import MappingProxyType
+
+import lxml.etree
+
+from .source import DirectorySource
+
+PACKAGE_RELATIONSHIPS_NAMESPACE = (
+    "http://schemas.openxmlformats.org/package/2006/relationships"
+)
+CONTENT_TYPES_NAMESPACE = "http://schemas.openxmlformats.org/package/2006/content-types"
+CONTENT_TYPES_PART = "[Content_Types].xml"
+
+# A single <Relationship> entry.
+#   source:    part that owns the relationship ("" for the package root)
+#   rels_part: .rels part the entry was read from
+#   id/type/target: raw attribute values
+#   part:      resolved target part name, or None for external targets
+#   external:  True if the target lives outside the package
+#   line:      source line of the entry in rels_part
+Relationship = namedtuple(
+    "Relationship",
+    ["source", "rels_part", "id", "type", "target", "part", "external", "line"],
+)
+
+
+def source_part_for_rels(rels_part):
+    """Return (source_part, base_dir) for a .rels part name.
+
+    e.g. word/_rels/document.xml.rels -> ("word/document.xml", "word")
+         _rels/.rels                  -> ("", "")
+    """
+    rels_dir, name = posixpath.split(rels_part)
+    base_dir = posixpath.dirname(rels_dir)
+    if name == ".rels":
+        # Package-level relationships - targets are relative to the package root
+        return "", ""
+    return posixpath.join(base_dir, name[: -len(".rels")]), base_dir
+
+
+def rels_part_for(part):
+    """Return the .rels part name that holds relationships for a part."""
+    part_dir, name = posixpath.split(part)
+    return posixpath.join(part_dir, "_rels", f"{name}.rels")
+
+
+def resolve_target(base_dir, target):
+    """Resolve a relationship target to a part name, or None if it leaves the package."""
+    if target.startswith("/"):
+        resolved = posixpath.normpath(target.lstrip("/"))
+    else:
+        resolved = posixpath.normpath(posixpath.join(base_dir, target))
+    if resolved == "." or resolved.startswith("../"):
+        return None
+    return resolved
+
+
+class PackageGraph:
+    """Immutable index of the parts, content types and relationships in a package.
+
+    Built once per validation run from a single walk of the package plus one
+    parse of every .rels part and of [Content_Types].xml. Relationship and
+    content type checks query this index instead of rediscovering the package.
+    """
+
+    def __init__(
+        self,
+        parts,
+        relationships,
+        rels_errors=None,
+        default_types=None,
+        override_types=None,
+        content_types_error=None,
+    ):
+        self._parts = frozenset(parts)
+        self._relationships = tuple(relationships)
+        self._rels_errors = MappingProxyType(dict(rels_errors or {}))
+        self._default_types = (
+            None if default_types is None else MappingProxyType(dict(default_types))
+        )
+        self._override_types = (
+            None if override_types is None else MappingProxyType(dict(override_types))
+        )
+        self._content_types_error = content_types_error
+
+        by_source = {}
+        by_target = {}
+        for rel in self._relationships:
+            by_source.setdefault(rel.source, []).append(rel)
+            if rel.part is not None:
+                by_target.setdefault(rel.part, []).append(rel)
+        self._by_source = MappingProxyType(
+            {source: tuple(rels) for source, rels in by_source.items()}
+        )
+        self._by_target = MappingProxyType(
+            {target: tuple(rels) for target, rels in by_target.items()}
+        )
+
+    @classmethod
+    def from_directory(cls, root):
+        """Build the graph for an unpacked package directory in one walk."""
+        return cls.from_source(DirectorySource(root))
+
+    @classmethod
+    def from_source(cls, source):
+        """Build the graph for a DirectorySource or ZipSource."""
+        return cls.from_parts(source.names(), source.open)
+
+    @classmethod
+    def from_parts(cls, parts, open_part):
+        """Build the graph from a list of part names and a binary opener."""
+        parts = list(parts)
+        part_set = set(parts)
+        relationships = []
+        rels_errors = {}
+
+        for rels_part in parts:
+            if not rels_part.endswith(".rels"):
+                continue
+            source, base_dir = source_part_for_rels(rels_part)
+            try:
+                with open_part(rels_part) as f:
+                    rels_root = lxml.etree.parse(f).getroot()
+            except Exception as e:
+                rels_errors[rels_part] = str(e)
+                continue
+
+            for rel in rels_root.iter(
+                f"{{{PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
+            ):
+                target = rel.get("Target") or ""
+                external = rel.get("TargetMode") == "External" or target.startswith(
+                    ("http", "mailto:")
+                )
+                relationships.append(
+                    Relationship(
+                        source=source,
+                        rels_part=rels_part,
+                        id=rel.get("Id"),
+                        type=rel.get("Type", ""),
+                        target=target,
+                        part=None
+                        if external or not target
+                        else resolve_target(base_dir, target),
+                        external=external,
+                        line=rel.sourceline,
+                    )
+                )
+
+        default_types = override_types = None
+        content_types_error = None
+        if CONTENT_TYPES_PART in part_set:
+            try:
+                with open_part(CONTENT_TYPES_PART) as f:
+                    types_root = lxml.etree.parse(f).getroot()
+                default_types = {}
+                override_types = {}
+                for default in types_root.iter(f"{{{CONTENT_TYPES_NAMESPACE}}}Default"):
+                    extension = default.get("Extension")
+                    if extension is not None:
+                        default_types[extension.lower()] = default.get("ContentType")
+                for override in types_root.iter(
+                    f"{{{CONTENT_TYPES_NAMESPACE}}}Override"
+                ):
+                    part_name = override.get("PartName")
+                    if part_name is not None:
+                        override_types[part_name.lstrip("/")] = override.get(
+                            "ContentType"
+                        )
+            except Exception as e:
+                default_types = override_types = None
+                content_types_error = str(e)
+
+        return cls(
+            parts,
+            relationships,
+            rels_errors,
+            default_types,
+            override_types,
+            content_types_error,
+        )
+
+    @property
+    def parts(self):
+        """All part names in the package (posix paths relative to the root)."""
+        return self._parts
+
+    @property
+    def relationships(self):
+        """Every relationship in the package, in .rels document order."""
+        return self._relationships
+
+    @property
+    def rels_parts(self):
+        """Names of all .rels parts."""
+        return sorted(p for p in self._parts if p.endswith(".rels"))
+
+    @property
+    def rels_errors(self):
+        """Mapping of .rels part name -> parse error message."""
+        return self._rels_errors
+
+    @property
+    def default_types(self):
+        """Extension -> content type from <Default>, or None if unavailable."""
+        return self._default_types
+
+    @property
+    def override_types(self):
+        """Part name -> content type from <Override>, or None if unavailable."""
+        return self._override_types
+
+    @property
+    def content_types_error(self):
+        """Parse error for [Content_Types].xml, if any."""
+        return self._content_types_error
+
+    def has_part(self, part):
+        return part in self._parts
+
+    def relationships_from(self, source):
+        """Relationships owned by a part ("" for package-level relationships)."""
+        return self._by_source.get(source, ())
+
+    def referrers(self, part):
+        """Relationships that target a part (reverse edges)."""
+        return self._by_target.get(part, ())
+
+    def broken_relationships(self):
+        """Internal relationships whose target part does not exist."""
+        return [
+            rel
+            for rel in self._relationships
+            if not rel.external and rel.target and rel.part not in self._parts
+        ]
+
+    def unreferenced_parts(self):
+        """Parts that no relationship points to (excluding package metadata)."""
+        return sorted(
+            part
+            for part in self._parts
+            if part not in self._by_target
+            and part != CONTENT_TYPES_PART
+            and not part.endswith(".rels")
+        )
+
+    def content_type(self, part):
+        """Declared content type for a part, or None if undeclared."""
+        if self._override_types and part in self._override_types:
+            return self._override_types[part]
+        if self._default_types:
+            extension = posixpath.splitext(part)[1].lstrip(".").lower()
+            return self._default_types.get(extension)
+        return None
+
+    def to_dict(self):
+        """Return a JSON-serializable view of the graph for debugging."""
+        return {
+            "parts": sorted(self._parts),
+            "content_types": {
+                "defaults": dict(self._default_types or {}),
+                "overrides": dict(self._override_types or {}),
+                "error": self._content_types_error,
+            },
+            "relationships": [rel._asdict() for rel in self._relationships],
+            "referrers": {
+                part: sorted({rel.source for rel in rels})
+                for part, rels in sorted(self._by_target.items())
+            },
+            "rels_errors": dict(self._rels_errors),
+        }
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
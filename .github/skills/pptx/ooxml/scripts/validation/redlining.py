@@ -4,34 +4,80 @@ Validator for tracked changes in Word documents.
 
 import subprocess
 import tempfile
-import zipfile
 from pathlib import Path
 
+from .results import StopValidation, ValidationReport, render_text
+from .source import ZipSource, open_source
+
 
 class RedliningValidator:
     """Validator for tracked changes in Word documents."""
 
-    def __init__(self, unpacked_dir, original_docx, verbose=False):
-        self.unpacked_dir = Path(unpacked_dir)
+    def __init__(
+        self, unpacked_dir, original_docx, verbose=False, max_errors=None, fail_fast=False
+    ):
+        # unpacked_dir may also be a packed .docx; parts are then read from the archive
+        self.source = open_source(unpacked_dir)
+        self.unpacked_dir = self.source.path
         self.original_docx = Path(original_docx)
         self.verbose = verbose
+        self.max_errors = max_errors
+        self.fail_fast = fail_fast
+        self.report = None
         self.namespaces = {
             "w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
         }
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def close(self):
+        """Close the archive opened for the document being validated."""
+        self.source.close()
+
+    def run(self):
+        """Run the redlining check and return the ValidationReport without printing it."""
+        self.report = ValidationReport(
+            type(self).__name__,
+            self.unpacked_dir,
+            max_errors=self.max_errors,
+            fail_fast=self.fail_fast,
+        )
+        try:
+            with self.report.check("redlining") as check:
+                self.run_checks(check)
+        except StopValidation:
+            pass
+        return self.report
+
     def validate(self):
         """Main validation method that returns True if valid, False otherwise."""
+        text = render_text(self.run(), verbose=self.verbose)
+        if text:
+            print(text)
+        return self.report.passed
+
+    def run_checks(self, check):
+        """Compare document text with Claude's tracked changes removed, recording findings in check."""
         # Verify unpacked directory exists and has correct structure
-        modified_file = self.unpacked_dir / "word" / "document.xml"
-        if not modified_file.exists():
-            print(f"FAILED - Modified document.xml not found at {modified_file}")
+        document_part = "word/document.xml"
+        if not self.source.exists(document_part):
+            check.error(
+                f"Modified document.xml not found at {self.unpacked_dir / document_part}",
+                document_part,
+            )
             return False
 
         # First, check if there are any tracked changes by Claude to validate
         try:
             import xml.etree.ElementTree as ET
 
-            tree = ET.parse(modified_file)
+            with self.source.open(document_part) as f:
+                tree = ET.parse(f)
             root = tree.getroot()
 
             # Check for w:del or w:ins tags authored by Claude
@@ -52,69 +98,60 @@ class RedliningValidator:
 
             # Redlining validation is only needed if tracked changes by Claude have been used.
             if not claude_del_elements and not claude_ins_elements:
-                if self.verbose:
-                    print("PASSED - No tracked changes by Claude found.")
+                check.passed_text = "No tracked changes by Claude found."
                 return True
 
         except Exception:
             # If we can't parse the XML, continue with full validation
             pass
 
-        # Create temporary directory for unpacking original docx
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Unpack original docx
-            try:
-                with zipfile.ZipFile(self.original_docx, "r") as zip_ref:
-                    zip_ref.extractall(temp_path)
-            except Exception as e:
-                print(f"FAILED - Error unpacking original docx: {e}")
-                return False
+        # Open original docx without unpacking it
+        try:
+            original_source = ZipSource(self.original_docx)
+        except Exception as e:
+            check.error(f"Error unpacking original docx: {e}")
+            return False
 
-            original_file = temp_path / "word" / "document.xml"
-            if not original_file.exists():
-                print(
-                    f"FAILED - Original document.xml not found in {self.original_docx}"
-                )
+        try:
+            if not original_source.exists(document_part):
+                check.error(f"Original document.xml not found in {self.original_docx}")
                 return False
 
             # Parse both XML files using xml.etree.ElementTree for redlining validation
             try:
                 import xml.etree.ElementTree as ET
 
-                modified_tree = ET.parse(modified_file)
-                modified_root = modified_tree.getroot()
-                original_tree = ET.parse(original_file)
-                original_root = original_tree.getroot()
+                with self.source.open(document_part) as f:
+                    modified_root = ET.parse(f).getroot()
+                with original_source.open(document_part) as f:
+                    original_root = ET.parse(f).getroot()
             except ET.ParseError as e:
-                print(f"FAILED - Error parsing XML files: {e}")
+                check.error(f"Error parsing XML files: {e}", document_part)
                 return False
+        finally:
+            original_source.close()
 
-            # Remove Claude's tracked changes from both documents
-            self._remove_claude_tracked_changes(original_root)
-            self._remove_claude_tracked_changes(modified_root)
+        # Remove Claude's tracked changes from both documents
+        self._remove_claude_tracked_changes(original_root)
+        self._remove_claude_tracked_changes(modified_root)
 
-            # Extract and compare text content
-            modified_text = self._extract_text_content(modified_root)
-            original_text = self._extract_text_content(original_root)
+        # Extract and compare text content
+        modified_text = self._extract_text_content(modified_root)
+        original_text = self._extract_text_content(original_root)
 
-            if modified_text != original_text:
-                # Show detailed character-level differences for each paragraph
-                error_message = self._generate_detailed_diff(
-                    original_text, modified_text
-                )
-                print(error_message)
-                return False
+        if modified_text != original_text:
+            # Show detailed character-level differences for each paragraph
+            error_message = self._generate_detailed_diff(original_text, modified_text)
+            check.error(error_message, document_part)
+            return False
 
-            if self.verbose:
-                print("PASSED - All changes by Claude are properly tracked")
-            return True
+        check.passed_text = "All changes by Claude are properly tracked"
+        return True
 
     def _generate_detailed_diff(self, original_text, modified_text):
         """Generate detailed word-level differences using git word diff."""
         error_parts = [
-            "FAILED - Document text doesn't match after removing Claude's tracked changes",
+            "Document text doesn't match after removing Claude's tracked changes",
             "",
             "Likely causes:",
             "  1. Modified text inside another author's <w:ins> or <w:del> tags",
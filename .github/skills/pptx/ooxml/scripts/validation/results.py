@@ -0,0 +1,300 @@
+"""
+Structured validation results and the renderers that turn them into text,
+JSON or JUnit XML.
+"""
+
+import json
+import time
+from collections import namedtuple
+
+import lxml.etree
+
+# A single finding reported by a check.
+#   rule:     id of the check that produced it (e.g. "xsd", "unique-ids")
+#   part:     part name the finding is about, or None
+#   line:     source line in part, or None
+#   severity: "error", "warning" or "info"
+#   message:  human readable description (without the part/line prefix)
+Issue = namedtuple("Issue", ["rule", "part", "line", "severity", "message"])
+
+
+class StopValidation(BaseException):
+    """Raised to abandon the remaining checks once a report's budget is spent.
+
+    Derives from BaseException so the broad `except Exception` handlers that
+    checks use around individual parts do not swallow it.
+    """
+
+
+class Check:
+    """Findings of one validation rule, collected while the rule runs.
+
+    Use as a context manager via ValidationReport.check(); leaving the block
+    records the elapsed time and applies the report's fail-fast policy.
+    """
+
+    def __init__(
+        self,
+        report,
+        rule,
+        passed=None,
+        failed=None,
+        notes=(),
+        group_label=None,
+        group_limit=3,
+        spaced=False,
+    ):
+        self.report = report
+        self.rule = rule
+        # Text renderer strings: failed may contain {count}; None prints each
+        # error as its own "FAILED - message" line
+        self.passed_text = passed
+        self.failed_text = failed
+        self.notes = list(notes)
+        # Group errors per part in text output ("part: N <group_label>")
+        self.group_label = group_label
+        self.group_limit = group_limit
+        # Print a blank line before the FAILED/PASSED line in text output
+        self.spaced = spaced
+        self.issues = []
+        # Text renderer form of each issue where it differs from the default
+        # "part: Line N: message" (None otherwise); JSON and JUnit ignore it
+        self.texts = []
+        self.details = []
+        self.seconds = 0.0
+        self._start = None
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.seconds = time.perf_counter() - self._start
+        if exc_type is None and self.report.fail_fast and not self.passed:
+            raise StopValidation()
+        return False
+
+    @property
+    def errors(self):
+        return [issue for issue in self.issues if issue.severity == "error"]
+
+    @property
+    def passed(self):
+        return not any(issue.severity == "error" for issue in self.issues)
+
+    def error(self, message, part=None, line=None, text=None):
+        """Record an error, stopping validation if the error budget is spent."""
+        self._add("error", message, part, line, text)
+        self.report.error_count += 1
+        if (
+            self.report.max_errors is not None
+            and self.report.error_count >= self.report.max_errors
+        ):
+            self.report.truncated = True
+            raise StopValidation()
+
+    def warning(self, message, part=None, line=None, text=None):
+        self._add("warning", message, part, line, text)
+
+    def info(self, message, part=None, line=None, text=None):
+        self._add("info", message, part, line, text)
+
+    def detail(self, text):
+        """Record a line that only the verbose text renderer shows."""
+        self.details.append(text)
+
+    def _add(self, severity, message, part, line, text):
+        self.issues.append(
+            Issue(
+                self.rule, None if part is None else str(part), line, severity, message
+            )
+        )
+        self.texts.append(text)
+
+    def to_dict(self):
+        return {
+            "rule": self.rule,
+            "passed": self.passed,
+            "seconds": round(self.seconds, 6),
+            "issues": [issue._asdict() for issue in self.issues],
+        }
+
+
+class ValidationReport:
+    """All checks run by one validator on one document.
+
+    Args:
+        name: Validator name (used as the JUnit test suite name)
+        document: Path of the document being validated
+        max_errors: Stop after this many errors (None for no limit)
+        fail_fast: Stop after the first check that reports an error
+    """
+
+    def __init__(self, name, document, max_errors=None, fail_fast=False):
+        self.name = name
+        self.document = str(document)
+        self.max_errors = max_errors
+        self.fail_fast = fail_fast
+        self.checks = []
+        self.error_count = 0
+        self.truncated = False
+
+    def check(self, rule, **kwargs):
+        """Start a new check; see Check for the keyword arguments."""
+        check = Check(self, rule, **kwargs)
+        self.checks.append(check)
+        return check
+
+    @property
+    def issues(self):
+        return [issue for check in self.checks for issue in check.issues]
+
+    @property
+    def passed(self):
+        return all(check.passed for check in self.checks)
+
+    def to_dict(self):
+        return {
+            "validator": self.name,
+            "document": self.document,
+            "passed": self.passed,
+            "truncated": self.truncated,
+            "checks": [check.to_dict() for check in self.checks],
+        }
+
+
+def _format_issue(issue, indent="  "):
+    if issue.part is not None and issue.line is not None:
+        return f"{indent}{issue.part}: Line {issue.line}: {issue.message}"
+    if issue.part is not None:
+        return f"{indent}{issue.part}: {issue.message}"
+    return f"{indent}{issue.message}"
+
+
+def _truncate(text, limit=250):
+    return text[:limit] + "..." if len(text) > limit else text
+
+
+def _render_check_text(check, verbose):
+    lines = []
+    if verbose:
+        lines.extend(check.details)
+
+    issues = list(zip(check.issues, check.texts))
+    errors = [(issue, text) for issue, text in issues if issue.severity == "error"]
+    if errors:
+        if check.failed_text is None:
+            lines.extend(
+                f"FAILED - {issue.message}" if text is None else text
+                for issue, text in errors
+            )
+        else:
+            if check.spaced:
+                lines.append("")
+            lines.append(f"FAILED - {check.failed_text.format(count=len(errors))}")
+            if check.group_label:
+                by_part = {}
+                for issue, _ in errors:
+                    by_part.setdefault(issue.part, []).append(issue)
+                for part, part_errors in by_part.items():
+                    lines.append(f"  {part}: {len(part_errors)} {check.group_label}")
+                    lines.extend(
+                        f"    - {_truncate(issue.message)}"
+                        for issue in part_errors[: check.group_limit]
+                    )
+            else:
+                lines.extend(
+                    _format_issue(issue) if text is None else text
+                    for issue, text in errors
+                )
+        lines.extend(check.notes)
+    elif verbose and check.passed_text:
+        if check.spaced:
+            lines.append("")
+        lines.append(f"PASSED - {check.passed_text}")
+
+    for issue, text in issues:
+        if issue.severity == "error":
+            continue
+        if text is not None:
+            lines.append(text)
+        elif issue.severity == "warning":
+            lines.append(f"Warning: {_format_issue(issue, indent='')}")
+        elif issue.severity == "info":
+            lines.append(issue.message)
+    return lines
+
+
+def render_text(report, verbose=False):
+    """Render a report the way the validators have always printed it."""
+    lines = []
+    for check in report.checks:
+        lines.extend(_render_check_text(check, verbose))
+    if report.truncated:
+        lines.append(
+            f"Stopped after {report.error_count} errors (max errors: {report.max_errors})"
+        )
+    return "\n".join(lines)
+
+
+def render_json(reports):
+    """Render a list of reports as a JSON document."""
+    return json.dumps(
+        {
+            "passed": all(report.passed for report in reports),
+            "reports": [report.to_dict() for report in reports],
+        },
+        indent=2,
+    )
+
+
+def render_junit(reports):
+    """Render a list of reports as JUnit XML, one test suite per validator."""
+    suites = lxml.etree.Element("testsuites")
+    for report in reports:
+        failures = sum(1 for check in report.checks if not check.passed)
+        suite = lxml.etree.SubElement(
+            suites,
+            "testsuite",
+            name=report.name,
+            tests=str(len(report.checks)),
+            failures=str(failures),
+            errors="0",
+            time=f"{sum(check.seconds for check in report.checks):.3f}",
+        )
+        lxml.etree.SubElement(
+            lxml.etree.SubElement(suite, "properties"),
+            "property",
+            name="document",
+            value=report.document,
+        )
+        for check in report.checks:
+            case = lxml.etree.SubElement(
+                suite,
+                "testcase",
+                classname=report.name,
+                name=check.rule,
+                time=f"{check.seconds:.3f}",
+            )
+            errors = check.errors
+            if errors:
+                failure = lxml.etree.SubElement(
+                    case,
+                    "failure",
+                    message=f"{len(errors)} error(s)",
+                    type=check.rule,
+                )
+                failure.text = "\n".join(_format_issue(issue, "") for issue in errors)
+            others = [issue for issue in check.issues if issue.severity != "error"]
+            if others:
+                system_out = lxml.etree.SubElement(case, "system-out")
+                system_out.text = "\n".join(
+                    f"{issue.severity}: {_format_issue(issue, '')}" for issue in others
+                )
+    return lxml.etree.tostring(
+        suites, pretty_print=True, xml_declaration=True, encoding="UTF-8"
+    ).decode("utf-8")
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
@@ -0,0 +1,264 @@
+"""
+Process-wide font lookup and loading for text measurement.
+
+Resolving a font family to a file used to probe every candidate path with
+exists() and fuzzy-scan font directories for every paragraph. The registry
+lists each font directory once, answers lookups from that index with the
+same precedence as before, and keeps loaded FreeTypeFont objects in an LRU
+keyed by (path, size).
+
+Classes:
+    FontRegistry: Font family -> file index plus a loaded-font LRU
+
+Main Functions:
+    get_font_registry: Return the registry shared by this process
+    set_font_registry: Replace the registry shared by this process
+
+The directory listing can optionally be persisted to a JSON index file so
+that new processes skip the directory scans; entries are refreshed whenever a
+directory's modification time changes.
+"""
+
+import hashlib
+import json
+import os
+import platform
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from PIL import ImageFont
+
+FontType = Union[ImageFont.FreeTypeFont, ImageFont.ImageFont]
+
+INDEX_VERSION = 1
+
+
+def default_font_locations() -> Tuple[List[str], List[str]]:
+    """Return the (font directories, extensions) searched on this platform."""
+    if platform.system() == "Darwin":  # macOS
+        return (
+            ["/System/Library/Fonts/", "/Library/Fonts/", "~/Library/Fonts/"],
+            [".ttf", ".otf", ".ttc", ".dfont"],
+        )
+    # Linux
+    return (
+        ["/usr/share/fonts/truetype/", "/usr/local/share/fonts/", "~/.fonts/"],
+        [".ttf", ".otf"],
+    )
+
+
+class FontRegistry:
+    """Index of font files by family name plus an LRU of loaded fonts."""
+
+    def __init__(
+        self,
+        font_dirs: Optional[List[str]] = None,
+        extensions: Optional[List[str]] = None,
+        index_path: Optional[Union[str, Path]] = None,
+        cache_size: int = 256,
+        case_insensitive: Optional[bool] = None,
+    ):
+        """Create a registry.
+
+        Args:
+            font_dirs: Directories to search, in priority order (default: platform dirs)
+            extensions: Font file extensions to accept (default: platform extensions)
+            index_path: Optional JSON file used to persist the directory listing
+            cache_size: Maximum number of loaded (path, size) fonts to keep
+            case_insensitive: Whether exact file name matches ignore case, as on
+                the default macOS file system (default: True on macOS)
+        """
+        default_dirs, default_extensions = default_font_locations()
+        self.font_dirs = [
+            Path(font_dir).expanduser() for font_dir in (font_dirs or default_dirs)
+        ]
+        self.extensions = list(extensions or default_extensions)
+        self.index_path = Path(index_path) if index_path else None
+        self.case_insensitive = (
+            platform.system() == "Darwin"
+            if case_insensitive is None
+            else case_insensitive
+        )
+        self._listings: Optional[Dict[str, Dict]] = None
+        self._paths: Dict[str, Optional[str]] = {}
+        self._load = lru_cache(maxsize=cache_size)(self._load_font)
+
+    def _scan_dir(self, font_dir: Path) -> Optional[Dict]:
+        """List the files directly inside a font directory, in iterdir() order."""
+        if not font_dir.exists():
+            return None
+        files = []
+        try:
+            for file_path in font_dir.iterdir():
+                if file_path.is_file():
+                    files.append(file_path.name)
+        except (OSError, PermissionError):
+            files = None
+        return {"mtime": font_dir.stat().st_mtime, "files": files}
+
+    def _read_index(self) -> Dict[str, Dict]:
+        if not self.index_path or not self.index_path.exists():
+            return {}
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if data.get("version") != INDEX_VERSION:
+            return {}
+        return data.get("dirs", {})
+
+    def _write_index(self) -> None:
+        if not self.index_path or self._listings is None:
+            return
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.index_path.with_suffix(self.index_path.suffix + ".tmp")
+            tmp_path.write_text(
+                json.dumps({"version": INDEX_VERSION, "dirs": self._listings}),
+                encoding="utf-8",
+            )
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            pass
+
+    def _get_listings(self) -> Dict[str, Dict]:
+        """Directory listings, built once per process (or read from the index)."""
+        if self._listings is None:
+            cached = self._read_index()
+            listings = {}
+            stale = False
+            for font_dir in self.font_dirs:
+                key = str(font_dir)
+                entry = cached.get(key)
+                try:
+                    mtime = font_dir.stat().st_mtime if font_dir.exists() else None
+                except OSError:
+                    mtime = None
+                if entry is not None and entry.get("mtime") == mtime:
+                    listings[key] = entry
+                    continue
+                stale = True
+                listing = self._scan_dir(font_dir)
+                listings[key] = listing or {"mtime": None, "files": None}
+            self._listings = listings
+            if stale:
+                self._write_index()
+        return self._listings
+
+    def find(self, font_name: str) -> Optional[str]:
+        """Get the font file path for a given font name.
+
+        Directories are searched in order; within each directory exact
+        "<variant><ext>" names win over a fuzzy match on the file name.
+
+        Args:
+            font_name: Name of the font (e.g., 'Arial', 'Calibri')
+
+        Returns:
+            Path to the font file, or None if not found
+        """
+        if font_name in self._paths:
+            return self._paths[font_name]
+
+        # Common font file variations to try
+        font_variations = [
+            font_name,
+            font_name.lower(),
+            font_name.replace(" ", ""),
+            font_name.replace(" ", "-"),
+        ]
+        font_name_lower = font_name.lower().replace(" ", "")
+
+        result = None
+        listings = self._get_listings()
+        for font_dir in self.font_dirs:
+            listing = listings.get(str(font_dir))
+            if not listing or listing.get("mtime") is None:
+                continue
+            files = listing.get("files")
+            names = set(files or ())
+            if self.case_insensitive:
+                names = {name.lower() for name in names}
+
+            def exists(candidate: str) -> bool:
+                if files is None:  # Directory could not be listed
+                    return (font_dir / candidate).exists()
+                return (candidate.lower() if self.case_insensitive else candidate) in names
+
+            # First try exact matches
+            for variant in font_variations:
+                for ext in self.extensions:
+                    candidate = f"{variant}{ext}"
+                    if exists(candidate):
+                        result = str(font_dir / candidate)
+                        break
+                if result:
+                    break
+            if result:
+                break
+
+            # Then try fuzzy matching - find files containing the font name
+            for file_name in files or ():
+                file_name_lower = file_name.lower()
+                if font_name_lower in file_name_lower and any(
+                    file_name_lower.endswith(ext) for ext in self.extensions
+                ):
+                    result = str(font_dir / file_name)
+                    break
+            if result:
+                break
+
+        self._paths[font_name] = result
+        return result
+
+    def fingerprint(self) -> str:
+        """Digest of the indexed font files, for caching measurement results."""
+        data = json.dumps(
+            [self.extensions, self.case_insensitive, self._get_listings()],
+            sort_keys=True,
+        )
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _load_font(path: Optional[str], size: int) -> FontType:
+        if path:
+            try:
+                return ImageFont.truetype(path, size=size)
+            except Exception:
+                pass
+        return ImageFont.load_default()
+
+    def load(self, path: Optional[str], size: int) -> FontType:
+        """Load a font file at a size, reusing a cached FreeTypeFont when possible.
+
+        Falls back to PIL's default font if path is None or cannot be loaded.
+        """
+        return self._load(path, size)
+
+    def font(self, font_name: str, size: int) -> FontType:
+        """Resolve a font family and load it at the given size."""
+        return self._load(self.find(font_name), size)
+
+    def clear(self) -> None:
+        """Forget resolved paths, directory listings and loaded fonts."""
+        self._listings = None
+        self._paths.clear()
+        self._load.cache_clear()
+
+
+_registry: Optional[FontRegistry] = None
+
+
+def get_font_registry() -> FontRegistry:
+    """Return the registry shared by this process, creating it on first use."""
+    global _registry
+    if _registry is None:
+        _registry = FontRegistry()
+    return _registry
+
+
+def set_font_registry(registry: FontRegistry) -> None:
+    """Replace the registry shared by this process (e.g. to use an on-disk index)."""
+    global _registry
+    _registry = registry
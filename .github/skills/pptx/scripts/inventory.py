@@ -11,29 +11,60 @@ This module provides functionality to:
 - Export to JSON with clean, structured data
 
 Classes:
-    ParagraphData: Represents a text paragraph with formatting
-    ShapeData: Represents a shape with position and text content
+    ParagraphData: Immutable record of a text paragraph with formatting
+    ShapeRecord: Immutable, picklable record of a shape's inventory data
+    ShapeData: Builds a shape's inventory data and keeps the live shape
 
 Main Functions:
     extract_text_inventory: Extract all text from a presentation
-    save_inventory: Save extracted data to JSON
+    iter_inventory_records: Yield detached records slide by slide
+    extract_inventory_records: Extract detached records, cached and/or in parallel
+    get_inventory_as_dict: Extract JSON-ready inventory
+    save_inventory: Save extracted data to JSON or JSON Lines
+    write_inventory_json: Stream slides to a file as one JSON object
+    write_inventory_jsonl: Stream slides to a file as JSON Lines
 
 Usage:
-    python inventory.py input.pptx output.json
+    python inventory.py input.pptx output.json [--jobs N] [--format jsonl]
 """
 
 import argparse
+import bisect
+import heapq
+import itertools
 import json
-import platform
+import multiprocessing
+import os
 import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
-
-from PIL import Image, ImageDraw, ImageFont
+from typing import (
+    Any,
+    Dict,
+    IO,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from font_registry import FontRegistry, get_font_registry, set_font_registry
+from inventory_cache import CACHE_ENV_VAR, InventoryCache, get_default_cache
 from pptx import Presentation
 from pptx.enum.text import PP_ALIGN
 from pptx.shapes.base import BaseShape
+from pptx.text.text import Font
+from text_metrics import get_measurer
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; overlap detection falls back to sweep-line
+    np = None
 
 # Type aliases for cleaner signatures
 JsonValue = Union[str, int, float, bool, None]
@@ -45,6 +76,9 @@ InventoryData = Dict[
     str, Dict[str, "ShapeData"]
 ]  # Dict of slide_id -> {shape_id -> ShapeData}
 InventoryDict = Dict[str, Dict[str, ShapeDict]]  # JSON-serializable inventory
+RecordInventory = Dict[
+    str, Dict[str, "ShapeRecord"]
+]  # Dict of slide_id -> {shape_id -> ShapeRecord}
 
 
 def main():
@@ -60,6 +94,26 @@ Examples:
   python inventory.py presentation.pptx inventory.json --issues-only
     Extracts only text shapes that have overflow or overlap issues
 
+  python inventory.py presentation.pptx inventory.json --jobs 4
+    Splits the slides across 4 worker processes (same output, faster on large decks)
+
+  python inventory.py presentation.pptx inventory.json --cache-dir .inventory-cache
+    Reuses results for slides that have not changed since an earlier run
+    (PPTX_INVENTORY_CACHE sets a default cache directory)
+
+  python inventory.py presentation.pptx inventory.json --backend lxml
+    Reads slide XML directly instead of through python-pptx (same output, faster)
+
+  python inventory.py presentation.pptx inventory.jsonl --format jsonl
+    Writes one {"slide": ..., "shapes": ...} object per line
+
+  python inventory.py decks/ report.json --jobs 0
+  python inventory.py "templates/**/*.pptx" report.json --jobs 0
+    Corpus mode: checks every deck in a directory or glob on all CPUs and
+    writes an issues report with per-deck timing. Finished decks are recorded
+    in a checkpoint file (default: report.json.checkpoint.jsonl), so rerunning
+    the same command after an interruption resumes where it stopped.
+
 The output JSON includes:
   - All text content organized by slide and shape
   - Correct absolute positions for shapes in groups
@@ -69,16 +123,80 @@ The output JSON includes:
         """,
     )
 
-    parser.add_argument("input", help="Input PowerPoint file (.pptx)")
-    parser.add_argument("output", help="Output JSON file for inventory")
+    parser.add_argument(
+        "input", help="Input PowerPoint file (.pptx), or a directory or glob of decks"
+    )
+    parser.add_argument(
+        "output", help="Output JSON file for inventory (corpus mode: issues report)"
+    )
     parser.add_argument(
         "--issues-only",
         action="store_true",
         help="Include only text shapes that have overflow or overlap issues",
     )
+    parser.add_argument(
+        "--font-index",
+        metavar="PATH",
+        help="Cache the font directory index in this JSON file between runs",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes to split slides (corpus mode: decks) across "
+        "(0: CPU count, default: 1)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        metavar="DIR",
+        help="Cache per-slide results in DIR (default: $PPTX_INVENTORY_CACHE if set)",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=["python-pptx", "lxml"],
+        default="python-pptx",
+        help="How slides are read (default: python-pptx); "
+        "--cache-dir applies to python-pptx only",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["json", "jsonl"],
+        default="json",
+        help="Output one JSON object (default) or JSON Lines with one slide per line",
+    )
+
+    parser.add_argument(
+        "--checkpoint",
+        metavar="PATH",
+        help="Corpus mode: JSON Lines file of finished decks used to resume "
+        "(default: OUTPUT.checkpoint.jsonl)",
+    )
 
     args = parser.parse_args()
 
+    if args.font_index:
+        set_font_registry(FontRegistry(index_path=args.font_index))
+
+    from inventory_corpus import is_corpus_source, run_corpus
+
+    if is_corpus_source(args.input):
+        try:
+            run_corpus(
+                args.input,
+                args.output,
+                checkpoint_path=args.checkpoint,
+                jobs=args.jobs or None,
+                backend=args.backend,
+                font_index=args.font_index,
+                cache_dir=args.cache_dir or os.environ.get(CACHE_ENV_VAR),
+                progress=sys.stdout,
+            )
+        except KeyboardInterrupt:
+            print("Interrupted; rerun the same command to resume")
+            sys.exit(130)
+        print(f"Report saved to: {args.output}")
+        return
+
     input_path = Path(args.input)
     if not input_path.exists():
         print(f"Error: Input file not found: {args.input}")
@@ -94,17 +212,49 @@ The output JSON includes:
             print(
                 "Filtering to include only text shapes with issues (overflow/overlap)"
             )
-        inventory = extract_text_inventory(input_path, issues_only=args.issues_only)
+        cache = None
+        if args.backend == "lxml":
+            from inventory_lxml import iter_inventory_records_lxml
+
+            slides = iter_inventory_records_lxml(
+                input_path, issues_only=args.issues_only
+            )
+        else:
+            cache = (
+                InventoryCache(args.cache_dir)
+                if args.cache_dir
+                else get_default_cache()
+            )
+            slides = iter_inventory_records(
+                input_path,
+                issues_only=args.issues_only,
+                workers=args.jobs or None,
+                cache=cache,
+            )
+
+        # Slides are written as they are produced; count them on the way
+        total_slides = total_shapes = 0
+
+        def counted(items):
+            nonlocal total_slides, total_shapes
+            for slide_key, shapes in items:
+                total_slides += 1
+                total_shapes += len(shapes)
+                yield slide_key, shapes
 
         output_path = Path(args.output)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        save_inventory(inventory, output_path)
+        save_inventory(
+            counted(slides), output_path, json_lines=args.format == "jsonl"
+        )
 
+        if cache is not None:
+            print(
+                f"Inventory cache: {cache.hits} slides reused, {cache.misses} computed"
+            )
         print(f"Output saved to: {args.output}")
 
         # Report statistics
-        total_slides = len(inventory)
-        total_shapes = sum(len(shapes) for shapes in inventory.values())
         if args.issues_only:
             if total_shapes > 0:
                 print(
@@ -133,100 +283,239 @@ class ShapeWithPosition:
     absolute_left: int  # in EMUs
     absolute_top: int  # in EMUs
 
+    @property
+    def left(self) -> float:
+        """Left position in inches, rounded as in ShapeData (used for sorting)."""
+        return round(ShapeData.emu_to_inches(self.absolute_left), 2)
+
+    @property
+    def top(self) -> float:
+        """Top position in inches, rounded as in ShapeData (used for sorting)."""
+        return round(ShapeData.emu_to_inches(self.absolute_top), 2)
+
 
-class ParagraphData:
-    """Data structure for paragraph properties extracted from a PowerPoint paragraph."""
+@dataclass(frozen=True)
+class StyleDefaults:
+    """Default text properties defined by a slide master style or layout placeholder."""
 
-    def __init__(self, paragraph: Any):
-        """Initialize from a PowerPoint paragraph object.
+    font_size: Optional[float] = None  # in points
+    line_spacing: Optional[float] = None  # in points
+    font_name: Optional[str] = None
+
+
+class StyleCache:
+    """Default text styles per slide master and slide layout.
+
+    Masters and layouts are shared by many slides, so each one is walked once
+    per inventory run and later shapes look their defaults up in the table.
+    """
+
+    # Master text styles by name: titleStyle, bodyStyle, otherStyle
+    MASTER_STYLES = ("titleStyle", "bodyStyle", "otherStyle")
+    NS = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+
+    def __init__(self):
+        self._masters: Dict[Any, Dict[str, StyleDefaults]] = {}
+        self._layouts: Dict[Any, Dict[Any, StyleDefaults]] = {}
+
+    @classmethod
+    def _defaults(cls, element: Any, font_size: Optional[float]) -> StyleDefaults:
+        """Combine a font size with the line spacing and font of the lvl1 properties."""
+        line_spacing: Optional[float] = None
+        font_name: Optional[str] = None
+        lvl1 = element.find(f".//{cls.NS}lvl1pPr")
+        if lvl1 is not None:
+            spc_pts = lvl1.find(f"{cls.NS}lnSpc/{cls.NS}spcPts")
+            spc_pct = lvl1.find(f"{cls.NS}lnSpc/{cls.NS}spcPct")
+            if spc_pts is not None and spc_pts.get("val"):
+                line_spacing = int(spc_pts.get("val")) / 100.0
+            elif spc_pct is not None and spc_pct.get("val") and font_size:
+                line_spacing = round(int(spc_pct.get("val")) / 100000.0 * font_size, 2)
+            latin = lvl1.find(f"{cls.NS}defRPr/{cls.NS}latin")
+            if latin is not None:
+                font_name = latin.get("typeface")
+        return StyleDefaults(font_size, line_spacing, font_name)
+
+    @classmethod
+    def _master_style_defaults(cls, style: Any) -> StyleDefaults:
+        # First element in the style carrying a size, in whole points
+        font_size = None
+        for elem in style.iter():
+            if "sz" in elem.attrib:
+                font_size = int(elem.attrib["sz"]) // 100
+                break
+        return cls._defaults(style, font_size)
+
+    @classmethod
+    def _layout_placeholder_defaults(cls, element: Any) -> StyleDefaults:
+        # First defRPr with a size, in points
+        font_size = None
+        for elem in element.iter():
+            if "defRPr" in str(elem.tag) and (sz := elem.get("sz")):
+                font_size = float(sz) / 100.0
+                break
+        return cls._defaults(element, font_size)
+
+    def master_styles(self, slide_master: Any) -> Dict[str, StyleDefaults]:
+        """Return style name -> StyleDefaults for a slide master's text styles."""
+        return self.master_styles_from_xml(slide_master.part, slide_master.element)
+
+    def master_styles_from_xml(
+        self, key: Any, master_element: Any
+    ) -> Dict[str, StyleDefaults]:
+        """Like master_styles, for a slide master root element cached under key."""
+        table = self._masters.get(key)
+        if table is None:
+            table = {}
+            for child in master_element.iter():
+                tag = child.tag.split("}")[-1] if "}" in child.tag else child.tag
+                if tag not in self.MASTER_STYLES:
+                    continue
+                defaults = self._master_style_defaults(child)
+                # The first occurrence that defines a size wins
+                current = table.get(tag)
+                if current is None or (
+                    current.font_size is None and defaults.font_size is not None
+                ):
+                    table[tag] = defaults
+            self._masters[key] = table
+        return table
+
+    def layout_placeholders(self, slide_layout: Any) -> Dict[Any, StyleDefaults]:
+        """Return placeholder type -> StyleDefaults for a slide layout.
+
+        Only the first layout placeholder of each type is used.
+        """
+        def placeholders():
+            for layout_placeholder in slide_layout.placeholders:
+                try:
+                    placeholder_type = layout_placeholder.placeholder_format.type
+                except Exception:
+                    continue
+                yield placeholder_type, layout_placeholder.element
+
+        return self.layout_placeholders_from_xml(slide_layout.part, placeholders())
+
+    def layout_placeholders_from_xml(
+        self, key: Any, placeholders: Iterable[Tuple[Any, Any]]
+    ) -> Dict[Any, StyleDefaults]:
+        """Like layout_placeholders, for (type, element) pairs cached under key.
+
+        placeholders is only consumed when key is not cached yet.
+        """
+        table = self._layouts.get(key)
+        if table is None:
+            table = {}
+            for placeholder_type, element in placeholders:
+                if placeholder_type not in table:
+                    table[placeholder_type] = self._layout_placeholder_defaults(element)
+            self._layouts[key] = table
+        return table
+
+
+class ParagraphData(NamedTuple):
+    """Immutable paragraph properties extracted from a PowerPoint paragraph.
+
+    Records hold no reference to python-pptx objects, so they can be pickled,
+    cached and sent across processes. Build them with from_paragraph().
+    """
+
+    text: str
+    bullet: bool = False
+    level: Optional[int] = None
+    alignment: Optional[str] = None
+    space_before: Optional[float] = None
+    space_after: Optional[float] = None
+    font_name: Optional[str] = None
+    font_size: Optional[float] = None
+    bold: Optional[bool] = None
+    italic: Optional[bool] = None
+    underline: Optional[bool] = None
+    color: Optional[str] = None
+    theme_color: Optional[str] = None
+    line_spacing: Optional[float] = None
+
+    @classmethod
+    def from_paragraph(cls, paragraph: Any) -> "ParagraphData":
+        """Extract the properties of a PowerPoint paragraph object.
+
+        Only existing XML is read, so the presentation is left unchanged (the
+        python-pptx alignment, run.font and font.color getters add pPr, rPr
+        and solidFill elements when they are missing).
 
         Args:
             paragraph: The PowerPoint paragraph object
         """
-        self.text: str = paragraph.text.strip()
-        self.bullet: bool = False
-        self.level: Optional[int] = None
-        self.alignment: Optional[str] = None
-        self.space_before: Optional[float] = None
-        self.space_after: Optional[float] = None
-        self.font_name: Optional[str] = None
-        self.font_size: Optional[float] = None
-        self.bold: Optional[bool] = None
-        self.italic: Optional[bool] = None
-        self.underline: Optional[bool] = None
-        self.color: Optional[str] = None
-        self.theme_color: Optional[str] = None
-        self.line_spacing: Optional[float] = None
+        props: Dict[str, Any] = {"text": paragraph.text.strip()}
+        ns = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+        pPr = paragraph._p.pPr
 
         # Check for bullet formatting
-        if (
-            hasattr(paragraph, "_p")
-            and paragraph._p is not None
-            and paragraph._p.pPr is not None
-        ):
-            pPr = paragraph._p.pPr
-            ns = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+        if pPr is not None:
             if (
                 pPr.find(f"{ns}buChar") is not None
                 or pPr.find(f"{ns}buAutoNum") is not None
             ):
-                self.bullet = True
-                if hasattr(paragraph, "level"):
-                    self.level = paragraph.level
+                props["bullet"] = True
+                props["level"] = pPr.lvl
 
         # Add alignment if not LEFT (default)
-        if hasattr(paragraph, "alignment") and paragraph.alignment is not None:
+        alignment = pPr.algn if pPr is not None else None
+        if alignment is not None:
             alignment_map = {
                 PP_ALIGN.CENTER: "CENTER",
                 PP_ALIGN.RIGHT: "RIGHT",
                 PP_ALIGN.JUSTIFY: "JUSTIFY",
             }
-            if paragraph.alignment in alignment_map:
-                self.alignment = alignment_map[paragraph.alignment]
+            if alignment in alignment_map:
+                props["alignment"] = alignment_map[alignment]
 
         # Add spacing properties if set
         if hasattr(paragraph, "space_before") and paragraph.space_before:
-            self.space_before = paragraph.space_before.pt
+            props["space_before"] = paragraph.space_before.pt
         if hasattr(paragraph, "space_after") and paragraph.space_after:
-            self.space_after = paragraph.space_after.pt
+            props["space_after"] = paragraph.space_after.pt
 
         # Extract font properties from first run
-        if paragraph.runs:
-            first_run = paragraph.runs[0]
-            if hasattr(first_run, "font"):
-                font = first_run.font
-                if font.name:
-                    self.font_name = font.name
-                if font.size:
-                    self.font_size = font.size.pt
-                if font.bold is not None:
-                    self.bold = font.bold
-                if font.italic is not None:
-                    self.italic = font.italic
-                if font.underline is not None:
-                    self.underline = font.underline
-
-                # Handle color - both RGB and theme colors
+        rPr = paragraph.runs[0]._r.rPr if paragraph.runs else None
+        if rPr is not None:
+            font = Font(rPr)
+            if font.name:
+                props["font_name"] = font.name
+            if font.size:
+                props["font_size"] = font.size.pt
+            if font.bold is not None:
+                props["bold"] = font.bold
+            if font.italic is not None:
+                props["italic"] = font.italic
+            if font.underline is not None:
+                props["underline"] = font.underline
+
+            # Handle color - both RGB and theme colors. Only a solid fill carries
+            # a color; font.color would replace any other fill with an empty one
+            if rPr.find(f"{ns}solidFill") is not None:
                 try:
                     # Try RGB color first
                     if font.color.rgb:
-                        self.color = str(font.color.rgb)
+                        props["color"] = str(font.color.rgb)
                 except (AttributeError, TypeError):
                     # Fall back to theme color
                     try:
                         if font.color.theme_color:
-                            self.theme_color = font.color.theme_color.name
+                            props["theme_color"] = font.color.theme_color.name
                     except (AttributeError, TypeError):
                         pass
 
         # Add line spacing if set
         if hasattr(paragraph, "line_spacing") and paragraph.line_spacing is not None:
             if hasattr(paragraph.line_spacing, "pt"):
-                self.line_spacing = round(paragraph.line_spacing.pt, 2)
+                props["line_spacing"] = round(paragraph.line_spacing.pt, 2)
             else:
                 # Multiplier - convert to points
-                font_size = self.font_size if self.font_size else 12.0
-                self.line_spacing = round(paragraph.line_spacing * font_size, 2)
+                font_size = props.get("font_size") or 12.0
+                props["line_spacing"] = round(paragraph.line_spacing * font_size, 2)
+
+        return cls(**props)
 
     def to_dict(self) -> ParagraphDict:
         """Convert to dictionary for JSON serialization, excluding None values."""
@@ -263,8 +552,108 @@ class ParagraphData:
         return result
 
 
+class ShapeRecord(NamedTuple):
+    """Immutable inventory entry for one text shape.
+
+    The detached counterpart of ShapeData: positions, issues and paragraphs
+    without the python-pptx shape, safe to pickle, cache or return from a
+    worker process.
+    """
+
+    shape_id: str
+    left: float
+    top: float
+    width: float
+    height: float
+    placeholder_type: Optional[str] = None
+    default_font_size: Optional[float] = None
+    frame_overflow_bottom: Optional[float] = None
+    slide_overflow_right: Optional[float] = None
+    slide_overflow_bottom: Optional[float] = None
+    # (shape_id, overlap in sq inches) pairs, in shape order
+    overlapping_shapes: Tuple[Tuple[str, float], ...] = ()
+    warnings: Tuple[str, ...] = ()
+    paragraphs: Tuple[ParagraphData, ...] = ()
+
+    @property
+    def has_any_issues(self) -> bool:
+        """Check if shape has any issues (overflow, overlap, or warnings)."""
+        return (
+            self.frame_overflow_bottom is not None
+            or self.slide_overflow_right is not None
+            or self.slide_overflow_bottom is not None
+            or len(self.overlapping_shapes) > 0
+            or len(self.warnings) > 0
+        )
+
+    @classmethod
+    def from_json(cls, data: List[Any]) -> "ShapeRecord":
+        """Rebuild a record from its JSON form (the record dumped as a list)."""
+        record = cls(*data)
+        return record._replace(
+            # Older cache entries hold the overlaps as a dict
+            overlapping_shapes=tuple(dict(record.overlapping_shapes).items()),
+            warnings=tuple(record.warnings),
+            paragraphs=tuple(ParagraphData(*para) for para in record.paragraphs),
+        )
+
+    def to_dict(self) -> ShapeDict:
+        """Convert to dictionary for JSON serialization."""
+        result: ShapeDict = {
+            "left": self.left,
+            "top": self.top,
+            "width": self.width,
+            "height": self.height,
+        }
+
+        # Add optional fields if present
+        if self.placeholder_type:
+            result["placeholder_type"] = self.placeholder_type
+
+        if self.default_font_size:
+            result["default_font_size"] = self.default_font_size
+
+        # Add overflow information only if there is overflow
+        overflow_data = {}
+
+        # Add frame overflow if present
+        if self.frame_overflow_bottom is not None:
+            overflow_data["frame"] = {"overflow_bottom": self.frame_overflow_bottom}
+
+        # Add slide overflow if present
+        slide_overflow = {}
+        if self.slide_overflow_right is not None:
+            slide_overflow["overflow_right"] = self.slide_overflow_right
+        if self.slide_overflow_bottom is not None:
+            slide_overflow["overflow_bottom"] = self.slide_overflow_bottom
+        if slide_overflow:
+            overflow_data["slide"] = slide_overflow
+
+        # Only add overflow field if there is overflow
+        if overflow_data:
+            result["overflow"] = overflow_data
+
+        # Add overlap field if there are overlapping shapes
+        if self.overlapping_shapes:
+            result["overlap"] = {"overlapping_shapes": dict(self.overlapping_shapes)}
+
+        # Add warnings field if there are warnings
+        if self.warnings:
+            result["warnings"] = list(self.warnings)
+
+        # Add paragraphs after placeholder_type
+        result["paragraphs"] = [para.to_dict() for para in self.paragraphs]
+
+        return result
+
+
 class ShapeData:
-    """Data structure for shape properties extracted from a PowerPoint shape."""
+    """Data structure for shape properties extracted from a PowerPoint shape.
+
+    Keeps the live python-pptx shape for code that edits it (replace.py);
+    everything else is computed once on construction. Use to_record() for a
+    detached ShapeRecord.
+    """
 
     @staticmethod
     def emu_to_inches(emu: int) -> float:
@@ -286,61 +675,7 @@ class ShapeData:
         Returns:
             Path to the font file, or None if not found
         """
-        system = platform.system()
-
-        # Common font file variations to try
-        font_variations = [
-            font_name,
-            font_name.lower(),
-            font_name.replace(" ", ""),
-            font_name.replace(" ", "-"),
-        ]
-
-        # Define font directories and extensions by platform
-        if system == "Darwin":  # macOS
-            font_dirs = [
-                "/System/Library/Fonts/",
-                "/Library/Fonts/",
-                "~/Library/Fonts/",
-            ]
-            extensions = [".ttf", ".otf", ".ttc", ".dfont"]
-        else:  # Linux
-            font_dirs = [
-                "/usr/share/fonts/truetype/",
-                "/usr/local/share/fonts/",
-                "~/.fonts/",
-            ]
-            extensions = [".ttf", ".otf"]
-
-        # Try to find the font file
-        from pathlib import Path
-
-        for font_dir in font_dirs:
-            font_dir_path = Path(font_dir).expanduser()
-            if not font_dir_path.exists():
-                continue
-
-            # First try exact matches
-            for variant in font_variations:
-                for ext in extensions:
-                    font_path = font_dir_path / f"{variant}{ext}"
-                    if font_path.exists():
-                        return str(font_path)
-
-            # Then try fuzzy matching - find files containing the font name
-            try:
-                for file_path in font_dir_path.iterdir():
-                    if file_path.is_file():
-                        file_name_lower = file_path.name.lower()
-                        font_name_lower = font_name.lower().replace(" ", "")
-                        if font_name_lower in file_name_lower and any(
-                            file_name_lower.endswith(ext) for ext in extensions
-                        ):
-                            return str(file_path)
-            except (OSError, PermissionError):
-                continue
-
-        return None
+        return get_font_registry().find(font_name)
 
     @staticmethod
     def get_slide_dimensions(slide: Any) -> tuple[Optional[int], Optional[int]]:
@@ -359,12 +694,15 @@ class ShapeData:
             return None, None
 
     @staticmethod
-    def get_default_font_size(shape: BaseShape, slide_layout: Any) -> Optional[float]:
+    def get_default_font_size(
+        shape: BaseShape, slide_layout: Any, styles: Optional[StyleCache] = None
+    ) -> Optional[float]:
         """Extract default font size from slide layout for a placeholder shape.
 
         Args:
             shape: Placeholder shape
             slide_layout: Slide layout containing the placeholder definition
+            styles: StyleCache shared by the inventory run (a new one if omitted)
 
         Returns:
             Default font size in points, or None if not found
@@ -374,13 +712,9 @@ class ShapeData:
                 return None
 
             shape_type = shape.placeholder_format.type  # type: ignore
-            for layout_placeholder in slide_layout.placeholders:
-                if layout_placeholder.placeholder_format.type == shape_type:
-                    # Find first defRPr element with sz (size) attribute
-                    for elem in layout_placeholder.element.iter():
-                        if "defRPr" in elem.tag and (sz := elem.get("sz")):
-                            return float(sz) / 100.0  # Convert EMUs to points
-                    break
+            defaults = (styles or StyleCache()).layout_placeholders(slide_layout)
+            if shape_type in defaults:
+                return defaults[shape_type].font_size
         except Exception:
             pass
         return None
@@ -391,6 +725,7 @@ class ShapeData:
         absolute_left: Optional[int] = None,
         absolute_top: Optional[int] = None,
         slide: Optional[Any] = None,
+        styles: Optional[StyleCache] = None,
     ):
         """Initialize from a PowerPoint shape object.
 
@@ -399,9 +734,11 @@ class ShapeData:
             absolute_left: Absolute left position in EMUs (for shapes in groups)
             absolute_top: Absolute top position in EMUs (for shapes in groups)
             slide: Optional slide object to get dimensions and layout information
+            styles: StyleCache shared by the inventory run (a new one if omitted)
         """
         self.shape = shape  # Store reference to original shape
         self.shape_id: str = ""  # Will be set after sorting
+        self.styles = styles or StyleCache()
 
         # Get slide dimensions from slide object
         self.slide_width_emu, self.slide_height_emu = (
@@ -420,7 +757,7 @@ class ShapeData:
                 # Get default font size from layout
                 if slide and hasattr(slide, "slide_layout"):
                     self.default_font_size = self.get_default_font_size(
-                        shape, slide.slide_layout
+                        shape, slide.slide_layout, self.styles
                     )
 
         # Get position information
@@ -461,20 +798,20 @@ class ShapeData:
             str, float
         ] = {}  # Dict of shape_id -> overlap area in sq inches
         self.warnings: List[str] = []
+        self.paragraphs: List[ParagraphData] = self._extract_paragraphs()
         self._estimate_frame_overflow()
         self._calculate_slide_overflow()
         self._detect_bullet_issues()
 
-    @property
-    def paragraphs(self) -> List[ParagraphData]:
-        """Calculate paragraphs from the shape's text frame."""
+    def _extract_paragraphs(self) -> List[ParagraphData]:
+        """Extract the non-empty paragraphs of the shape's text frame."""
         if not self.shape or not hasattr(self.shape, "text_frame"):
             return []
 
         paragraphs = []
         for paragraph in self.shape.text_frame.paragraphs:  # type: ignore
             if paragraph.text.strip():
-                paragraphs.append(ParagraphData(paragraph))
+                paragraphs.append(ParagraphData.from_paragraph(paragraph))
         return paragraphs
 
     def _get_default_font_size(self) -> int:
@@ -494,13 +831,10 @@ class ShapeData:
             if self.placeholder_type and "TITLE" in self.placeholder_type:
                 style_name = "titleStyle"
 
-            # Find font size in theme styles
-            for child in slide_master.element.iter():
-                tag = child.tag.split("}")[-1] if "}" in child.tag else child.tag
-                if tag == style_name:
-                    for elem in child.iter():
-                        if "sz" in elem.attrib:
-                            return int(elem.attrib["sz"]) // 100
+            # Look up the font size in the master's text styles
+            defaults = self.styles.master_styles(slide_master).get(style_name)
+            if defaults is not None and defaults.font_size is not None:
+                return int(defaults.font_size)
         except Exception:
             pass
 
@@ -508,57 +842,15 @@ class ShapeData:
 
     def _get_usable_dimensions(self, text_frame) -> Tuple[int, int]:
         """Get usable width and height in pixels after accounting for margins."""
-        # Default PowerPoint margins in inches
-        margins = {"top": 0.05, "bottom": 0.05, "left": 0.1, "right": 0.1}
-
-        # Override with actual margins if set
-        if hasattr(text_frame, "margin_top") and text_frame.margin_top:
-            margins["top"] = self.emu_to_inches(text_frame.margin_top)
-        if hasattr(text_frame, "margin_bottom") and text_frame.margin_bottom:
-            margins["bottom"] = self.emu_to_inches(text_frame.margin_bottom)
-        if hasattr(text_frame, "margin_left") and text_frame.margin_left:
-            margins["left"] = self.emu_to_inches(text_frame.margin_left)
-        if hasattr(text_frame, "margin_right") and text_frame.margin_right:
-            margins["right"] = self.emu_to_inches(text_frame.margin_right)
-
-        # Calculate usable area
-        usable_width = self.width - margins["left"] - margins["right"]
-        usable_height = self.height - margins["top"] - margins["bottom"]
-
-        # Convert to pixels
-        return (
-            self.inches_to_pixels(usable_width),
-            self.inches_to_pixels(usable_height),
+        return usable_dimensions_px(
+            self.width,
+            self.height,
+            {
+                side: getattr(text_frame, f"margin_{side}", None)
+                for side in ("top", "bottom", "left", "right")
+            },
         )
 
-    def _wrap_text_line(self, line: str, max_width_px: int, draw, font) -> List[str]:
-        """Wrap a single line of text to fit within max_width_px."""
-        if not line:
-            return [""]
-
-        # Use textlength for efficient width calculation
-        if draw.textlength(line, font=font) <= max_width_px:
-            return [line]
-
-        # Need to wrap - split into words
-        wrapped = []
-        words = line.split(" ")
-        current_line = ""
-
-        for word in words:
-            test_line = current_line + (" " if current_line else "") + word
-            if draw.textlength(test_line, font=font) <= max_width_px:
-                current_line = test_line
-            else:
-                if current_line:
-                    wrapped.append(current_line)
-                current_line = word
-
-        if current_line:
-            wrapped.append(current_line)
-
-        return wrapped
-
     def _estimate_frame_overflow(self) -> None:
         """Estimate if text overflows the shape bounds using PIL text measurement."""
         if not self.shape or not hasattr(self.shape, "text_frame"):
@@ -573,89 +865,32 @@ class ShapeData:
         if usable_width_px <= 0 or usable_height_px <= 0:
             return
 
-        # Set up PIL for text measurement
-        dummy_img = Image.new("RGB", (1, 1))
-        draw = ImageDraw.Draw(dummy_img)
+        # Pair each non-empty paragraph's text with its record
+        para_records = iter(self.paragraphs)
+        paragraphs = [
+            (para_idx, paragraph.text, next(para_records))
+            for para_idx, paragraph in enumerate(text_frame.paragraphs)
+            if paragraph.text.strip()
+        ]
 
         # Get default font size from placeholder or use conservative estimate
-        default_font_size = self._get_default_font_size()
-
-        # Calculate total height of all paragraphs
-        total_height_px = 0
-
-        for para_idx, paragraph in enumerate(text_frame.paragraphs):
-            if not paragraph.text.strip():
-                continue
-
-            para_data = ParagraphData(paragraph)
-
-            # Load font for this paragraph
-            font_name = para_data.font_name or "Arial"
-            font_size = int(para_data.font_size or default_font_size)
-
-            font = None
-            font_path = self.get_font_path(font_name)
-            if font_path:
-                try:
-                    font = ImageFont.truetype(font_path, size=font_size)
-                except Exception:
-                    font = ImageFont.load_default()
-            else:
-                font = ImageFont.load_default()
-
-            # Wrap all lines in this paragraph
-            all_wrapped_lines = []
-            for line in paragraph.text.split("\n"):
-                wrapped = self._wrap_text_line(line, usable_width_px, draw, font)
-                all_wrapped_lines.extend(wrapped)
-
-            if all_wrapped_lines:
-                # Calculate line height
-                if para_data.line_spacing:
-                    # Custom line spacing explicitly set
-                    line_height_px = para_data.line_spacing * 96 / 72
-                else:
-                    # PowerPoint default single spacing (1.0x font size)
-                    line_height_px = font_size * 96 / 72
-
-                # Add space_before (except first paragraph)
-                if para_idx > 0 and para_data.space_before:
-                    total_height_px += para_data.space_before * 96 / 72
-
-                # Add paragraph text height
-                total_height_px += len(all_wrapped_lines) * line_height_px
-
-                # Add space_after
-                if para_data.space_after:
-                    total_height_px += para_data.space_after * 96 / 72
-
-        # Check for overflow (ignore negligible overflows <= 0.05")
-        if total_height_px > usable_height_px:
-            overflow_px = total_height_px - usable_height_px
-            overflow_inches = round(overflow_px / 96.0, 2)
-            if overflow_inches > 0.05:  # Only report significant overflows
-                self.frame_overflow_bottom = overflow_inches
+        self.frame_overflow_bottom = estimate_frame_overflow(
+            paragraphs,
+            usable_width_px,
+            usable_height_px,
+            self._get_default_font_size(),
+        )
 
     def _calculate_slide_overflow(self) -> None:
         """Calculate if shape overflows the slide boundaries."""
-        if self.slide_width_emu is None or self.slide_height_emu is None:
-            return
-
-        # Check right overflow (ignore negligible overflows <= 0.01")
-        right_edge_emu = self.left_emu + self.width_emu
-        if right_edge_emu > self.slide_width_emu:
-            overflow_emu = right_edge_emu - self.slide_width_emu
-            overflow_inches = round(self.emu_to_inches(overflow_emu), 2)
-            if overflow_inches > 0.01:  # Only report significant overflows
-                self.slide_overflow_right = overflow_inches
-
-        # Check bottom overflow (ignore negligible overflows <= 0.01")
-        bottom_edge_emu = self.top_emu + self.height_emu
-        if bottom_edge_emu > self.slide_height_emu:
-            overflow_emu = bottom_edge_emu - self.slide_height_emu
-            overflow_inches = round(self.emu_to_inches(overflow_emu), 2)
-            if overflow_inches > 0.01:  # Only report significant overflows
-                self.slide_overflow_bottom = overflow_inches
+        self.slide_overflow_right, self.slide_overflow_bottom = slide_overflow(
+            self.left_emu,
+            self.top_emu,
+            self.width_emu,
+            self.height_emu,
+            self.slide_width_emu,
+            self.slide_height_emu,
+        )
 
     def _detect_bullet_issues(self) -> None:
         """Detect bullet point formatting issues in paragraphs."""
@@ -666,17 +901,9 @@ class ShapeData:
         if not text_frame or not text_frame.paragraphs:
             return
 
-        # Common bullet symbols that indicate manual bullets
-        bullet_symbols = ["•", "●", "○"]
-
-        for paragraph in text_frame.paragraphs:
-            text = paragraph.text.strip()
-            # Check for manual bullet symbols
-            if text and any(text.startswith(symbol + " ") for symbol in bullet_symbols):
-                self.warnings.append(
-                    "manual_bullet_symbol: use proper bullet formatting"
-                )
-                break
+        self.warnings.extend(
+            bullet_warnings(paragraph.text for paragraph in text_frame.paragraphs)
+        )
 
     @property
     def has_any_issues(self) -> bool:
@@ -689,59 +916,182 @@ class ShapeData:
             or len(self.warnings) > 0
         )
 
+    def to_record(self) -> ShapeRecord:
+        """Return a detached, immutable snapshot of this shape's inventory data."""
+        return ShapeRecord(
+            shape_id=self.shape_id,
+            left=self.left,
+            top=self.top,
+            width=self.width,
+            height=self.height,
+            placeholder_type=self.placeholder_type,
+            default_font_size=self.default_font_size,
+            frame_overflow_bottom=self.frame_overflow_bottom,
+            slide_overflow_right=self.slide_overflow_right,
+            slide_overflow_bottom=self.slide_overflow_bottom,
+            overlapping_shapes=tuple(self.overlapping_shapes.items()),
+            warnings=tuple(self.warnings),
+            paragraphs=tuple(self.paragraphs),
+        )
+
     def to_dict(self) -> ShapeDict:
         """Convert to dictionary for JSON serialization."""
-        result: ShapeDict = {
-            "left": self.left,
-            "top": self.top,
-            "width": self.width,
-            "height": self.height,
-        }
+        return self.to_record().to_dict()
 
-        # Add optional fields if present
-        if self.placeholder_type:
-            result["placeholder_type"] = self.placeholder_type
-
-        if self.default_font_size:
-            result["default_font_size"] = self.default_font_size
 
-        # Add overflow information only if there is overflow
-        overflow_data = {}
+def usable_dimensions_px(
+    width: float, height: float, margins_emu: Dict[str, Optional[int]]
+) -> Tuple[int, int]:
+    """Get usable width and height in pixels after accounting for margins.
 
-        # Add frame overflow if present
-        if self.frame_overflow_bottom is not None:
-            overflow_data["frame"] = {"overflow_bottom": self.frame_overflow_bottom}
+    Args:
+        width: Shape width in inches
+        height: Shape height in inches
+        margins_emu: Text frame margins by side ("top", "bottom", "left",
+            "right") in EMUs; missing or zero margins use PowerPoint's defaults
 
-        # Add slide overflow if present
-        slide_overflow = {}
-        if self.slide_overflow_right is not None:
-            slide_overflow["overflow_right"] = self.slide_overflow_right
-        if self.slide_overflow_bottom is not None:
-            slide_overflow["overflow_bottom"] = self.slide_overflow_bottom
-        if slide_overflow:
-            overflow_data["slide"] = slide_overflow
+    Returns:
+        Tuple of (usable_width_px, usable_height_px)
+    """
+    # Default PowerPoint margins in inches
+    margins = {"top": 0.05, "bottom": 0.05, "left": 0.1, "right": 0.1}
+
+    # Override with actual margins if set
+    for side, margin in margins_emu.items():
+        if margin:
+            margins[side] = ShapeData.emu_to_inches(margin)
+
+    # Calculate usable area
+    usable_width = width - margins["left"] - margins["right"]
+    usable_height = height - margins["top"] - margins["bottom"]
+
+    # Convert to pixels
+    return (
+        ShapeData.inches_to_pixels(usable_width),
+        ShapeData.inches_to_pixels(usable_height),
+    )
 
-        # Only add overflow field if there is overflow
-        if overflow_data:
-            result["overflow"] = overflow_data
 
-        # Add overlap field if there are overlapping shapes
-        if self.overlapping_shapes:
-            result["overlap"] = {"overlapping_shapes": self.overlapping_shapes}
+def estimate_frame_overflow(
+    paragraphs: List[Tuple[int, str, ParagraphData]],
+    usable_width_px: int,
+    usable_height_px: int,
+    default_font_size: int,
+) -> Optional[float]:
+    """Estimate how far wrapped text overflows the bottom of its text frame.
 
-        # Add warnings field if there are warnings
-        if self.warnings:
-            result["warnings"] = self.warnings
+    Args:
+        paragraphs: (index in text frame, raw text, ParagraphData) for each
+            non-empty paragraph, in order
+        usable_width_px: Width available for text in pixels
+        usable_height_px: Height available for text in pixels
+        default_font_size: Font size in points for paragraphs that set none
 
-        # Add paragraphs after placeholder_type
-        result["paragraphs"] = [para.to_dict() for para in self.paragraphs]
+    Returns:
+        Overflow in inches, or None if there is no significant overflow
+    """
+    # Calculate total height of all paragraphs
+    total_height_px = 0
+
+    for para_idx, text, para_data in paragraphs:
+        # Load font for this paragraph
+        font_name = para_data.font_name or "Arial"
+        font_size = int(para_data.font_size or default_font_size)
+
+        font = get_font_registry().font(font_name, font_size)
+        measurer = get_measurer(font)
+
+        # Wrap all lines in this paragraph
+        all_wrapped_lines = []
+        for line in text.split("\n"):
+            all_wrapped_lines.extend(measurer.wrap(line, usable_width_px))
+
+        if all_wrapped_lines:
+            # Calculate line height
+            if para_data.line_spacing:
+                # Custom line spacing explicitly set
+                line_height_px = para_data.line_spacing * 96 / 72
+            else:
+                # PowerPoint default single spacing (1.0x font size)
+                line_height_px = font_size * 96 / 72
+
+            # Add space_before (except first paragraph)
+            if para_idx > 0 and para_data.space_before:
+                total_height_px += para_data.space_before * 96 / 72
+
+            # Add paragraph text height
+            total_height_px += len(all_wrapped_lines) * line_height_px
+
+            # Add space_after
+            if para_data.space_after:
+                total_height_px += para_data.space_after * 96 / 72
+
+    # Check for overflow (ignore negligible overflows <= 0.05")
+    if total_height_px > usable_height_px:
+        overflow_px = total_height_px - usable_height_px
+        overflow_inches = round(overflow_px / 96.0, 2)
+        if overflow_inches > 0.05:  # Only report significant overflows
+            return overflow_inches
+    return None
+
+
+def slide_overflow(
+    left_emu: int,
+    top_emu: int,
+    width_emu: int,
+    height_emu: int,
+    slide_width_emu: Optional[int],
+    slide_height_emu: Optional[int],
+) -> Tuple[Optional[float], Optional[float]]:
+    """Calculate how far a shape extends past the right and bottom slide edges.
 
-        return result
+    Returns:
+        Tuple of (overflow_right, overflow_bottom) in inches, None where the
+        shape stays on the slide (or the slide size is unknown)
+    """
+    if slide_width_emu is None or slide_height_emu is None:
+        return None, None
+
+    overflow_right = overflow_bottom = None
+
+    # Check right overflow (ignore negligible overflows <= 0.01")
+    right_edge_emu = left_emu + width_emu
+    if right_edge_emu > slide_width_emu:
+        overflow_emu = right_edge_emu - slide_width_emu
+        overflow_inches = round(ShapeData.emu_to_inches(overflow_emu), 2)
+        if overflow_inches > 0.01:  # Only report significant overflows
+            overflow_right = overflow_inches
+
+    # Check bottom overflow (ignore negligible overflows <= 0.01")
+    bottom_edge_emu = top_emu + height_emu
+    if bottom_edge_emu > slide_height_emu:
+        overflow_emu = bottom_edge_emu - slide_height_emu
+        overflow_inches = round(ShapeData.emu_to_inches(overflow_emu), 2)
+        if overflow_inches > 0.01:  # Only report significant overflows
+            overflow_bottom = overflow_inches
+
+    return overflow_right, overflow_bottom
+
+
+def bullet_warnings(paragraph_texts: Iterable[str]) -> List[str]:
+    """Detect bullet point formatting issues in a shape's paragraph texts."""
+    # Common bullet symbols that indicate manual bullets
+    bullet_symbols = ["•", "●", "○"]
+
+    for text in paragraph_texts:
+        text = text.strip()
+        # Check for manual bullet symbols
+        if text and any(text.startswith(symbol + " ") for symbol in bullet_symbols):
+            return ["manual_bullet_symbol: use proper bullet formatting"]
+    return []
 
 
 def is_valid_shape(shape: BaseShape) -> bool:
     """Check if a shape contains meaningful text content."""
-    # Must have a text frame with content
+    # Must have a text frame with content. Shapes without a txBody are skipped
+    # first, since shape.text_frame would add an empty one
+    if getattr(shape.element, "txBody", None) is None:
+        return False
     if not hasattr(shape, "text_frame") or not shape.text_frame:  # type: ignore
         return False
 
@@ -879,36 +1229,266 @@ def calculate_overlap(
     return False, 0
 
 
-def detect_overlaps(shapes: List[ShapeData]) -> None:
-    """Detect overlapping shapes and update their overlapping_shapes dictionaries.
+class _ActiveIntervals:
+    """Active vertical extents of the overlap sweep, indexed on y.
+
+    A segment tree over the sorted distinct top/bottom coordinates of all
+    rectangles. Each node keeps the ids of active intervals that cover its
+    whole range (for stabbing queries) and a count of active intervals that
+    start inside it (for reporting starts in a range), so insertions and
+    removals take O(log n) and queries O(log n + k log n).
+    """
+
+    def __init__(self, coords: List[float]):
+        self.coords = coords
+        self.size = 1
+        while self.size < max(len(coords), 1):
+            self.size *= 2
+        self.cover: List[Optional[Set[int]]] = [None] * (2 * self.size)
+        self.start_counts = [0] * (2 * self.size)
+        self.starts: Dict[int, Set[int]] = {}
+
+    def _index(self, value: float) -> int:
+        return bisect.bisect_left(self.coords, value)
+
+    def _cover_nodes(self, lo: int, hi: int) -> Iterator[int]:
+        """Nodes whose ranges exactly make up leaves lo..hi-1."""
+        lo += self.size
+        hi += self.size
+        while lo < hi:
+            if lo & 1:
+                yield lo
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                yield hi
+            lo >>= 1
+            hi >>= 1
+
+    def _update(self, idx: int, top: float, bottom: float, add: bool) -> None:
+        start = self._index(top)
+        for node in self._cover_nodes(start, self._index(bottom)):
+            if add:
+                if self.cover[node] is None:
+                    self.cover[node] = set()
+                self.cover[node].add(idx)  # type: ignore
+            else:
+                self.cover[node].discard(idx)  # type: ignore
+        leaf_ids = self.starts.setdefault(start, set())
+        if add:
+            leaf_ids.add(idx)
+        else:
+            leaf_ids.discard(idx)
+        node = start + self.size
+        while node:
+            self.start_counts[node] += 1 if add else -1
+            node >>= 1
+
+    def add(self, idx: int, top: float, bottom: float) -> None:
+        self._update(idx, top, bottom, add=True)
+
+    def remove(self, idx: int, top: float, bottom: float) -> None:
+        self._update(idx, top, bottom, add=False)
+
+    def stabbing(self, y: float) -> Iterator[int]:
+        """Ids of active intervals with top <= y < bottom."""
+        leaf = bisect.bisect_right(self.coords, y) - 1
+        if leaf < 0 or leaf >= len(self.coords) - 1:
+            return
+        node = leaf + self.size
+        while node:
+            if self.cover[node]:
+                yield from self.cover[node]  # type: ignore
+            node >>= 1
+
+    def starting_between(self, low: float, high: float) -> Iterator[int]:
+        """Ids of active intervals with low < top < high."""
+        lo = bisect.bisect_right(self.coords, low)
+        hi = bisect.bisect_left(self.coords, high)
+        for node in self._cover_nodes(lo, hi):
+            pending = [node]
+            while pending:
+                node = pending.pop()
+                if not self.start_counts[node]:
+                    continue
+                if node >= self.size:
+                    yield from self.starts[node - self.size]
+                else:
+                    pending.extend((2 * node, 2 * node + 1))
 
-    This function requires each ShapeData to have its shape_id already set.
-    It modifies the shapes in-place, adding shape IDs with overlap areas in square inches.
+
+def find_overlapping_pairs(
+    rects: List[Tuple[float, float, float, float]], tolerance: float = 0.05
+) -> List[Tuple[int, int]]:
+    """Find all pairs of rectangles that overlap by more than tolerance.
+
+    Sweeps the rectangles left to right. Rectangles whose right edge is no
+    longer more than tolerance past the sweep position leave the active set
+    through a heap keyed on the right edge; the active set is indexed on y
+    (see _ActiveIntervals), so each rectangle is only compared with active
+    rectangles it overlaps vertically. This takes O((n + k) log n) for k
+    overlapping pairs.
 
     Args:
-        shapes: List of ShapeData objects with shape_id attributes set
+        rects: (left, top, width, height) rectangles in inches
+        tolerance: Minimum overlap in inches, as in calculate_overlap
+
+    Returns:
+        Sorted list of (i, j) index pairs with i < j
     """
-    n = len(shapes)
+    # Candidates are found with slightly widened bounds and then checked with
+    # the exact comparisons of calculate_overlap, so rounding cannot drop pairs
+    epsilon = 1e-9
+    coords = sorted({rect[1] for rect in rects} | {rect[1] + rect[3] for rect in rects})
+    active = _ActiveIntervals(coords)
+    expiring: List[Tuple[float, int]] = []
+    pairs = []
+
+    for idx in sorted(range(len(rects)), key=lambda idx: rects[idx][0]):
+        left, top, width, height = rects[idx]
+        # Drop rectangles that end too close to this (and every later) left edge
+        while expiring and expiring[0][0] - left <= tolerance - epsilon:
+            _, other = heapq.heappop(expiring)
+            other_top = rects[other][1]
+            active.remove(other, other_top, other_top + rects[other][3])
+
+        right = left + width
+        bottom = top + height
+        if width <= tolerance - epsilon or height <= tolerance - epsilon:
+            continue  # Too small to overlap anything by more than tolerance
+
+        # Active rectangles overlap this one vertically by more than tolerance
+        # when they start above bottom - tolerance and end below
+        # top + tolerance: those starting at or above top + tolerance contain
+        # that point, the others start between the two
+        low = top + tolerance - epsilon
+        high = bottom - tolerance + epsilon
+        candidates = itertools.chain(
+            active.stabbing(low), active.starting_between(low, high)
+        )
+        for other in candidates:
+            other_left, other_top, other_width, other_height = rects[other]
+            overlap_width = min(right, other_left + other_width) - max(left, other_left)
+            overlap_height = min(bottom, other_top + other_height) - max(top, other_top)
+            if overlap_width > tolerance and overlap_height > tolerance:
+                pairs.append((other, idx) if other < idx else (idx, other))
 
-    # Compare each pair of shapes
-    for i in range(n):
-        for j in range(i + 1, n):
-            shape1 = shapes[i]
-            shape2 = shapes[j]
+        active.add(idx, top, bottom)
+        heapq.heappush(expiring, (right, idx))
 
-            # Ensure shape IDs are set
-            assert shape1.shape_id, f"Shape at index {i} has no shape_id"
-            assert shape2.shape_id, f"Shape at index {j} has no shape_id"
+    pairs.sort()
+    return pairs
 
-            rect1 = (shape1.left, shape1.top, shape1.width, shape1.height)
-            rect2 = (shape2.left, shape2.top, shape2.width, shape2.height)
 
-            overlaps, overlap_area = calculate_overlap(rect1, rect2)
+def find_overlapping_pairs_numpy(
+    rects: List[Tuple[float, float, float, float]],
+    tolerance: float = 0.05,
+    chunk_size: int = 1024,
+) -> List[Tuple[int, int]]:
+    """Vectorized variant of find_overlapping_pairs using NumPy.
+
+    Intersects blocks of rectangles against all later rectangles at once with
+    the same comparisons as calculate_overlap.
 
-            if overlaps:
-                # Add shape IDs with overlap area in square inches
-                shape1.overlapping_shapes[shape2.shape_id] = overlap_area
-                shape2.overlapping_shapes[shape1.shape_id] = overlap_area
+    Returns:
+        Sorted list of (i, j) index pairs with i < j
+    """
+    if np is None:
+        raise ImportError("NumPy is required for the vectorized overlap detector")
+
+    boxes = np.asarray(rects, dtype=np.float64).reshape(-1, 4)
+    lefts, tops = boxes[:, 0], boxes[:, 1]
+    rights, bottoms = lefts + boxes[:, 2], tops + boxes[:, 3]
+    n = len(boxes)
+
+    pairs = []
+    for start in range(0, n, chunk_size):
+        stop = min(start + chunk_size, n)
+        rows = slice(start, stop)
+        overlap_width = np.minimum(rights[rows, None], rights[None, :]) - np.maximum(
+            lefts[rows, None], lefts[None, :]
+        )
+        overlap_height = np.minimum(
+            bottoms[rows, None], bottoms[None, :]
+        ) - np.maximum(tops[rows, None], tops[None, :])
+        mask = (overlap_width > tolerance) & (overlap_height > tolerance)
+        # Keep only pairs with i < j
+        mask &= np.arange(start, stop)[:, None] < np.arange(n)[None, :]
+        row_idx, col_idx = np.nonzero(mask)
+        pairs.extend(zip((row_idx + start).tolist(), col_idx.tolist()))
+
+    return pairs
+
+
+def find_overlaps(
+    shapes: Sequence[Union[ShapeData, ShapeRecord]], method: str = "auto"
+) -> List[Dict[str, float]]:
+    """Find the shapes each shape overlaps.
+
+    This function requires each shape to have its shape_id already set.
+
+    Args:
+        shapes: ShapeData objects or ShapeRecords with shape_id set
+        method: "sweep" (sweep-line), "numpy" (vectorized) or "auto" (NumPy
+            for large slides when it is installed, otherwise sweep-line)
+
+    Returns:
+        For each shape, {shape_id: overlap area in square inches} of the shapes
+        it overlaps, in shape order
+    """
+    for i, shape in enumerate(shapes):
+        # Ensure shape IDs are set
+        assert shape.shape_id, f"Shape at index {i} has no shape_id"
+
+    rects = [(s.left, s.top, s.width, s.height) for s in shapes]
+    if method == "auto":
+        method = "numpy" if np is not None and len(shapes) >= 256 else "sweep"
+    if method == "numpy":
+        pairs = find_overlapping_pairs_numpy(rects)
+    elif method == "sweep":
+        pairs = find_overlapping_pairs(rects)
+    else:
+        raise ValueError(f"Unknown overlap detection method: {method}")
+
+    # Pairs are sorted, so each shape's dict is filled in shape order
+    overlaps: List[Dict[str, float]] = [{} for _ in shapes]
+    for i, j in pairs:
+        overlapping, overlap_area = calculate_overlap(rects[i], rects[j])
+        if overlapping:
+            overlaps[i][shapes[j].shape_id] = overlap_area
+            overlaps[j][shapes[i].shape_id] = overlap_area
+    return overlaps
+
+
+def detect_overlaps(shapes: List[ShapeData], method: str = "auto") -> None:
+    """Detect overlapping shapes and update their overlapping_shapes dictionaries.
+
+    Args:
+        shapes: List of ShapeData objects with shape_id attributes set
+        method: Overlap detection method, as for find_overlaps
+    """
+    for shape, overlaps in zip(shapes, find_overlaps(shapes, method)):
+        shape.overlapping_shapes.update(overlaps)
+
+
+def with_overlaps(
+    records: List[ShapeRecord], method: str = "auto"
+) -> List[ShapeRecord]:
+    """Return the records with overlapping_shapes filled in.
+
+    Args:
+        records: ShapeRecords with shape_id set
+        method: Overlap detection method, as for find_overlaps
+
+    Returns:
+        New records for shapes that overlap others, the same records otherwise
+    """
+    return [
+        record._replace(overlapping_shapes=tuple(overlaps.items()))
+        if overlaps
+        else record
+        for record, overlaps in zip(records, find_overlaps(records, method))
+    ]
 
 
 def extract_text_inventory(
@@ -929,91 +1509,404 @@ def extract_text_inventory(
     if prs is None:
         prs = Presentation(str(pptx_path))
     inventory: InventoryData = {}
+    # Master and layout text styles, walked once for the whole run
+    styles = StyleCache()
 
     for slide_idx, slide in enumerate(prs.slides):
-        # Collect all valid shapes from this slide with absolute positions
-        shapes_with_positions = []
-        for shape in slide.shapes:  # type: ignore
-            shapes_with_positions.extend(collect_shapes_with_absolute_positions(shape))
+        shapes = extract_slide_shapes(slide, styles, issues_only)
+        if shapes:
+            inventory[f"slide-{slide_idx}"] = shapes
 
-        if not shapes_with_positions:
-            continue
+    return inventory
+
+
+def locate_slide_shapes(slide: Any) -> Dict[str, ShapeWithPosition]:
+    """Assign inventory keys to a slide's text shapes without measuring them.
+
+    Keys depend only on shape positions, so they match the keys of a full
+    inventory of the slide.
+
+    Returns:
+        {shape-N: ShapeWithPosition} sorted by visual position
+    """
+    # Collect all valid shapes from this slide with absolute positions
+    shapes_with_positions = []
+    for shape in slide.shapes:  # type: ignore
+        shapes_with_positions.extend(collect_shapes_with_absolute_positions(shape))
+
+    # Sort by visual position and assign stable IDs in one step
+    return {
+        f"shape-{idx}": swp
+        for idx, swp in enumerate(
+            sort_shapes_by_position(shapes_with_positions)  # type: ignore
+        )
+    }
 
-        # Convert to ShapeData with absolute positions and slide reference
-        shape_data_list = [
-            ShapeData(
-                swp.shape,
-                swp.absolute_left,
-                swp.absolute_top,
-                slide,
-            )
-            for swp in shapes_with_positions
-        ]
 
-        # Sort by visual position and assign stable IDs in one step
-        sorted_shapes = sort_shapes_by_position(shape_data_list)
-        for idx, shape_data in enumerate(sorted_shapes):
-            shape_data.shape_id = f"shape-{idx}"
+def extract_slide_shapes(
+    slide: Any, styles: StyleCache, issues_only: bool = False
+) -> Dict[str, ShapeData]:
+    """Build the inventory entries for one slide.
 
-        # Detect overlaps using the stable shape IDs
-        if len(sorted_shapes) > 1:
-            detect_overlaps(sorted_shapes)
+    Args:
+        slide: Slide to inventory
+        styles: StyleCache shared by the inventory run
+        issues_only: If True, only include shapes that have overflow or overlap issues
+
+    Returns:
+        {shape-N: ShapeData} sorted by visual position (empty if no text shapes)
+    """
+    # Convert to ShapeData with absolute positions and slide reference
+    sorted_shapes = []
+    for shape_id, swp in locate_slide_shapes(slide).items():
+        shape_data = ShapeData(
+            swp.shape, swp.absolute_left, swp.absolute_top, slide, styles
+        )
+        shape_data.shape_id = shape_id
+        sorted_shapes.append(shape_data)
 
-        # Filter for issues only if requested (after overlap detection)
-        if issues_only:
-            sorted_shapes = [sd for sd in sorted_shapes if sd.has_any_issues]
+    # Detect overlaps using the stable shape IDs
+    if len(sorted_shapes) > 1:
+        detect_overlaps(sorted_shapes)
+
+    # Filter for issues only if requested (after overlap detection)
+    if issues_only:
+        sorted_shapes = [sd for sd in sorted_shapes if sd.has_any_issues]
+
+    # Create slide inventory using the stable shape IDs
+    return {shape_data.shape_id: shape_data for shape_data in sorted_shapes}
+
+
+def extract_listed_shapes(
+    prs: Any,
+    shape_keys: Dict[str, Iterable[str]],
+    styles: Optional[StyleCache] = None,
+) -> InventoryData:
+    """Build inventory entries for the listed shapes only.
 
-        if not sorted_shapes:
+    Shapes get the keys a full inventory would give them, but only the listed
+    ones are measured. Overlaps between shapes are not detected. Keys that do
+    not name an inventoried shape are ignored.
+
+    Args:
+        prs: Presentation to read
+        shape_keys: slide_key -> keys of the shapes to include
+        styles: StyleCache to share with other calls (a new one if omitted)
+
+    Returns:
+        Nested dictionary {slide-N: {shape-N: ShapeData}} of the listed shapes
+    """
+    styles = styles or StyleCache()
+    slides = prs.slides
+    inventory: InventoryData = {}
+    for slide_key, keys in shape_keys.items():
+        slide_index = slide_key[len("slide-") :]
+        if not slide_key.startswith("slide-") or not slide_index.isdigit():
             continue
+        if int(slide_index) >= len(slides):
+            continue
+        slide = slides[int(slide_index)]
+
+        wanted = set(keys)
+        shapes: Dict[str, ShapeData] = {}
+        for shape_id, swp in locate_slide_shapes(slide).items():
+            if shape_id in wanted:
+                shape_data = ShapeData(
+                    swp.shape, swp.absolute_left, swp.absolute_top, slide, styles
+                )
+                shape_data.shape_id = shape_id
+                shapes[shape_id] = shape_data
+        if shapes:
+            inventory[slide_key] = shapes
+    return inventory
+
+
+# Per-process state of inventory worker processes (see _init_inventory_worker)
+_worker_slides: List[Any] = []
+_worker_styles: Optional[StyleCache] = None
 
-        # Create slide inventory using the stable shape IDs
-        inventory[f"slide-{slide_idx}"] = {
-            shape_data.shape_id: shape_data for shape_data in sorted_shapes
+
+def _init_inventory_worker(pptx_path: str, font_index: Optional[str]) -> None:
+    """Pool initializer: load the presentation once per worker process."""
+    global _worker_slides, _worker_styles
+    if font_index:
+        set_font_registry(FontRegistry(index_path=font_index))
+    _worker_slides = list(Presentation(pptx_path).slides)
+    _worker_styles = StyleCache()
+
+
+def _inventory_slides(
+    task: Tuple[List[int], bool],
+) -> List[Dict[str, ShapeRecord]]:
+    """Inventory the given slides in a worker, returning detached records."""
+    slide_indices, issues_only = task
+    return [
+        {
+            key: shape_data.to_record()
+            for key, shape_data in extract_slide_shapes(
+                _worker_slides[slide_idx], _worker_styles, issues_only  # type: ignore
+            ).items()
         }
+        for slide_idx in slide_indices
+    ]
+
+
+def _cache_context(prs: Any, issues_only: bool) -> str:
+    """Everything besides the slide XML that a slide's inventory depends on."""
+    return json.dumps(
+        [
+            ShapeRecord._fields,
+            ParagraphData._fields,
+            prs.slide_width,
+            prs.slide_height,
+            issues_only,
+            get_font_registry().fingerprint(),
+        ]
+    )
 
-    return inventory
 
+def iter_inventory_records(
+    pptx_path: Path,
+    prs: Optional[Any] = None,
+    issues_only: bool = False,
+    workers: Optional[int] = 1,
+    cache: Optional[InventoryCache] = None,
+) -> Iterator[Tuple[str, Dict[str, ShapeRecord]]]:
+    """Yield (slide key, {shape key: ShapeRecord}) one slide at a time.
+
+    Slides can be read from an on-disk cache and the remaining slides split
+    across worker processes. Each worker loads the presentation once; slides
+    are yielded in slide order as soon as they are available, so the keys and
+    their order are the same as a sequential run and only a few slides'
+    records are held at once. Slides without text shapes are skipped.
+
+    Args:
+        pptx_path: Path to the PowerPoint file
+        prs: Optional Presentation object to use. If not provided, will load from pptx_path.
+        issues_only: If True, only include shapes that have overflow or overlap issues
+        workers: Number of worker processes (None: CPU count, 1: in-process)
+        cache: Optional InventoryCache; unchanged slides are read from it and
+            recomputed slides are stored in it
+
+    Yields:
+        Tuple of ("slide-N", {shape-N: ShapeRecord}) for each slide with text
+    """
+    if prs is None:
+        prs = Presentation(str(pptx_path))
+    slides = list(prs.slides)
+
+    # Find the cached slides first so only the misses are sent to workers
+    keys: List[str] = []
+    if cache is not None:
+        context = _cache_context(prs, issues_only)
+        keys = [cache.slide_key(slide, context) for slide in slides]
+    pending = [
+        idx
+        for idx in range(len(slides))
+        if cache is None or not cache.contains(keys[idx])
+    ]
+
+    # Master and layout text styles, walked once for the whole run
+    styles = StyleCache()
+
+    def compute(slide_idx: int) -> Dict[str, ShapeRecord]:
+        shapes = extract_slide_shapes(slides[slide_idx], styles, issues_only)
+        return {key: shape_data.to_record() for key, shape_data in shapes.items()}
+
+    workers = min(workers or os.cpu_count() or 1, len(pending))
+    pool = None
+    computed: Iterator[Tuple[int, Dict[str, ShapeRecord]]]
+    if workers <= 1:
+        computed = ((slide_idx, compute(slide_idx)) for slide_idx in pending)
+    else:
+        # A few chunks per worker so one slow chunk does not hold up the rest
+        chunk_size = max(1, -(-len(pending) // (workers * 4)))
+        tasks = [
+            (pending[start : start + chunk_size], issues_only)
+            for start in range(0, len(pending), chunk_size)
+        ]
+        index_path = get_font_registry().index_path
+        pool = multiprocessing.Pool(
+            processes=workers,
+            initializer=_init_inventory_worker,
+            initargs=(str(pptx_path), str(index_path) if index_path else None),
+        )
+        computed = (
+            item
+            for (slide_indices, _), chunk in zip(
+                tasks, pool.imap(_inventory_slides, tasks)
+            )
+            for item in zip(slide_indices, chunk)
+        )
+
+    try:
+        pending_set = set(pending)
+        for slide_idx in range(len(slides)):
+            if slide_idx in pending_set:
+                _, records = next(computed)
+                store = True
+            else:
+                entry = cache.get(keys[slide_idx])  # type: ignore[union-attr]
+                # The entry may have been removed since the lookup
+                store = entry is None
+                records = (
+                    compute(slide_idx)
+                    if entry is None
+                    else {
+                        shape_key: ShapeRecord.from_json(data)
+                        for shape_key, data in entry.items()
+                    }
+                )
+            if cache is not None and store:
+                cache.put(keys[slide_idx], records)
+            if records:
+                yield f"slide-{slide_idx}", records
+    finally:
+        if pool is not None:
+            pool.terminate()
+
+
+def extract_inventory_records(
+    pptx_path: Path,
+    prs: Optional[Any] = None,
+    issues_only: bool = False,
+    workers: Optional[int] = 1,
+    cache: Optional[InventoryCache] = None,
+) -> RecordInventory:
+    """Extract text inventory as detached ShapeRecords.
+
+    Unlike extract_text_inventory, slides can be read from an on-disk cache
+    and the remaining slides split across worker processes; see
+    iter_inventory_records, which this collects into a dictionary.
 
-def get_inventory_as_dict(pptx_path: Path, issues_only: bool = False) -> InventoryDict:
+    Args:
+        pptx_path: Path to the PowerPoint file
+        prs: Optional Presentation object to use. If not provided, will load from pptx_path.
+        issues_only: If True, only include shapes that have overflow or overlap issues
+        workers: Number of worker processes (None: CPU count, 1: in-process)
+        cache: Optional InventoryCache; unchanged slides are read from it and
+            recomputed slides are stored in it
+
+    Returns:
+        Nested dictionary {slide-N: {shape-N: ShapeRecord}}
+    """
+    return dict(
+        iter_inventory_records(
+            pptx_path, prs, issues_only=issues_only, workers=workers, cache=cache
+        )
+    )
+
+
+def get_inventory_as_dict(
+    pptx_path: Path,
+    issues_only: bool = False,
+    workers: Optional[int] = 1,
+    cache: Optional[InventoryCache] = None,
+) -> InventoryDict:
     """Extract text inventory and return as JSON-serializable dictionaries.
 
-    This is a convenience wrapper around extract_text_inventory that returns
-    dictionaries instead of ShapeData objects, useful for testing and direct
+    This is a convenience wrapper around extract_inventory_records that
+    returns dictionaries instead of records, useful for testing and direct
     JSON serialization.
 
     Args:
         pptx_path: Path to the PowerPoint file
         issues_only: If True, only include shapes that have overflow or overlap issues
+        workers: Number of worker processes (None: CPU count, 1: in-process)
+        cache: Optional InventoryCache for per-slide results
 
     Returns:
         Nested dictionary with all data serialized for JSON
     """
-    inventory = extract_text_inventory(pptx_path, issues_only=issues_only)
+    inventory = extract_inventory_records(
+        pptx_path, issues_only=issues_only, workers=workers, cache=cache
+    )
+    return {
+        slide_key: {shape_key: record.to_dict() for shape_key, record in shapes.items()}
+        for slide_key, shapes in inventory.items()
+    }
 
-    # Convert ShapeData objects to dictionaries
-    dict_inventory: InventoryDict = {}
-    for slide_key, shapes in inventory.items():
-        dict_inventory[slide_key] = {
-            shape_key: shape_data.to_dict() for shape_key, shape_data in shapes.items()
-        }
 
-    return dict_inventory
+def _shape_dicts(shapes: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert ShapeData and ShapeRecord objects to dictionaries; keep dictionaries."""
+    return {
+        shape_key: (
+            shape_data.to_dict() if hasattr(shape_data, "to_dict") else shape_data
+        )
+        for shape_key, shape_data in shapes.items()
+    }
 
 
-def save_inventory(inventory: InventoryData, output_path: Path) -> None:
-    """Save inventory to JSON file with proper formatting.
+def write_inventory_json(
+    slides: Iterable[Tuple[str, Dict[str, Any]]], f: IO[str]
+) -> None:
+    """Write (slide key, shapes) pairs to f as one JSON object, slide by slide.
+
+    Each slide is serialized and written as soon as it is produced, so only one
+    slide's dictionaries exist at a time. The output is byte-for-byte what
+    json.dump(inventory, f, indent=2, ensure_ascii=False) writes for the whole
+    inventory.
 
-    Converts ShapeData objects to dictionaries for JSON serialization.
+    Args:
+        slides: Iterable of ("slide-N", {shape-N: ShapeData/ShapeRecord/dict})
+        f: Text file to write to
     """
-    # Convert ShapeData objects to dictionaries
-    json_inventory: InventoryDict = {}
-    for slide_key, shapes in inventory.items():
-        json_inventory[slide_key] = {
-            shape_key: shape_data.to_dict() for shape_key, shape_data in shapes.items()
-        }
+    first = True
+    for slide_key, shapes in slides:
+        body = json.dumps(_shape_dicts(shapes), indent=2, ensure_ascii=False)
+        # Nest the slide's block one level deeper
+        body = body.replace("\n", "\n  ")
+        f.write("{\n  " if first else ",\n  ")
+        f.write(f"{json.dumps(slide_key, ensure_ascii=False)}: {body}")
+        first = False
+    f.write("{}" if first else "\n}")
+
 
+def write_inventory_jsonl(
+    slides: Iterable[Tuple[str, Dict[str, Any]]], f: IO[str]
+) -> None:
+    """Write (slide key, shapes) pairs to f as JSON Lines, one slide per line.
+
+    Each line is {"slide": "slide-N", "shapes": {shape-N: {...}}}, so slides
+    can be split across processes without parsing the whole file.
+
+    Args:
+        slides: Iterable of ("slide-N", {shape-N: ShapeData/ShapeRecord/dict})
+        f: Text file to write to
+    """
+    for slide_key, shapes in slides:
+        line = {"slide": slide_key, "shapes": _shape_dicts(shapes)}
+        f.write(json.dumps(line, ensure_ascii=False) + "\n")
+
+
+def save_inventory(
+    inventory: Union[
+        InventoryData,
+        RecordInventory,
+        InventoryDict,
+        Iterable[Tuple[str, Dict[str, Any]]],
+    ],
+    output_path: Path,
+    json_lines: bool = False,
+) -> None:
+    """Save inventory to JSON file with proper formatting.
+
+    Converts ShapeData and ShapeRecord objects to dictionaries for JSON serialization;
+    entries that are already dictionaries are written as they are. The inventory
+    may also be an iterable of (slide key, shapes) pairs, such as
+    iter_inventory_records(), which is written as the slides are produced.
+
+    Args:
+        inventory: Inventory dictionary or iterable of (slide key, shapes) pairs
+        output_path: File to write
+        json_lines: Write JSON Lines (one slide per line) instead of one object
+    """
+    slides = inventory.items() if isinstance(inventory, dict) else inventory
     with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(json_inventory, f, indent=2, ensure_ascii=False)
+        if json_lines:
+            write_inventory_jsonl(slides, f)
+        else:
+            write_inventory_json(slides, f)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,113 @@
+"""
+On-disk cache of per-slide inventory results.
+
+Each slide's entry is stored under a hash of everything its inventory
+depends on: the slide XML, the XML of its layout and master, and a context
+string supplied by the caller (slide size, inventory options, available
+fonts). Re-running on an unchanged deck reads every slide from the cache;
+after an edit only the slides whose XML changed are recomputed. Entries are
+content-addressed, so identical slides in different decks share them.
+
+Classes:
+    InventoryCache: Content-addressed store of per-slide inventory entries
+
+Main Functions:
+    get_default_cache: Return the cache configured by PPTX_INVENTORY_CACHE
+
+Entries are JSON files under <cache_dir>/<first two hash chars>/<hash>.json.
+Stale entries are never read again and can be removed by deleting the
+directory.
+"""
+
+import hashlib
+import json
+import os
+import weakref
+from pathlib import Path
+from typing import Any, Optional, Union
+
+# Environment variable naming a cache directory used by default
+CACHE_ENV_VAR = "PPTX_INVENTORY_CACHE"
+
+# Bump whenever inventory results change for the same input
+CACHE_VERSION = 1
+
+
+class InventoryCache:
+    """Per-slide inventory entries stored on disk, keyed by content hash."""
+
+    def __init__(self, cache_dir: Union[str, Path]):
+        """Create a cache.
+
+        Args:
+            cache_dir: Directory holding the entries (created on first write)
+        """
+        self.cache_dir = Path(cache_dir).expanduser()
+        # Layout and master parts are shared by many slides; hash each once
+        self._part_digests: "weakref.WeakKeyDictionary[Any, bytes]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self.hits = 0
+        self.misses = 0
+
+    def _part_digest(self, part: Any) -> bytes:
+        digest = self._part_digests.get(part)
+        if digest is None:
+            digest = self._part_digests[part] = hashlib.sha256(part.blob).digest()
+        return digest
+
+    def slide_key(self, slide: Any, context: str = "") -> str:
+        """Return the cache key for a python-pptx slide.
+
+        Args:
+            slide: Slide whose inventory entry is looked up or stored
+            context: Everything else the entry depends on, e.g. slide size and
+                inventory options
+
+        Returns:
+            Hex digest identifying the slide's inventory entry
+        """
+        slide_layout = slide.slide_layout
+        key = hashlib.sha256()
+        key.update(f"{CACHE_VERSION}\0{context}\0".encode("utf-8"))
+        key.update(self._part_digest(slide_layout.slide_master.part))
+        key.update(self._part_digest(slide_layout.part))
+        key.update(slide.part.blob)
+        return key.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def contains(self, key: str) -> bool:
+        """Return whether an entry is stored under key (a missing one is a miss)."""
+        if self._path(key).is_file():
+            return True
+        self.misses += 1
+        return False
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the entry stored under key, or None if there is none."""
+        try:
+            value = json.loads(self._path(key).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable entry under key (best effort)."""
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(value), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+
+def get_default_cache() -> Optional[InventoryCache]:
+    """Return a cache in the directory named by PPTX_INVENTORY_CACHE, if set."""
+    cache_dir = os.environ.get(CACHE_ENV_VAR)
+    return InventoryCache(cache_dir) if cache_dir else None
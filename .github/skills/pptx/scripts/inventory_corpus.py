@@ -0,0 +1,372 @@
+"""
+Inventory checks across a corpus of decks.
+
+Runs the inventory's issue detection (text overflow, shape overlaps, bullet
+warnings) over every deck in a directory or glob. Decks are spread over a
+process pool whose workers keep their font registry, loaded fonts and
+optional per-slide cache for their whole lifetime, so fonts are resolved and
+loaded once per worker rather than once per deck.
+
+Each finished deck is appended to a JSON Lines checkpoint file. A rerun with
+the same checkpoint skips the decks already recorded there (unless the file
+changed since), so an interrupted run resumes where it stopped. When every
+deck is done, the checkpoint is aggregated into a JSON issues report with
+per-deck timing.
+
+Main Functions:
+    find_decks: List the .pptx files in a directory or glob
+    inventory_deck: Check one deck and return a JSON-serializable result
+    inventory_corpus: Check many decks, yielding results as they finish
+    run_corpus: Check a corpus with checkpointing and write the report
+
+Usage:
+    python inventory.py decks/ report.json [--jobs N] [--checkpoint PATH]
+"""
+
+import glob
+import json
+import multiprocessing
+import os
+import time
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from font_registry import FontRegistry, set_font_registry
+from inventory import ShapeRecord, iter_inventory_records
+from inventory_cache import InventoryCache
+
+# Characters that make a corpus source a glob pattern rather than a path
+GLOB_CHARS = "*?["
+
+# Per-shape issue kinds counted in the report
+ISSUE_KINDS = ("frame_overflow", "slide_overflow", "overlap", "warnings")
+
+# Characters of the first paragraph kept to identify a shape in the report
+TEXT_PREVIEW_LENGTH = 80
+
+
+def is_corpus_source(source: Union[str, Path]) -> bool:
+    """Return whether source names a directory or glob rather than one deck.
+
+    An existing file is always a single deck, even if its name contains glob
+    characters (e.g. "deck [v2].pptx").
+    """
+    path = Path(source)
+    if path.is_dir():
+        return True
+    if path.exists():
+        return False
+    return any(char in str(source) for char in GLOB_CHARS)
+
+
+def find_decks(source: Union[str, Path]) -> List[Path]:
+    """List the .pptx files in a directory (recursively) or matching a glob.
+
+    A source naming an existing file is that file alone, never a pattern.
+    PowerPoint lock files (~$name.pptx) are skipped. Paths are sorted so runs
+    over the same corpus process and report decks in the same order.
+    """
+    path = Path(source)
+    if path.is_dir():
+        candidates: Iterable[Path] = path.rglob("*")
+    elif path.exists():
+        candidates = [path]
+    else:
+        candidates = (Path(match) for match in glob.glob(str(source), recursive=True))
+    return sorted(
+        candidate
+        for candidate in candidates
+        if candidate.suffix.lower() == ".pptx"
+        and candidate.is_file()
+        and not candidate.name.startswith("~$")
+    )
+
+
+def _deck_stamp(pptx_path: Path) -> List[int]:
+    """Size and modification time, used to notice decks changed since a checkpoint."""
+    stat = pptx_path.stat()
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _issue_kinds(record: ShapeRecord) -> List[str]:
+    kinds = []
+    if record.frame_overflow_bottom is not None:
+        kinds.append("frame_overflow")
+    if (
+        record.slide_overflow_right is not None
+        or record.slide_overflow_bottom is not None
+    ):
+        kinds.append("slide_overflow")
+    if record.overlapping_shapes:
+        kinds.append("overlap")
+    if record.warnings:
+        kinds.append("warnings")
+    return kinds
+
+
+def _issue_entry(slide_key: str, record: ShapeRecord) -> Dict[str, Any]:
+    """Report entry for one shape: where it is, what is wrong and its text."""
+    shape = record.to_dict()
+    entry: Dict[str, Any] = {"slide": slide_key, "shape": record.shape_id}
+    for field in ("overflow", "overlap", "warnings"):
+        if field in shape:
+            entry[field] = shape[field]
+    text = next((para.text for para in record.paragraphs if para.text), "")
+    entry["text"] = text[:TEXT_PREVIEW_LENGTH]
+    return entry
+
+
+def inventory_deck(
+    pptx_path: Union[str, Path],
+    backend: str = "python-pptx",
+    cache: Optional[InventoryCache] = None,
+) -> Dict[str, Any]:
+    """Check one deck and return a JSON-serializable result dict.
+
+    Errors are recorded in the result rather than raised, so one broken deck
+    does not stop a corpus run.
+
+    Args:
+        pptx_path: Path to the PowerPoint file
+        backend: "python-pptx" or "lxml" (see inventory.py --backend)
+        cache: Optional InventoryCache for per-slide results (python-pptx only)
+
+    Returns:
+        Dict with the deck's path, stamp, timing, issue counts and issue shapes
+    """
+    pptx_path = Path(pptx_path)
+    start = time.perf_counter()
+    result: Dict[str, Any] = {"path": str(pptx_path)}
+    try:
+        result["stamp"] = _deck_stamp(pptx_path)
+        if backend == "lxml":
+            from inventory_lxml import iter_inventory_records_lxml
+
+            slides = iter_inventory_records_lxml(pptx_path, issues_only=True)
+        else:
+            slides = iter_inventory_records(pptx_path, issues_only=True, cache=cache)
+
+        counts = dict.fromkeys(ISSUE_KINDS, 0)
+        issues = []
+        for slide_key, shapes in slides:
+            for record in shapes.values():
+                for kind in _issue_kinds(record):
+                    counts[kind] += 1
+                issues.append(_issue_entry(slide_key, record))
+        result["issue_counts"] = counts
+        result["issues"] = issues
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["seconds"] = round(time.perf_counter() - start, 3)
+    return result
+
+
+# Per-process state of corpus worker processes (see _init_corpus_worker)
+_worker_cache: Optional[InventoryCache] = None
+
+
+def _init_corpus_worker(font_index: Optional[str], cache_dir: Optional[str]) -> None:
+    """Pool initializer: one font registry and slide cache per worker process."""
+    global _worker_cache
+    set_font_registry(FontRegistry(index_path=font_index))
+    _worker_cache = InventoryCache(cache_dir) if cache_dir else None
+
+
+def _inventory_task(task: Tuple[str, str]) -> Dict[str, Any]:
+    pptx_path, backend = task
+    return inventory_deck(pptx_path, backend=backend, cache=_worker_cache)
+
+
+def inventory_corpus(
+    decks: Iterable[Union[str, Path]],
+    jobs: Optional[int] = None,
+    backend: str = "python-pptx",
+    font_index: Optional[Union[str, Path]] = None,
+    cache_dir: Optional[Union[str, Path]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Check many decks, yielding results as they finish.
+
+    Args:
+        decks: Paths of the decks to check
+        jobs: Number of worker processes (default: CPU count). 1 runs in-process.
+        backend: "python-pptx" or "lxml" (see inventory.py --backend)
+        font_index: Optional JSON file persisting the font directory index
+        cache_dir: Optional directory of per-slide inventory results
+
+    Yields:
+        dict: Result from inventory_deck for each deck, in completion order
+    """
+    jobs = jobs or os.cpu_count() or 1
+    initargs = (
+        str(font_index) if font_index else None,
+        str(cache_dir) if cache_dir else None,
+    )
+    tasks = [(str(deck), backend) for deck in decks]
+
+    if jobs == 1 or len(tasks) <= 1:
+        _init_corpus_worker(*initargs)
+        for task in tasks:
+            yield _inventory_task(task)
+        return
+
+    with multiprocessing.Pool(
+        processes=min(jobs, len(tasks)),
+        initializer=_init_corpus_worker,
+        initargs=initargs,
+    ) as pool:
+        yield from pool.imap_unordered(_inventory_task, tasks)
+
+
+def _ends_mid_line(path: Path) -> bool:
+    """Whether a file is non-empty and its last line has no newline."""
+    try:
+        with open(path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) != b"\n"
+    except OSError:
+        # Missing or empty
+        return False
+
+
+def load_checkpoint(checkpoint_path: Union[str, Path]) -> Dict[str, Dict[str, Any]]:
+    """Read the results recorded in a checkpoint file, keyed by deck path.
+
+    A truncated last line (from an interrupted write) is ignored; later lines
+    win over earlier ones for the same deck.
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+    try:
+        with open(checkpoint_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    result = json.loads(line)
+                except ValueError:
+                    continue
+                results[result["path"]] = result
+    except OSError:
+        pass
+    return results
+
+
+def build_report(
+    results: Iterable[Dict[str, Any]], seconds: float
+) -> Dict[str, Any]:
+    """Aggregate per-deck results into the corpus issues report.
+
+    Args:
+        results: Results from inventory_deck
+        seconds: Wall-clock time of the run that completed the corpus
+
+    Returns:
+        Report with corpus totals and the per-deck results, slowest first in
+        "slowest" and by path in "decks"
+    """
+    decks = sorted(results, key=lambda result: result["path"])
+    totals = dict.fromkeys(ISSUE_KINDS, 0)
+    for result in decks:
+        for kind, count in result.get("issue_counts", {}).items():
+            totals[kind] += count
+
+    deck_seconds = sum(result["seconds"] for result in decks)
+    return {
+        "decks": len(decks),
+        "decks_with_issues": sum(1 for result in decks if result.get("issues")),
+        "decks_failed": sum(1 for result in decks if "error" in result),
+        "issue_counts": totals,
+        "seconds": round(seconds, 3),
+        "deck_seconds": round(deck_seconds, 3),
+        "slowest": [
+            {"path": result["path"], "seconds": result["seconds"]}
+            for result in sorted(decks, key=lambda result: -result["seconds"])[:10]
+        ],
+        "results": decks,
+    }
+
+
+def run_corpus(
+    source: Union[str, Path],
+    output_path: Union[str, Path],
+    checkpoint_path: Optional[Union[str, Path]] = None,
+    jobs: Optional[int] = None,
+    backend: str = "python-pptx",
+    font_index: Optional[Union[str, Path]] = None,
+    cache_dir: Optional[Union[str, Path]] = None,
+    progress: Optional[IO[str]] = None,
+) -> Dict[str, Any]:
+    """Check every deck in a directory or glob and write the issues report.
+
+    Args:
+        source: Directory (searched recursively) or glob pattern of decks
+        output_path: JSON file for the aggregated report
+        checkpoint_path: JSON Lines file of finished decks used to resume
+            (default: <output_path>.checkpoint.jsonl)
+        jobs: Number of worker processes (default: CPU count)
+        backend: "python-pptx" or "lxml" (see inventory.py --backend)
+        font_index: Optional JSON file persisting the font directory index
+        cache_dir: Optional directory of per-slide inventory results
+        progress: Optional stream for one progress line per deck
+
+    Returns:
+        The report written to output_path
+    """
+    output_path = Path(output_path)
+    checkpoint_path = Path(
+        checkpoint_path or output_path.with_name(output_path.name + ".checkpoint.jsonl")
+    )
+    decks = find_decks(source)
+
+    # Decks recorded in the checkpoint are done unless they changed since
+    done = load_checkpoint(checkpoint_path)
+    results = {}
+    pending = []
+    for deck in decks:
+        previous = done.get(str(deck))
+        if previous is not None and previous.get("stamp") == _deck_stamp(deck):
+            results[str(deck)] = previous
+        else:
+            pending.append(deck)
+    if progress is not None and results:
+        progress.write(f"Resuming: {len(results)} of {len(decks)} decks already done\n")
+
+    start = time.perf_counter()
+    checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+    cut_short = _ends_mid_line(checkpoint_path)
+    with open(checkpoint_path, "a", encoding="utf-8") as checkpoint:
+        if cut_short:
+            # Start on a fresh line after a write cut short by an interruption
+            checkpoint.write("\n")
+        for result in inventory_corpus(
+            pending,
+            jobs=jobs,
+            backend=backend,
+            font_index=font_index,
+            cache_dir=cache_dir,
+        ):
+            results[result["path"]] = result
+            checkpoint.write(json.dumps(result, ensure_ascii=False) + "\n")
+            checkpoint.flush()
+            if progress is not None:
+                status = (
+                    "error"
+                    if "error" in result
+                    else f"{len(result['issues'])} issue shapes"
+                )
+                progress.write(
+                    f"[{len(results)}/{len(decks)}] {result['path']}: "
+                    f"{status} ({result['seconds']:.2f}s)\n"
+                )
+    elapsed = time.perf_counter() - start
+
+    report = build_report(results.values(), elapsed)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+    if progress is not None:
+        rate = len(pending) / elapsed if elapsed > 0 else 0.0
+        progress.write(
+            f"Checked {len(pending)} decks in {elapsed:.2f}s ({rate:.1f} decks/s); "
+            f"{report['decks_with_issues']} of {report['decks']} decks have issues, "
+            f"{report['decks_failed']} failed\n"
+        )
+    return report
@@ -0,0 +1,71 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from inventory_corpus import find_decks, is_corpus_source, run_corpus
+
+
+class TestCorpusSource(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp_dir.name)
+        for name in ("deck [v2].pptx", "deck2.pptx", "deck.pptx", "~$deck.pptx"):
+            (self.root / name).write_bytes(b"")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_bracketed_file_is_single_deck(self):
+        """An existing file with glob characters in its name is not a glob"""
+        deck = self.root / "deck [v2].pptx"
+        self.assertFalse(is_corpus_source(deck))
+        self.assertEqual(find_decks(deck), [deck])
+
+    def test_directory_is_corpus(self):
+        self.assertTrue(is_corpus_source(self.root))
+        self.assertEqual(
+            [path.name for path in find_decks(self.root)],
+            ["deck [v2].pptx", "deck.pptx", "deck2.pptx"],
+        )
+
+    def test_glob_is_corpus(self):
+        pattern = self.root / "deck?.pptx"
+        self.assertTrue(is_corpus_source(pattern))
+        self.assertEqual([path.name for path in find_decks(pattern)], ["deck2.pptx"])
+
+    def test_missing_plain_path_is_single_deck(self):
+        self.assertFalse(is_corpus_source(self.root / "missing.pptx"))
+
+
+class TestCheckpoint(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp_dir.name)
+        self.checkpoint = self.root / "report.json.checkpoint.jsonl"
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def run_corpus(self):
+        run_corpus(self.root, self.root / "report.json", jobs=1)
+
+    def test_rerun_leaves_complete_checkpoint_unchanged(self):
+        self.checkpoint.write_text('{"path": "a.pptx"}\n', encoding="utf-8")
+        self.run_corpus()
+        self.run_corpus()
+        self.assertEqual(
+            self.checkpoint.read_text(encoding="utf-8"), '{"path": "a.pptx"}\n'
+        )
+
+    def test_rerun_ends_cut_short_line(self):
+        self.checkpoint.write_text('{"path": "a.pptx"}\n{"pa', encoding="utf-8")
+        self.run_corpus()
+        self.run_corpus()
+        self.assertEqual(
+            self.checkpoint.read_text(encoding="utf-8"),
+            '{"path": "a.pptx"}\n{"pa\n',
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,698 @@
+#!/usr/bin/env python3
+"""
+Lightweight inventory backend that reads slide XML straight from the package.
+
+python-pptx wraps every XML element it visits in proxy objects, which is most
+of the runtime and memory of an inventory run. This backend opens the .pptx
+as a zip, parses each slide, layout and master part once with lxml, and reads
+shape transforms, placeholder inheritance and paragraph properties directly.
+It follows python-pptx's rules for each value it reads, so the result is the
+same InventoryDict as get_inventory_as_dict(); text measurement, sorting and
+overlap detection are shared with inventory.py.
+
+Main Functions:
+    iter_inventory_records_lxml: Yield ShapeRecords slide by slide
+    extract_inventory_records_lxml: Extract ShapeRecords without python-pptx objects
+    get_inventory_as_dict_lxml: Extract JSON-ready inventory without python-pptx
+    iter_text_regions: Geometry of a slide's text shapes, without measuring text
+
+Usage (benchmark against the python-pptx backend):
+    python inventory_lxml.py presentation.pptx [--repeat 3]
+"""
+
+import argparse
+import posixpath
+import sys
+import time
+import zipfile
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from inventory import (
+    InventoryDict,
+    ParagraphData,
+    RecordInventory,
+    ShapeData,
+    ShapeRecord,
+    StyleCache,
+    bullet_warnings,
+    estimate_frame_overflow,
+    get_inventory_as_dict,
+    slide_overflow,
+    sort_shapes_by_position,
+    usable_dimensions_px,
+    with_overlaps,
+)
+from lxml import etree
+from pptx.dml.color import RGBColor
+from pptx.enum.dml import MSO_THEME_COLOR
+from pptx.enum.shapes import PP_PLACEHOLDER
+from pptx.enum.text import MSO_UNDERLINE
+
+A = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+P = "{http://schemas.openxmlformats.org/presentationml/2006/main}"
+R = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+PR = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+RT = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/"
+RT_OFFICE_DOCUMENT = RT + "officeDocument"
+RT_SLIDE_LAYOUT = RT + "slideLayout"
+RT_SLIDE_MASTER = RT + "slideMaster"
+
+# Children of p:spTree / p:grpSp that python-pptx treats as shapes
+SHAPE_TAGS = {
+    P + "sp",
+    P + "grpSp",
+    P + "graphicFrame",
+    P + "cxnSp",
+    P + "pic",
+    P + "contentPart",
+}
+FILL_TAGS = {
+    A + "noFill",
+    A + "solidFill",
+    A + "gradFill",
+    A + "blipFill",
+    A + "pattFill",
+    A + "grpFill",
+}
+COLOR_TAGS = {
+    A + "scrgbClr",
+    A + "srgbClr",
+    A + "hslClr",
+    A + "sysClr",
+    A + "schemeClr",
+    A + "prstClr",
+}
+ALIGNMENTS = {"ctr": "CENTER", "r": "RIGHT", "just": "JUSTIFY"}
+
+# Master placeholder a layout placeholder inherits its position from
+LAYOUT_BASE_TYPES = {
+    PP_PLACEHOLDER.BODY: PP_PLACEHOLDER.BODY,
+    PP_PLACEHOLDER.CHART: PP_PLACEHOLDER.BODY,
+    PP_PLACEHOLDER.BITMAP: PP_PLACEHOLDER.BODY,
+    PP_PLACEHOLDER.CENTER_TITLE: PP_PLACEHOLDER.TITLE,
+    PP_PLACEHOLDER.ORG_CHART: PP_PLACEHOLDER.BODY,
+    PP_PLACEHOLDER.DATE: PP_PLACEHOLDER.DATE,
+    PP_PLACEHOLDER.FOOTER: PP_PLACEHOLDER.FOOTER,
+    PP_PLACEHOLDER.MEDIA_CLIP: PP_PLACEHOLDER.BODY,
+    PP_PLACEHOLDER.OBJECT: PP_PLACEHOLDER.BODY,
+    PP_PLACEHOLDER.PICTURE: PP_PLACEHOLDER.BODY,
+    PP_PLACEHOLDER.SLIDE_NUMBER: PP_PLACEHOLDER.SLIDE_NUMBER,
+    PP_PLACEHOLDER.SUBTITLE: PP_PLACEHOLDER.BODY,
+    PP_PLACEHOLDER.TABLE: PP_PLACEHOLDER.BODY,
+    PP_PLACEHOLDER.TITLE: PP_PLACEHOLDER.TITLE,
+}
+
+# Same parser settings as python-pptx, so text nodes come out identical
+_PARSER = etree.XMLParser(remove_blank_text=True, resolve_entities=False)
+
+Dims = Tuple[Optional[int], Optional[int], Optional[int], Optional[int]]
+
+
+class _Package:
+    """Parts and relationships of a .pptx, parsed on first use."""
+
+    def __init__(self, pptx_path: Path):
+        self.zip = zipfile.ZipFile(pptx_path)
+        self._xml: Dict[str, Any] = {}
+        self._rels: Dict[str, List[Tuple[str, str, str]]] = {}
+
+    def close(self) -> None:
+        self.zip.close()
+
+    def xml(self, partname: str) -> Any:
+        root = self._xml.get(partname)
+        if root is None:
+            root = self._xml[partname] = etree.fromstring(
+                self.zip.read(partname), _PARSER
+            )
+        return root
+
+    def rels(self, partname: str) -> List[Tuple[str, str, str]]:
+        """(rId, relationship type, target part name) for each internal relationship."""
+        rels = self._rels.get(partname)
+        if rels is None:
+            directory, name = posixpath.split(partname)
+            rels_name = posixpath.join(directory, "_rels", f"{name}.rels")
+            rels = []
+            if rels_name in self.zip.NameToInfo:
+                for rel in etree.fromstring(self.zip.read(rels_name), _PARSER):
+                    if rel.tag != PR + "Relationship":
+                        continue
+                    if rel.get("TargetMode") == "External":
+                        continue
+                    target = rel.get("Target", "")
+                    if target.startswith("/"):
+                        target = target[1:]
+                    else:
+                        target = posixpath.normpath(posixpath.join(directory, target))
+                    rels.append((rel.get("Id"), rel.get("Type"), target))
+            self._rels[partname] = rels
+        return rels
+
+    def related(self, partname: str, reltype: str) -> Optional[str]:
+        for _, rel_type, target in self.rels(partname):
+            if rel_type == reltype:
+                return target
+        return None
+
+
+def _first_child(elm: Any) -> Optional[Any]:
+    return next(elm.iterchildren(etree.Element), None)
+
+
+def _placeholder(elm: Any) -> Optional[Any]:
+    """The p:ph element of a shape, found where python-pptx looks for it."""
+    nv_props = _first_child(elm)
+    if nv_props is None:
+        return None
+    return nv_props.find(f"{P}nvPr/{P}ph")
+
+
+def _placeholder_type(ph: Any) -> Any:
+    return PP_PLACEHOLDER.from_xml(ph.get("type", "obj"))
+
+
+def _shape_children(container: Any) -> Iterator[Any]:
+    for child in container:
+        if child.tag in SHAPE_TAGS:
+            yield child
+
+
+def _dims(elm: Any) -> Dims:
+    """(x, y, cx, cy) of a shape's own transform, None where not set."""
+    if elm.tag == P + "grpSp":
+        xfrm = elm.find(f"{P}grpSpPr/{A}xfrm")
+    elif elm.tag == P + "graphicFrame":
+        xfrm = elm.find(f"{P}xfrm")
+    else:
+        xfrm = elm.find(f"{P}spPr/{A}xfrm")
+    if xfrm is None:
+        return None, None, None, None
+    off = xfrm.find(f"{A}off")
+    ext = xfrm.find(f"{A}ext")
+    return (
+        int(off.get("x")) if off is not None else None,
+        int(off.get("y")) if off is not None else None,
+        int(ext.get("cx")) if ext is not None else None,
+        int(ext.get("cy")) if ext is not None else None,
+    )
+
+
+def _merge_dims(own: Dims, base: Optional[Dims]) -> Dims:
+    if base is None:
+        return own
+    return tuple(  # type: ignore
+        value if value is not None else base_value
+        for value, base_value in zip(own, base)
+    )
+
+
+def _run_text(elm: Any) -> str:
+    if elm.tag == A + "br":
+        return "\v"
+    t = elm.find(f"{A}t")
+    return (t.text or "") if t is not None else ""
+
+
+def _paragraph_text(p: Any) -> str:
+    """Paragraph text as python-pptx reports it (line breaks as vertical tabs)."""
+    return "".join(
+        _run_text(child)
+        for child in p
+        if child.tag in (A + "r", A + "br", A + "fld")
+    )
+
+
+def _centipoints_to_pt(value: str) -> float:
+    # python-pptx converts centipoints to whole EMUs before reporting points
+    return int(int(value) * 127) / 12700.0
+
+
+def _boolean(value: Optional[str]) -> Optional[bool]:
+    return None if value is None else value in ("1", "true")
+
+
+def _spacing_points(pPr: Any, tag: str) -> Optional[float]:
+    spc_pts = pPr.find(f"{A}{tag}/{A}spcPts")
+    if spc_pts is None:
+        return None
+    return _centipoints_to_pt(spc_pts.get("val"))
+
+
+def _paragraph_data(p: Any, text: str) -> ParagraphData:
+    """ParagraphData for an a:p element, matching ParagraphData.from_paragraph."""
+    props: Dict[str, Any] = {"text": text.strip()}
+
+    pPr = p.find(f"{A}pPr")
+    if pPr is not None:
+        if pPr.find(f"{A}buChar") is not None or pPr.find(f"{A}buAutoNum") is not None:
+            props["bullet"] = True
+            props["level"] = int(pPr.get("lvl", "0"))
+        alignment = ALIGNMENTS.get(pPr.get("algn", ""))
+        if alignment:
+            props["alignment"] = alignment
+        for key, tag in (("space_before", "spcBef"), ("space_after", "spcAft")):
+            points = _spacing_points(pPr, tag)
+            if points:
+                props[key] = points
+
+    runs = p.findall(f"{A}r")
+    rPr = runs[0].find(f"{A}rPr") if runs else None
+    if rPr is not None:
+        latin = rPr.find(f"{A}latin")
+        if latin is not None and latin.get("typeface"):
+            props["font_name"] = latin.get("typeface")
+        if rPr.get("sz"):
+            size = _centipoints_to_pt(rPr.get("sz"))
+            if size:
+                props["font_size"] = size
+        for key, attr in (("bold", "b"), ("italic", "i")):
+            value = _boolean(rPr.get(attr))
+            if value is not None:
+                props[key] = value
+        underline = rPr.get("u")
+        if underline is not None:
+            underline_type = MSO_UNDERLINE.from_xml(underline)
+            if underline_type is MSO_UNDERLINE.NONE:
+                props["underline"] = False
+            elif underline_type is MSO_UNDERLINE.SINGLE_LINE:
+                props["underline"] = True
+            else:
+                props["underline"] = underline_type
+
+        # Only a solid fill carries a font color; python-pptx reports nothing
+        # for other fills
+        fill = next((child for child in rPr if child.tag in FILL_TAGS), None)
+        if fill is not None and fill.tag == A + "solidFill":
+            color = next((child for child in fill if child.tag in COLOR_TAGS), None)
+            if color is not None and color.tag == A + "srgbClr":
+                props["color"] = str(RGBColor.from_string(color.get("val")))
+            elif color is not None and color.tag == A + "schemeClr":
+                theme_color = MSO_THEME_COLOR.from_xml(color.get("val"))
+                if theme_color:
+                    props["theme_color"] = theme_color.name
+
+    if pPr is not None:
+        spc_pts = pPr.find(f"{A}lnSpc/{A}spcPts")
+        spc_pct = pPr.find(f"{A}lnSpc/{A}spcPct")
+        if spc_pts is not None:
+            props["line_spacing"] = round(_centipoints_to_pt(spc_pts.get("val")), 2)
+        elif spc_pct is not None:
+            value = spc_pct.get("val")
+            multiplier = (
+                float(value[:-1]) / 100.0
+                if value.endswith("%")
+                else int(value) / 100000.0
+            )
+            font_size = props.get("font_size") or 12.0
+            props["line_spacing"] = round(multiplier * font_size, 2)
+
+    return ParagraphData(**props)
+
+
+class _SlideContext:
+    """Layout and master of one slide, with placeholder lookups."""
+
+    def __init__(
+        self,
+        layout_name: str,
+        layout: Any,
+        master_name: Optional[str],
+        master: Optional[Any],
+        styles: StyleCache,
+    ):
+        self.layout_name = layout_name
+        self.layout = layout
+        self.master_name = master_name
+        self.master = master
+        self.styles = styles
+
+    @classmethod
+    def from_package(
+        cls, package: _Package, layout_name: str, styles: StyleCache
+    ) -> "_SlideContext":
+        master_name = package.related(layout_name, RT_SLIDE_MASTER)
+        return cls(
+            layout_name,
+            package.xml(layout_name),
+            master_name,
+            package.xml(master_name) if master_name else None,
+            styles,
+        )
+
+    def _placeholders(self, root: Any) -> Iterator[Tuple[Any, Any]]:
+        sp_tree = root.find(f"{P}cSld/{P}spTree")
+        if sp_tree is None:
+            return
+        for elm in _shape_children(sp_tree):
+            ph = _placeholder(elm)
+            if ph is not None:
+                yield ph, elm
+
+    def base_dims(self, ph: Any) -> Optional[Dims]:
+        """Dimensions a slide placeholder inherits from its layout (and master)."""
+        idx = int(ph.get("idx", "0"))
+        for layout_ph, layout_elm in self._placeholders(self.layout):
+            if int(layout_ph.get("idx", "0")) != idx:
+                continue
+            dims = _dims(layout_elm)
+            base_type = LAYOUT_BASE_TYPES.get(_placeholder_type(layout_ph))
+            if self.master is not None and base_type is not None:
+                for master_ph, master_elm in self._placeholders(self.master):
+                    if _placeholder_type(master_ph) == base_type:
+                        return _merge_dims(dims, _dims(master_elm))
+            return dims
+        return None
+
+    def layout_default_font_size(self, placeholder_type: Any) -> Optional[float]:
+        defaults = self.styles.layout_placeholders_from_xml(
+            self.layout_name,
+            (
+                (_placeholder_type(ph), elm)
+                for ph, elm in self._placeholders(self.layout)
+            ),
+        )
+        if placeholder_type in defaults:
+            return defaults[placeholder_type].font_size
+        return None
+
+    def master_default_font_size(self, placeholder_type: Optional[str]) -> int:
+        if self.master is None:
+            return 14
+        style_name = "bodyStyle"
+        if placeholder_type and "TITLE" in placeholder_type:
+            style_name = "titleStyle"
+        defaults = self.styles.master_styles_from_xml(
+            self.master_name, self.master
+        ).get(style_name)
+        if defaults is not None and defaults.font_size is not None:
+            return int(defaults.font_size)
+        return 14
+
+
+def _shape_record(
+    elm: Any,
+    dims: Dims,
+    absolute_left: int,
+    absolute_top: int,
+    context: _SlideContext,
+    slide_size: Tuple[Optional[int], Optional[int]],
+) -> ShapeRecord:
+    """Build the ShapeRecord for a p:sp element, as ShapeData would."""
+    ph = _placeholder(elm)
+    placeholder_type = None
+    default_font_size = None
+    if ph is not None:
+        ph_type = _placeholder_type(ph)
+        placeholder_type = ph_type.name
+        default_font_size = context.layout_default_font_size(ph_type)
+
+    width_emu = dims[2] or 0
+    height_emu = dims[3] or 0
+    width = round(ShapeData.emu_to_inches(width_emu), 2)
+    height = round(ShapeData.emu_to_inches(height_emu), 2)
+
+    tx_body = elm.find(f"{P}txBody")
+    p_elms = tx_body.findall(f"{A}p")
+    texts = [_paragraph_text(p) for p in p_elms]
+    paragraphs = [
+        (para_idx, text, _paragraph_data(p, text))
+        for para_idx, (p, text) in enumerate(zip(p_elms, texts))
+        if text.strip()
+    ]
+
+    frame_overflow_bottom = None
+    body_pr = tx_body.find(f"{A}bodyPr")
+    margins = {
+        side: (
+            int(body_pr.get(attr))
+            if body_pr is not None and body_pr.get(attr)
+            else None
+        )
+        for side, attr in (
+            ("top", "tIns"),
+            ("bottom", "bIns"),
+            ("left", "lIns"),
+            ("right", "rIns"),
+        )
+    }
+    usable_width_px, usable_height_px = usable_dimensions_px(width, height, margins)
+    if usable_width_px > 0 and usable_height_px > 0:
+        frame_overflow_bottom = estimate_frame_overflow(
+            paragraphs,
+            usable_width_px,
+            usable_height_px,
+            context.master_default_font_size(placeholder_type),
+        )
+
+    overflow_right, overflow_bottom = slide_overflow(
+        absolute_left, absolute_top, width_emu, height_emu, *slide_size
+    )
+
+    return ShapeRecord(
+        shape_id="",
+        left=round(ShapeData.emu_to_inches(absolute_left), 2),
+        top=round(ShapeData.emu_to_inches(absolute_top), 2),
+        width=width,
+        height=height,
+        placeholder_type=placeholder_type,
+        default_font_size=default_font_size,
+        frame_overflow_bottom=frame_overflow_bottom,
+        slide_overflow_right=overflow_right,
+        slide_overflow_bottom=overflow_bottom,
+        warnings=tuple(bullet_warnings(texts)),
+        paragraphs=tuple(para_data for _, _, para_data in paragraphs),
+    )
+
+
+def _is_valid_text_shape(elm: Any) -> bool:
+    """Same rules as inventory.is_valid_shape, applied to the XML."""
+    if elm.tag != P + "sp":
+        return False
+    tx_body = elm.find(f"{P}txBody")
+    if tx_body is None:
+        return False
+    text = "\n".join(_paragraph_text(p) for p in tx_body.findall(f"{A}p")).strip()
+    if not text:
+        return False
+
+    ph = _placeholder(elm)
+    if ph is not None:
+        placeholder_type = _placeholder_type(ph).name
+        if placeholder_type == "SLIDE_NUMBER":
+            return False
+        if placeholder_type == "FOOTER" and text.isdigit():
+            return False
+    return True
+
+
+def _collect_shapes(
+    container: Any,
+    context: _SlideContext,
+    parent_left: int = 0,
+    parent_top: int = 0,
+    top_level: bool = True,
+) -> Iterator[Tuple[Any, Dims, int, int]]:
+    """Yield (element, dims, absolute_left, absolute_top) for valid text shapes."""
+    for elm in _shape_children(container):
+        dims = _dims(elm)
+        if elm.tag == P + "grpSp":
+            yield from _collect_shapes(
+                elm,
+                context,
+                parent_left + (dims[0] or 0),
+                parent_top + (dims[1] or 0),
+                top_level=False,
+            )
+            continue
+        if not _is_valid_text_shape(elm):
+            continue
+        ph = _placeholder(elm)
+        if top_level and ph is not None:
+            # Slide placeholders inherit unset dimensions from the layout
+            dims = _merge_dims(dims, context.base_dims(ph))
+        yield elm, dims, parent_left + (dims[0] or 0), parent_top + (dims[1] or 0)
+
+
+def iter_text_regions(
+    sp_tree: Any, layout: Any, master: Optional[Any]
+) -> Iterator[Tuple[float, float, float, float]]:
+    """Yield (left, top, width, height) in inches for each text shape on a slide.
+
+    These are the shapes and (rounded) positions the inventory lists for the
+    slide, read from shape transforms and placeholder inheritance alone: no
+    text properties are read and nothing is measured.
+
+    Args:
+        sp_tree: The slide's p:spTree element (parsed here or by python-pptx)
+        layout: Root element of the slide's layout
+        master: Root element of the layout's master, if any
+    """
+    context = _SlideContext("", layout, None, master, StyleCache())
+    for _, dims, left, top in _collect_shapes(sp_tree, context):
+        yield (
+            round(ShapeData.emu_to_inches(left), 2),
+            round(ShapeData.emu_to_inches(top), 2),
+            round(ShapeData.emu_to_inches(dims[2] or 0), 2),
+            round(ShapeData.emu_to_inches(dims[3] or 0), 2),
+        )
+
+
+def iter_inventory_records_lxml(
+    pptx_path: Path, issues_only: bool = False
+) -> Iterator[Tuple[str, Dict[str, ShapeRecord]]]:
+    """Yield (slide key, {shape key: ShapeRecord}) one slide at a time.
+
+    Args:
+        pptx_path: Path to the PowerPoint file
+        issues_only: If True, only include shapes that have overflow or overlap issues
+
+    Yields:
+        The same items as iter_inventory_records() for the same file
+    """
+    package = _Package(Path(pptx_path))
+    try:
+        presentation_name = package.related("", RT_OFFICE_DOCUMENT)
+        if presentation_name is None:
+            raise ValueError(f"No presentation part found in {pptx_path}")
+        presentation = package.xml(presentation_name)
+        sld_sz = presentation.find(f"{P}sldSz")
+        slide_size = (
+            (int(sld_sz.get("cx")), int(sld_sz.get("cy")))
+            if sld_sz is not None
+            else (None, None)
+        )
+        targets = {
+            rId: target for rId, _, target in package.rels(presentation_name)
+        }
+        sld_ids = presentation.findall(f"{P}sldIdLst/{P}sldId")
+
+        # Master and layout text styles, walked once for the whole run
+        styles = StyleCache()
+        contexts: Dict[str, _SlideContext] = {}
+
+        for slide_idx, sld_id in enumerate(sld_ids):
+            slide_name = targets[sld_id.get(f"{R}id")]
+            layout_name = package.related(slide_name, RT_SLIDE_LAYOUT)
+            context = contexts.get(layout_name)  # type: ignore
+            if context is None:
+                context = contexts[layout_name] = _SlideContext.from_package(
+                    package, layout_name, styles  # type: ignore
+                )
+            sp_tree = etree.fromstring(
+                package.zip.read(slide_name), _PARSER
+            ).find(f"{P}cSld/{P}spTree")
+            if sp_tree is None:
+                continue
+
+            records = [
+                _shape_record(elm, dims, left, top, context, slide_size)
+                for elm, dims, left, top in _collect_shapes(sp_tree, context)
+            ]
+            if not records:
+                continue
+
+            # Sort by visual position and assign stable IDs in one step
+            sorted_records = sort_shapes_by_position(records)  # type: ignore
+            shapes = [
+                record._replace(shape_id=f"shape-{idx}")
+                for idx, record in enumerate(sorted_records)
+            ]
+
+            # Detect overlaps using the stable shape IDs
+            if len(shapes) > 1:
+                shapes = with_overlaps(shapes)
+
+            # Filter for issues only if requested (after overlap detection)
+            if issues_only:
+                shapes = [record for record in shapes if record.has_any_issues]
+
+            if shapes:
+                yield f"slide-{slide_idx}", {
+                    record.shape_id: record for record in shapes
+                }
+    finally:
+        package.close()
+
+
+def extract_inventory_records_lxml(
+    pptx_path: Path, issues_only: bool = False
+) -> RecordInventory:
+    """Extract text inventory as ShapeRecords without building python-pptx objects.
+
+    Args:
+        pptx_path: Path to the PowerPoint file
+        issues_only: If True, only include shapes that have overflow or overlap issues
+
+    Returns:
+        Nested dictionary {slide-N: {shape-N: ShapeRecord}}, equal to
+        extract_inventory_records() for the same file
+    """
+    return dict(iter_inventory_records_lxml(pptx_path, issues_only=issues_only))
+
+
+def get_inventory_as_dict_lxml(
+    pptx_path: Path, issues_only: bool = False
+) -> InventoryDict:
+    """Extract text inventory as JSON-serializable dictionaries with the lxml backend.
+
+    Args:
+        pptx_path: Path to the PowerPoint file
+        issues_only: If True, only include shapes that have overflow or overlap issues
+
+    Returns:
+        Nested dictionary with all data serialized for JSON
+    """
+    inventory = extract_inventory_records_lxml(pptx_path, issues_only=issues_only)
+    return {
+        slide_key: {shape_key: record.to_dict() for shape_key, record in shapes.items()}
+        for slide_key, shapes in inventory.items()
+    }
+
+
+def main():
+    """Benchmark the lxml backend against the python-pptx backend on a deck."""
+    parser = argparse.ArgumentParser(
+        description="Compare lxml and python-pptx inventory backends on a presentation."
+    )
+    parser.add_argument("input", help="Input PowerPoint file (.pptx)")
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Timing repetitions (default: 3)"
+    )
+    parser.add_argument(
+        "--issues-only",
+        action="store_true",
+        help="Compare issues-only inventories",
+    )
+    args = parser.parse_args()
+
+    def run(extract):
+        best = None
+        result = None
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            result = extract(Path(args.input), issues_only=args.issues_only)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return result, best
+
+    pptx_result, pptx_time = run(get_inventory_as_dict)
+    lxml_result, lxml_time = run(get_inventory_as_dict_lxml)
+
+    slides = len(pptx_result)
+    shapes = sum(len(shapes) for shapes in pptx_result.values())
+    identical = pptx_result == lxml_result
+    print(f"{Path(args.input).name}: {slides} slides, {shapes} text shapes")
+    print(f"  python-pptx backend: {pptx_time * 1000:.1f} ms")
+    print(f"  lxml backend:        {lxml_time * 1000:.1f} ms")
+    print(
+        f"  Speedup: {pptx_time / lxml_time:.1f}x, "
+        f"identical output: {'yes' if identical else 'NO'}"
+    )
+    sys.exit(0 if identical else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,19 +4,73 @@ Rearrange PowerPoint slides based on a sequence of indices.
 
 Usage:
     python rearrange.py template.pptx output.pptx 0,34,34,50,52
+    python rearrange.py --benchmark 1000
 
 This will create output.pptx using slides from template.pptx in the specified order.
-Slides can be repeated (e.g., 34 appears twice).
+Slides can be repeated (e.g., 34 appears twice). --benchmark times a rearrangement
+of a generated template with the given number of slides.
 """
 
 import argparse
+import contextlib
+import io
+import random
+import re
 import shutil
 import sys
+import tempfile
+import time
+import zipfile
+from collections import Counter, deque
 from copy import deepcopy
 from pathlib import Path
 
-import six
 from pptx import Presentation
+from pptx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.package import PartFactory, XmlPart, _Relationship
+from pptx.opc.packuri import PackURI
+from pptx.parts.slide import SlidePart
+
+# HD Photo images, which python-pptx has no constant for
+HDPHOTO_RELTYPE = "http://schemas.microsoft.com/office/2007/relationships/hdphoto"
+
+# Relationship types whose targets are read-only resources that any number of
+# slides can share. Other parts a slide relates to (charts, diagrams, embedded
+# objects, comments, tags) hold that slide's own editable content, so each
+# duplicate gets copies of them.
+SHARED_RELTYPES = {
+    RT.SLIDE_LAYOUT,
+    RT.SLIDE,
+    RT.IMAGE,
+    RT.MEDIA,
+    RT.VIDEO,
+    RT.AUDIO,
+    HDPHOTO_RELTYPE,
+}
+
+# Relationship types that are only in use while the source part's XML names
+# their rId (r:embed, r:link, r:id, ...). Other relationships, such as a slide's
+# layout or notes slide, are implied by the part type and always kept.
+EXPLICIT_RELTYPES = {
+    RT.IMAGE,
+    RT.MEDIA,
+    RT.VIDEO,
+    RT.AUDIO,
+    HDPHOTO_RELTYPE,
+    RT.HYPERLINK,
+    RT.CHART,
+    RT.OLE_OBJECT,
+    RT.PACKAGE,
+    RT.DIAGRAM_DATA,
+    RT.DIAGRAM_LAYOUT,
+    RT.DIAGRAM_QUICK_STYLE,
+    RT.DIAGRAM_COLORS,
+}
+
+# Bytes a zip entry takes besides its data and name: the local file header and
+# the central directory record, each of which also repeats the name
+ZIP_ENTRY_OVERHEAD = 30 + 46
 
 
 def main():
@@ -31,18 +85,35 @@ Examples:
   python rearrange.py template.pptx output.pptx 5,3,1,2,4
     Creates output.pptx with slides reordered as specified
 
+  python rearrange.py --benchmark 1000
+    Times rearranging a generated 1,000-slide template
+
 Note: Slide indices are 0-based (first slide is 0, second is 1, etc.)
         """,
     )
 
-    parser.add_argument("template", help="Path to template PPTX file")
-    parser.add_argument("output", help="Path for output PPTX file")
+    parser.add_argument("template", nargs="?", help="Path to template PPTX file")
+    parser.add_argument("output", nargs="?", help="Path for output PPTX file")
+    parser.add_argument(
+        "sequence",
+        nargs="?",
+        help="Comma-separated sequence of slide indices (0-based)",
+    )
     parser.add_argument(
-        "sequence", help="Comma-separated sequence of slide indices (0-based)"
+        "--benchmark",
+        type=int,
+        metavar="SLIDES",
+        help="Time a rearrangement of a generated template with SLIDES slides",
     )
 
     args = parser.parse_args()
 
+    if args.benchmark:
+        benchmark(args.benchmark)
+        return
+    if args.sequence is None:
+        parser.error("template, output and sequence are required")
+
     # Parse the slide sequence
     try:
         slide_sequence = [int(x.strip()) for x in args.sequence.split(",")]
@@ -72,59 +143,88 @@ Note: Slide indices are 0-based (first slide is 0, second is 1, etc.)
         sys.exit(1)
 
 
-def duplicate_slide(pres, index):
-    """Duplicate a slide in the presentation."""
-    source = pres.slides[index]
-
-    # Use source's layout to preserve formatting
-    new_slide = pres.slides.add_slide(source.slide_layout)
-
-    # Collect all image and media relationships from the source slide
-    image_rels = {}
-    for rel_id, rel in six.iteritems(source.part.rels):
-        if "image" in rel.reltype or "media" in rel.reltype:
-            image_rels[rel_id] = rel
-
-    # CRITICAL: Clear placeholder shapes to avoid duplicates
-    for shape in new_slide.shapes:
-        sp = shape.element
-        sp.getparent().remove(sp)
-
-    # Copy all shapes from source
-    for shape in source.shapes:
-        el = shape.element
-        new_el = deepcopy(el)
-        new_slide.shapes._spTree.insert_element_before(new_el, "p:extLst")
-
-        # Handle picture shapes - need to update the blip reference
-        # Look for all blip elements (they can be in pic or other contexts)
-        # Using the element's own xpath method without namespaces argument
-        blips = new_el.xpath(".//a:blip[@r:embed]")
-        for blip in blips:
-            old_rId = blip.get(
-                "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}embed"
+class _PartCloner:
+    """Copies slide parts and the parts they own into the same package."""
+
+    def __init__(self, package):
+        self.package = package
+        self.clones = {}  # source part -> its copy
+        self._partnames = None
+        self._next_index = {}
+
+    def _next_partname(self, partname):
+        """Next free partname numbered like partname, e.g. /ppt/charts/chart%d.xml."""
+        if self._partnames is None:
+            self._partnames = {part.partname for part in self.package.iter_parts()}
+        tmpl = re.sub(r"\d*(\.\w+)$", r"%d\1", partname.replace("%", "%%"))
+        n = self._next_index.get(tmpl, 1)
+        while tmpl % n in self._partnames:
+            n += 1
+        self._next_index[tmpl] = n + 1
+        self._partnames.add(tmpl % n)
+        return PackURI(tmpl % n)
+
+    def clone(self, part):
+        """Return a copy of part, copying each part only once."""
+        copy = self.clones.get(part)
+        if copy is None:
+            copy = self.clones[part] = PartFactory(
+                self._next_partname(part.partname),
+                part.content_type,
+                self.package,
+                part.blob,
             )
-            if old_rId in image_rels:
-                # Create a new relationship in the destination slide for this image
-                old_rel = image_rels[old_rId]
-                # get_or_add returns the rId directly, or adds and returns new rId
-                new_rId = new_slide.part.rels.get_or_add(
-                    old_rel.reltype, old_rel._target
-                )
-                # Update the blip's embed reference to use the new relationship ID
-                blip.set(
-                    "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}embed",
-                    new_rId,
-                )
-
-    # Copy any additional image/media relationships that might be referenced elsewhere
-    for rel_id, rel in image_rels.items():
-        try:
-            new_slide.part.rels.get_or_add(rel.reltype, rel._target)
-        except Exception:
-            pass  # Relationship might already exist
-
-    return new_slide
+            self.copy_rels(part, copy)
+        return copy
+
+    def copy_rels(self, source, target):
+        """Give target the relationships of source, under the same rIds.
+
+        Keeping the rIds means the copied XML needs no rewriting. Notes slides
+        are not copied, matching python-pptx's add_slide().
+        """
+        rels = target.rels
+        for rId, rel in source.rels.items():
+            if rel.is_external:
+                rel_target = rel.target_ref
+            elif rel.reltype == RT.NOTES_SLIDE:
+                continue
+            elif rel.target_part in self.clones:
+                rel_target = self.clones[rel.target_part]
+            elif rel.reltype in SHARED_RELTYPES:
+                rel_target = rel.target_part
+            else:
+                rel_target = self.clone(rel.target_part)
+            rels._rels[rId] = _Relationship(
+                rels._base_uri,
+                rId,
+                rel.reltype,
+                RTM.EXTERNAL if rel.is_external else RTM.INTERNAL,
+                rel_target,
+            )
+
+
+def duplicate_slide(pres, index):
+    """Duplicate a slide in the presentation, appending the copy at the end.
+
+    The slide XML is copied in one piece and its relationships are copied
+    with the same rIds. Images and media are shared with the source slide;
+    charts, diagrams and embedded objects are copied (see SHARED_RELTYPES).
+    """
+    source_part = pres.slides[index].part
+    new_part = SlidePart(
+        pres.part._next_slide_partname,
+        source_part.content_type,
+        pres.part.package,
+        deepcopy(source_part._element),
+    )
+    cloner = _PartCloner(pres.part.package)
+    cloner.clones[source_part] = new_part
+    cloner.copy_rels(source_part, new_part)
+
+    rId = pres.part.relate_to(new_part, RT.SLIDE)
+    pres.slides._sldIdLst.add_sldId(rId)
+    return new_part.slide
 
 
 def delete_slide(pres, index):
@@ -146,6 +246,73 @@ def reorder_slides(pres, slide_index, target_index):
     slides.insert(target_index, slide_element)
 
 
+def delete_slides(pres, sld_ids):
+    """Delete several slides, given their p:sldId elements, in one pass."""
+    sld_id_lst = pres.slides._sldIdLst
+    for sld_id in sld_ids:
+        sld_id_lst.remove(sld_id)
+
+    # Drop each slide's relationship unless something else still refers to it
+    # (the check drop_rel() makes, done once for the whole batch)
+    referenced = set(pres.part._element.xpath("//@r:id"))
+    for sld_id in sld_ids:
+        if sld_id.rId not in referenced:
+            pres.part.rels.pop(sld_id.rId)
+
+
+def part_sizes(pres, pptx_path):
+    """Bytes each part of pres (with its .rels) takes in the pptx_path zip.
+
+    Call right after loading, before parts are added or renamed.
+    """
+    with zipfile.ZipFile(pptx_path) as zf:
+        sizes = {
+            info.filename: info.compress_size
+            + ZIP_ENTRY_OVERHEAD
+            + 2 * len(info.filename.encode("utf-8"))
+            for info in zf.infolist()
+        }
+    return {
+        part: sizes.get(part.partname.membername, 0)
+        + sizes.get(part.partname.rels_uri.membername, 0)
+        for part in pres.part.package.iter_parts()
+    }
+
+
+def collect_garbage(pres, original_sizes):
+    """Drop relationships nothing refers to and count the parts left unreachable.
+
+    python-pptx saves only the parts reachable from the package root, so
+    deleted slides, their notes and media only they used are left out once
+    nothing relates to them. Media can still be kept alive by relationships
+    whose rId the XML no longer names (e.g. after a picture is removed);
+    those are dropped here.
+
+    Args:
+        pres: Presentation about to be saved
+        original_sizes: part_sizes() of the presentation as loaded
+
+    Returns:
+        (number of original parts no longer saved, their bytes in the zip)
+    """
+    for part in list(pres.part.package.iter_parts()):
+        if not isinstance(part, XmlPart):
+            continue
+        referenced = set(
+            part._element.xpath(
+                "//@*[namespace-uri()="
+                "'http://schemas.openxmlformats.org/officeDocument/2006/relationships']"
+            )
+        )
+        for rId, rel in list(part.rels.items()):
+            if rel.reltype in EXPLICIT_RELTYPES and rId not in referenced:
+                part.rels.pop(rId)
+
+    reachable = set(pres.part.package.iter_parts())
+    orphans = [part for part in original_sizes if part not in reachable]
+    return len(orphans), sum(original_sizes[part] for part in orphans)
+
+
 def rearrange_presentation(template_path, output_path, slide_sequence):
     """
     Create a new presentation with slides from template in specified order.
@@ -161,6 +328,7 @@ def rearrange_presentation(template_path, output_path, slide_sequence):
         prs = Presentation(output_path)
     else:
         prs = Presentation(template_path)
+    original_sizes = part_sizes(prs, output_path)
 
     total_slides = len(prs.slides)
 
@@ -169,57 +337,51 @@ def rearrange_presentation(template_path, output_path, slide_sequence):
         if idx < 0 or idx >= total_slides:
             raise ValueError(f"Slide index {idx} out of range (0-{total_slides - 1})")
 
-    # Track original slides and their duplicates
-    slide_map = []  # List of actual slide indices for final presentation
-    duplicated = {}  # Track duplicates: original_idx -> [duplicate_indices]
+    # Slides are tracked by their p:sldId elements, which keep their identity
+    # while the list is edited
+    sld_id_lst = prs.slides._sldIdLst
+    template_ids = list(sld_id_lst)
+    counts = Counter(slide_sequence)
+    final_order = []  # p:sldId elements of the final presentation, in order
+    duplicated = {}  # Track duplicates: original_idx -> unused duplicate sldIds
 
     # Step 1: DUPLICATE repeated slides
     print(f"Processing {len(slide_sequence)} slides from template...")
     for i, template_idx in enumerate(slide_sequence):
-        if template_idx in duplicated and duplicated[template_idx]:
+        if duplicated.get(template_idx):
             # Already duplicated this slide, use the duplicate
-            slide_map.append(duplicated[template_idx].pop(0))
+            final_order.append(duplicated[template_idx].popleft())
             print(f"  [{i}] Using duplicate of slide {template_idx}")
-        elif slide_sequence.count(template_idx) > 1 and template_idx not in duplicated:
+        elif counts[template_idx] > 1 and template_idx not in duplicated:
             # First occurrence of a repeated slide - create duplicates
-            slide_map.append(template_idx)
-            duplicates = []
-            count = slide_sequence.count(template_idx) - 1
+            final_order.append(template_ids[template_idx])
+            duplicates = deque()
+            count = counts[template_idx] - 1
             print(
                 f"  [{i}] Using original slide {template_idx}, creating {count} duplicate(s)"
             )
             for _ in range(count):
                 duplicate_slide(prs, template_idx)
-                duplicates.append(len(prs.slides) - 1)
+                duplicates.append(sld_id_lst[-1])
             duplicated[template_idx] = duplicates
         else:
             # Unique slide or first occurrence already handled, use original
-            slide_map.append(template_idx)
+            final_order.append(template_ids[template_idx])
             print(f"  [{i}] Using original slide {template_idx}")
 
-    # Step 2: DELETE unwanted slides (work backwards)
-    slides_to_keep = set(slide_map)
-    print(f"\nDeleting {len(prs.slides) - len(slides_to_keep)} unused slides...")
-    for i in range(len(prs.slides) - 1, -1, -1):
-        if i not in slides_to_keep:
-            delete_slide(prs, i)
-            # Update slide_map indices after deletion
-            slide_map = [idx - 1 if idx > i else idx for idx in slide_map]
-
-    # Step 3: REORDER to final sequence
-    print(f"Reordering {len(slide_map)} slides to final sequence...")
-    for target_pos in range(len(slide_map)):
-        # Find which slide should be at target_pos
-        current_pos = slide_map[target_pos]
-        if current_pos != target_pos:
-            reorder_slides(prs, current_pos, target_pos)
-            # Update slide_map: the move shifts other slides
-            for i in range(len(slide_map)):
-                if slide_map[i] > current_pos and slide_map[i] <= target_pos:
-                    slide_map[i] -= 1
-                elif slide_map[i] < current_pos and slide_map[i] >= target_pos:
-                    slide_map[i] += 1
-            slide_map[target_pos] = target_pos
+    # Step 2: DELETE unwanted slides in one batch
+    slides_to_keep = set(final_order)
+    unused = [sld_id for sld_id in sld_id_lst if sld_id not in slides_to_keep]
+    print(f"\nDeleting {len(unused)} unused slides...")
+    delete_slides(prs, unused)
+
+    # Step 3: REORDER to final sequence by rebuilding the slide list once
+    print(f"Reordering {len(final_order)} slides to final sequence...")
+    sld_id_lst[:] = final_order
+
+    # Step 4: drop parts nothing refers to any more
+    orphan_count, reclaimed = collect_garbage(prs, original_sizes)
+    print(f"Removed {orphan_count} orphaned parts ({reclaimed:,} bytes reclaimed)")
 
     # Save the presentation
     prs.save(output_path)
@@ -227,5 +389,37 @@ def rearrange_presentation(template_path, output_path, slide_sequence):
     print(f"Final presentation has {len(prs.slides)} slides")
 
 
+def benchmark(slide_count):
+    """Time rearrange_presentation on a generated template of slide_count slides.
+
+    The sequence keeps three quarters of the slides in shuffled order and
+    repeats others, so it exercises duplication, deletion and reordering.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        template_path = Path(tmp_dir) / "template.pptx"
+        output_path = Path(tmp_dir) / "output.pptx"
+
+        prs = Presentation()
+        for i in range(slide_count):
+            slide = prs.slides.add_slide(prs.slide_layouts[1])
+            slide.shapes.title.text = f"Slide {i}"
+        prs.save(template_path)
+
+        rng = random.Random(0)
+        slide_sequence = rng.sample(range(slide_count), slide_count * 3 // 4)
+        slide_sequence += rng.choices(range(slide_count), k=slide_count // 4)
+        rng.shuffle(slide_sequence)
+
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            rearrange_presentation(template_path, output_path, slide_sequence)
+        elapsed = time.perf_counter() - start
+
+    print(
+        f"Rearranged a {slide_count}-slide template into {len(slide_sequence)} slides "
+        f"({len(set(slide_sequence))} distinct) in {elapsed:.2f}s"
+    )
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,172 @@
+"""
+On-disk cache of rendered slide images.
+
+Each slide's image is stored under a hash of everything its rendering
+depends on: the slide XML, its layout, master and theme, the media, charts
+and other parts they use, and a context string supplied by the caller
+(slide size, resolution). Re-running thumbnail.py on a deck where one slide
+changed renders only that slide; the other tiles come from the cache.
+Entries are content-addressed, so identical slides in different decks share
+them.
+
+Slides whose text uses fields (a:fld) also key on their slide number, so a
+moved slide is rendered again with its new number. Date and time fields are
+not tracked: a cached image keeps the date it was rendered with until the
+slide changes.
+
+Classes:
+    RenderCache: Content-addressed store of rendered slide images
+
+Main Functions:
+    get_default_cache: Return the cache configured by PPTX_RENDER_CACHE
+
+Entries are JPEG files under <cache_dir>/<first two hash chars>/<hash>.jpg.
+Stale entries are never read again and can be removed by deleting the
+directory.
+"""
+
+import hashlib
+import os
+import shutil
+import weakref
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.package import XmlPart
+
+# Environment variable naming a cache directory used by default
+CACHE_ENV_VAR = "PPTX_RENDER_CACHE"
+
+# Bump whenever rendering changes for the same input
+CACHE_VERSION = 1
+
+# Text fields (a:fld), anywhere and outside placeholder shapes
+FIELD_XPATH = ".//a:fld"
+UNPLACED_FIELD_XPATH = ".//p:sp[not(p:nvSpPr/p:nvPr/p:ph)]//a:fld"
+
+
+class RenderCache:
+    """Rendered slide images stored on disk, keyed by content hash."""
+
+    def __init__(self, cache_dir: Union[str, Path]):
+        """Create a cache.
+
+        Args:
+            cache_dir: Directory holding the entries (created on first write)
+        """
+        self.cache_dir = Path(cache_dir).expanduser()
+        # Layouts, masters, themes and media are shared by many slides; hash
+        # each once
+        self._part_digests: "weakref.WeakKeyDictionary[Any, bytes]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._part_fields: "weakref.WeakKeyDictionary[Any, bool]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self.hits = 0
+        self.misses = 0
+
+    def _part_digest(self, part: Any) -> bytes:
+        digest = self._part_digests.get(part)
+        if digest is None:
+            digest = self._part_digests[part] = hashlib.sha256(part.blob).digest()
+        return digest
+
+    def _has_fields(self, part: Any, is_slide: bool) -> bool:
+        """Whether a part draws text fields (slide number, date, ...).
+
+        Placeholders on layouts and masters only show up through the slide's
+        own placeholders, so only their other shapes count.
+        """
+        has_fields = self._part_fields.get(part)
+        if has_fields is None:
+            xpath = FIELD_XPATH if is_slide else UNPLACED_FIELD_XPATH
+            has_fields = isinstance(part, XmlPart) and bool(part._element.xpath(xpath))
+            self._part_fields[part] = has_fields
+        return has_fields
+
+    def slide_key(
+        self, slide: Any, context: str = "", slide_number: Optional[int] = None
+    ) -> str:
+        """Return the cache key for a python-pptx slide.
+
+        The key covers the slide part and every part it depends on for
+        rendering, found by following relationships from the slide. Links to
+        other slides, notes slides and a master's other layouts are not
+        followed, since they do not change how the slide looks. Part names
+        are left out: saving renumbers slide parts, and a moved slide looks
+        the same.
+
+        If the slide, or a non-placeholder shape on its layout or master,
+        contains a text field, slide_number is part of the key too, since a
+        slide number field renders differently once the slide moves. Date and
+        time fields still render with the date of the run that cached the
+        image.
+
+        Args:
+            slide: Slide whose image is looked up or stored
+            context: Everything else the image depends on, e.g. slide size and
+                resolution
+            slide_number: 1-based position of the slide in its deck
+
+        Returns:
+            Hex digest identifying the slide's image
+        """
+        key = hashlib.sha256()
+        key.update(f"{CACHE_VERSION}\0{context}\0".encode("utf-8"))
+
+        slide_part = slide.part
+        visited = {slide_part}
+        pending = [slide_part]
+        has_fields = False
+        while pending:
+            part = pending.pop()
+            key.update(self._part_digest(part))
+            has_fields = has_fields or self._has_fields(part, part is slide_part)
+            for rId, rel in sorted(part.rels.items()):
+                key.update(f"\0{rId}\0{rel.reltype}\0".encode("utf-8"))
+                if rel.is_external:
+                    key.update(rel.target_ref.encode("utf-8"))
+                    continue
+                if rel.reltype in (RT.SLIDE, RT.NOTES_SLIDE):
+                    continue
+                if rel.reltype == RT.SLIDE_LAYOUT and part is not slide_part:
+                    continue
+                if rel.target_part not in visited:
+                    visited.add(rel.target_part)
+                    pending.append(rel.target_part)
+
+        if has_fields:
+            key.update(f"\0slide {slide_number}".encode("utf-8"))
+        return key.hexdigest()
+
+    def path(self, key: str) -> Path:
+        """Return where the image stored under key lives (it may not exist)."""
+        return self.cache_dir / key[:2] / f"{key}.jpg"
+
+    def get(self, key: str) -> Optional[Path]:
+        """Return the path of the image stored under key, or None if there is none."""
+        path = self.path(key)
+        if not path.is_file():
+            self.misses += 1
+            return None
+        self.hits += 1
+        return path
+
+    def put(self, key: str, image_path: Union[str, Path]) -> None:
+        """Store a copy of a rendered image under key (best effort)."""
+        path = self.path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            shutil.copyfile(image_path, tmp_path)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+
+def get_default_cache() -> Optional[RenderCache]:
+    """Return a cache in the directory named by PPTX_RENDER_CACHE, if set."""
+    cache_dir = os.environ.get(CACHE_ENV_VAR)
+    return RenderCache(cache_dir) if cache_dir else None
@@ -0,0 +1,81 @@
+import contextlib
+import io
+import tempfile
+import unittest
+from pathlib import Path
+
+from lxml import etree
+from PIL import Image
+from pptx import Presentation
+from pptx.util import Inches
+from rearrange import rearrange_presentation
+from render_cache import RenderCache
+
+A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+
+
+class TestSlideKey(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp_dir.name)
+        image_path = self.root / "image.png"
+        Image.new("RGB", (8, 8), "red").save(image_path)
+
+        prs = Presentation()
+        for idx in range(5):
+            slide = prs.slides.add_slide(prs.slide_layouts[6])
+            box = slide.shapes.add_textbox(0, 0, Inches(4), Inches(1))
+            box.text_frame.text = f"Slide {idx}"
+            if idx == 2:
+                slide.shapes.add_picture(str(image_path), Inches(1), Inches(2))
+            if idx == 3:
+                slide.notes_slide.notes_text_frame.text = "Notes"
+            if idx == 4:
+                paragraph = box.text_frame.paragraphs[0]._p
+                field = etree.SubElement(paragraph, f"{{{A_NS}}}fld")
+                field.set("id", "{B6F15528-21DE-4FAA-801E-634DDDAF4B2B}")
+                field.set("type", "slidenum")
+        self.deck = self.root / "deck.pptx"
+        prs.save(self.deck)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def slide_keys(self, path, cache):
+        prs = Presentation(path)
+        return [
+            cache.slide_key(slide, "context", slide_num)
+            for slide_num, slide in enumerate(prs.slides, 1)
+        ]
+
+    def test_reordered_deck_is_served_from_cache(self):
+        """Moving slides changes no key except for slides with fields"""
+        reordered = self.root / "reordered.pptx"
+        with contextlib.redirect_stdout(io.StringIO()):
+            rearrange_presentation(self.deck, reordered, [1, 2, 3, 0, 4])
+
+        cache = RenderCache(self.root / "cache")
+        keys = self.slide_keys(self.deck, cache)
+        for key in keys:
+            cache.put(key, self.deck)
+        moved_keys = self.slide_keys(reordered, cache)
+
+        self.assertEqual(moved_keys[:4], [keys[1], keys[2], keys[3], keys[0]])
+        self.assertTrue(all(cache.get(key) for key in moved_keys))
+        self.assertEqual(cache.misses, 0)
+
+    def test_slide_number_field_keys_on_position(self):
+        cache = RenderCache(self.root / "cache")
+        slides = Presentation(self.deck).slides
+        self.assertNotEqual(
+            cache.slide_key(slides[4], "context", 5),
+            cache.slide_key(slides[4], "context", 4),
+        )
+        self.assertEqual(
+            cache.slide_key(slides[0], "context", 1),
+            cache.slide_key(slides[0], "context", 2),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
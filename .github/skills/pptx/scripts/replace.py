@@ -2,19 +2,42 @@
 """Apply text replacements to PowerPoint presentation.
 
 Usage:
-    python replace.py <input.pptx> <replacements.json> <output.pptx>
+    python replace.py <input.pptx> <replacements.json> <output.pptx> [--only-listed]
+    python replace.py --batch <template.pptx> <manifest.json> [--jobs N] [--only-listed]
 
 The replacements JSON should have the structure output by inventory.py.
 ALL text shapes identified by inventory.py will have their text cleared
 unless "paragraphs" is specified in the replacements for that shape.
+
+With --only-listed, only the shapes listed in the replacements JSON are
+cleared, filled and re-measured; all other shapes keep their text. This is
+much faster when a few shapes of a large deck change.
+
+Batch mode renders many outputs from one template. The manifest lists
+{"replacements": <json>, "output": <pptx>} entries (JSON array or JSON Lines);
+the template is loaded and inventoried once per worker process, and one JSON
+report line per output (saved or not, overflow regressions, warnings) is
+printed as outputs finish.
 """
 
+import argparse
 import json
+import multiprocessing
+import os
 import sys
+import time
+from copy import deepcopy
 from pathlib import Path
-from typing import Any, Dict, List
-
-from inventory import InventoryData, extract_text_inventory
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from inventory import (
+    InventoryData,
+    ShapeData,
+    StyleCache,
+    extract_listed_shapes,
+    extract_text_inventory,
+    is_valid_shape,
+)
 from pptx import Presentation
 from pptx.dml.color import RGBColor
 from pptx.enum.dml import MSO_THEME_COLOR
@@ -159,6 +182,38 @@ def detect_frame_overflow(inventory: InventoryData) -> Dict[str, Dict[str, float
     return overflow_map
 
 
+def remeasure_shapes(
+    prs: Any, inventory: InventoryData, shape_keys: Dict[str, List[str]]
+) -> InventoryData:
+    """Rebuild the inventory entries of the given shapes from their current text.
+
+    Shapes keep their original keys and positions; shapes left without text
+    are dropped, as a fresh inventory would drop them.
+
+    Args:
+        prs: Presentation the inventory was extracted from
+        inventory: Inventory whose ShapeData hold the live shapes
+        shape_keys: slide_key -> keys of the shapes to re-measure
+
+    Returns:
+        Nested dictionary {slide-N: {shape-N: ShapeData}} of the re-measured shapes
+    """
+    styles = StyleCache()
+    updated: InventoryData = {}
+    for slide_key, keys in shape_keys.items():
+        slide = prs.slides[int(slide_key.split("-")[1])]
+        for shape_key in keys:
+            original = inventory[slide_key][shape_key]
+            if not is_valid_shape(original.shape):
+                continue
+            shape_data = ShapeData(
+                original.shape, original.left_emu, original.top_emu, slide, styles
+            )
+            shape_data.shape_id = shape_key
+            updated.setdefault(slide_key, {})[shape_key] = shape_data
+    return updated
+
+
 def validate_replacements(inventory: InventoryData, replacements: Dict) -> List[str]:
     """Validate that all shapes in replacements exist in inventory.
 
@@ -211,25 +266,231 @@ def check_duplicate_keys(pairs):
     return result
 
 
-def apply_replacements(pptx_file: str, json_file: str, output_file: str):
-    """Apply text replacements from JSON to PowerPoint presentation."""
+def load_replacements(json_file: str) -> Dict:
+    """Load replacement data with duplicate key detection."""
+    with open(json_file, "r") as f:
+        return json.load(f, object_pairs_hook=check_duplicate_keys)
+
+
+class ReplacementTemplate:
+    """A template presentation and its inventory, loaded once for many outputs.
 
-    # Load presentation
-    prs = Presentation(pptx_file)
+    Replacements only rewrite the text bodies of inventoried shapes, so the
+    template is reused by restoring copies of those text bodies (reset())
+    instead of re-reading the file and re-measuring every shape per output.
+    """
 
-    # Get inventory of all text shapes (returns ShapeData objects)
-    # Pass prs to use same Presentation instance
-    inventory = extract_text_inventory(Path(pptx_file), prs)
+    def __init__(
+        self, pptx_file: str, shape_keys: Optional[Dict[str, Iterable[str]]] = None
+    ):
+        """Load the presentation and inventory its text shapes.
+
+        Args:
+            pptx_file: Path to the template PowerPoint file
+            shape_keys: Optional slide_key -> shape keys; only these shapes are
+                inventoried (and so can be filled), instead of every text shape
+        """
+        self.pptx_file = pptx_file
+
+        # Load presentation
+        self.prs = Presentation(pptx_file)
+
+        # Get inventory of all text shapes (returns ShapeData objects)
+        # Pass prs to use same Presentation instance
+        if shape_keys is None:
+            self.inventory = extract_text_inventory(Path(pptx_file), self.prs)
+        else:
+            self.inventory = extract_listed_shapes(self.prs, shape_keys)
+
+        # Detect text overflow in original presentation
+        self.original_overflow = detect_frame_overflow(self.inventory)
+
+        # Pristine text bodies of the shapes that replacements rewrite
+        self._text_bodies = [
+            (shape_data.shape._element, deepcopy(shape_data.shape._element.txBody))
+            for shapes_dict in self.inventory.values()
+            for shape_data in shapes_dict.values()
+        ]
+
+    def reset(self) -> None:
+        """Restore the template text of every inventoried shape."""
+        for sp, txBody in self._text_bodies:
+            sp.replace(sp.txBody, deepcopy(txBody))
+
+    def fill(self, replacements: Dict, clear_unlisted: bool = True) -> Dict[str, Any]:
+        """Clear inventoried shapes and add the replacement paragraphs.
+
+        Args:
+            replacements: Replacement data keyed like the inventory
+            clear_unlisted: Also clear shapes that the replacements do not list;
+                if False, only listed shapes are touched
+
+        Returns:
+            Statistics and the keys of the shapes that received paragraphs
+        """
+        prs = self.prs
+
+        # Track statistics
+        shapes_processed = 0
+        shapes_cleared = 0
+        shapes_replaced = 0
+        replaced_shapes: Dict[str, List[str]] = {}
+
+        # Process each slide from inventory
+        for slide_key, shapes_dict in self.inventory.items():
+            if not slide_key.startswith("slide-"):
+                continue
 
-    # Detect text overflow in original presentation
-    original_overflow = detect_frame_overflow(inventory)
+            slide_index = int(slide_key.split("-")[1])
 
-    # Load replacement data with duplicate key detection
-    with open(json_file, "r") as f:
-        replacements = json.load(f, object_pairs_hook=check_duplicate_keys)
+            if slide_index >= len(prs.slides):
+                print(f"Warning: Slide {slide_index} not found")
+                continue
+
+            # Process each shape from inventory
+            listed = replacements.get(slide_key, {})
+            for shape_key, shape_data in shapes_dict.items():
+                if not clear_unlisted and shape_key not in listed:
+                    continue
+                shapes_processed += 1
+
+                # Get the shape directly from ShapeData
+                shape = shape_data.shape
+                if not shape:
+                    print(f"Warning: {shape_key} has no shape reference")
+                    continue
+
+                # ShapeData already validates text_frame in __init__
+                text_frame = shape.text_frame  # type: ignore
+
+                text_frame.clear()  # type: ignore
+                shapes_cleared += 1
+
+                # Check for replacement paragraphs
+                replacement_shape_data = listed.get(shape_key, {})
+                if "paragraphs" not in replacement_shape_data:
+                    continue
+
+                shapes_replaced += 1
+                replaced_shapes.setdefault(slide_key, []).append(shape_key)
+
+                # Add replacement paragraphs
+                for i, para_data in enumerate(replacement_shape_data["paragraphs"]):
+                    if i == 0:
+                        p = text_frame.paragraphs[0]  # type: ignore
+                    else:
+                        p = text_frame.add_paragraph()  # type: ignore
+
+                    apply_paragraph_properties(p, para_data)
+
+        return {
+            "shapes_processed": shapes_processed,
+            "shapes_cleared": shapes_cleared,
+            "shapes_replaced": shapes_replaced,
+            "replaced_shapes": replaced_shapes,
+        }
+
+    def check(
+        self, replaced_shapes: Dict[str, List[str]]
+    ) -> Tuple[List[str], List[str]]:
+        """Find overflow regressions and formatting warnings after fill().
+
+        Returns:
+            Tuple of (overflow error messages, warning messages)
+        """
+        # Inventory extraction leaves the presentation unchanged, so the replaced
+        # shapes are re-measured in memory; every other inventoried shape was
+        # cleared and cannot overflow.
+        updated_inventory = remeasure_shapes(self.prs, self.inventory, replaced_shapes)
+        updated_overflow = detect_frame_overflow(updated_inventory)
+
+        # Check if any text overflow got worse
+        overflow_errors = []
+        for slide_key, shape_overflows in updated_overflow.items():
+            for shape_key, new_overflow in shape_overflows.items():
+                # Get original overflow (0 if there was no overflow before)
+                original = self.original_overflow.get(slide_key, {}).get(shape_key, 0.0)
+
+                # Error if overflow increased
+                if new_overflow > original + 0.01:  # Small tolerance for rounding
+                    increase = new_overflow - original
+                    overflow_errors.append(
+                        f"{slide_key}/{shape_key}: "
+                        f'overflow worsened by {increase:.2f}" '
+                        f'(was {original:.2f}", now {new_overflow:.2f}")'
+                    )
+
+        # Collect warnings from updated shapes
+        warnings = []
+        for slide_key, shapes_dict in updated_inventory.items():
+            for shape_key, shape_data in shapes_dict.items():
+                if shape_data.warnings:
+                    for warning in shape_data.warnings:
+                        warnings.append(f"{slide_key}/{shape_key}: {warning}")
+
+        return overflow_errors, warnings
+
+    def render(
+        self, json_file: str, output_file: str, clear_unlisted: bool = True
+    ) -> Dict[str, Any]:
+        """Apply one replacement set and save it if it introduces no issues.
+
+        The template is reset first, so outputs do not affect each other.
+        Problems are reported in the result instead of being raised or printed.
+        See fill() for clear_unlisted.
+
+        Returns:
+            JSON-serializable report for the output
+        """
+        start = time.perf_counter()
+        report: Dict[str, Any] = {
+            "replacements": str(json_file),
+            "output": str(output_file),
+            "saved": False,
+        }
+        try:
+            replacements = load_replacements(json_file)
+            errors = validate_replacements(self.inventory, replacements)
+            if errors:
+                report["validation_errors"] = errors
+            else:
+                self.reset()
+                stats = self.fill(replacements, clear_unlisted)
+                overflow_errors, warnings = self.check(stats.pop("replaced_shapes"))
+                report.update(stats)
+                report["overflow_errors"] = overflow_errors
+                report["warnings"] = warnings
+                if not overflow_errors and not warnings:
+                    Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+                    self.prs.save(output_file)
+                    report["saved"] = True
+        except Exception as e:
+            report["error"] = f"{type(e).__name__}: {e}"
+        report["seconds"] = round(time.perf_counter() - start, 3)
+        return report
+
+
+def apply_replacements(
+    pptx_file: str, json_file: str, output_file: str, clear_unlisted: bool = True
+):
+    """Apply text replacements from JSON to PowerPoint presentation.
+
+    With clear_unlisted=False, only the shapes listed in the JSON are cleared,
+    filled and re-measured; every other shape is left as it is.
+    """
+
+    replacements = load_replacements(json_file)
+    template = ReplacementTemplate(
+        pptx_file, shape_keys=None if clear_unlisted else replacements
+    )
 
     # Validate replacements
-    errors = validate_replacements(inventory, replacements)
+    errors = validate_replacements(template.inventory, replacements)
+    if errors and not clear_unlisted:
+        # List the slide's other shapes in the messages, as a full inventory would
+        errors = validate_replacements(
+            extract_text_inventory(Path(pptx_file), template.prs), replacements
+        )
     if errors:
         print("ERROR: Invalid shapes in replacement JSON:")
         for error in errors:
@@ -240,91 +501,10 @@ def apply_replacements(pptx_file: str, json_file: str, output_file: str):
         )
         raise ValueError(f"Found {len(errors)} validation error(s)")
 
-    # Track statistics
-    shapes_processed = 0
-    shapes_cleared = 0
-    shapes_replaced = 0
-
-    # Process each slide from inventory
-    for slide_key, shapes_dict in inventory.items():
-        if not slide_key.startswith("slide-"):
-            continue
-
-        slide_index = int(slide_key.split("-")[1])
-
-        if slide_index >= len(prs.slides):
-            print(f"Warning: Slide {slide_index} not found")
-            continue
-
-        # Process each shape from inventory
-        for shape_key, shape_data in shapes_dict.items():
-            shapes_processed += 1
-
-            # Get the shape directly from ShapeData
-            shape = shape_data.shape
-            if not shape:
-                print(f"Warning: {shape_key} has no shape reference")
-                continue
-
-            # ShapeData already validates text_frame in __init__
-            text_frame = shape.text_frame  # type: ignore
-
-            text_frame.clear()  # type: ignore
-            shapes_cleared += 1
-
-            # Check for replacement paragraphs
-            replacement_shape_data = replacements.get(slide_key, {}).get(shape_key, {})
-            if "paragraphs" not in replacement_shape_data:
-                continue
-
-            shapes_replaced += 1
-
-            # Add replacement paragraphs
-            for i, para_data in enumerate(replacement_shape_data["paragraphs"]):
-                if i == 0:
-                    p = text_frame.paragraphs[0]  # type: ignore
-                else:
-                    p = text_frame.add_paragraph()  # type: ignore
-
-                apply_paragraph_properties(p, para_data)
+    stats = template.fill(replacements, clear_unlisted)
 
     # Check for issues after replacements
-    # Save to a temporary file and reload to avoid modifying the presentation during inventory
-    # (extract_text_inventory accesses font.color which adds empty <a:solidFill/> elements)
-    import tempfile
-
-    with tempfile.NamedTemporaryFile(suffix=".pptx", delete=False) as tmp:
-        tmp_path = Path(tmp.name)
-        prs.save(str(tmp_path))
-
-    try:
-        updated_inventory = extract_text_inventory(tmp_path)
-        updated_overflow = detect_frame_overflow(updated_inventory)
-    finally:
-        tmp_path.unlink()  # Clean up temp file
-
-    # Check if any text overflow got worse
-    overflow_errors = []
-    for slide_key, shape_overflows in updated_overflow.items():
-        for shape_key, new_overflow in shape_overflows.items():
-            # Get original overflow (0 if there was no overflow before)
-            original = original_overflow.get(slide_key, {}).get(shape_key, 0.0)
-
-            # Error if overflow increased
-            if new_overflow > original + 0.01:  # Small tolerance for rounding
-                increase = new_overflow - original
-                overflow_errors.append(
-                    f'{slide_key}/{shape_key}: overflow worsened by {increase:.2f}" '
-                    f'(was {original:.2f}", now {new_overflow:.2f}")'
-                )
-
-    # Collect warnings from updated shapes
-    warnings = []
-    for slide_key, shapes_dict in updated_inventory.items():
-        for shape_key, shape_data in shapes_dict.items():
-            if shape_data.warnings:
-                for warning in shape_data.warnings:
-                    warnings.append(f"{slide_key}/{shape_key}: {warning}")
+    overflow_errors, warnings = template.check(stats["replaced_shapes"])
 
     # Fail if there are any issues
     if overflow_errors or warnings:
@@ -343,25 +523,161 @@ def apply_replacements(pptx_file: str, json_file: str, output_file: str):
         )
 
     # Save the presentation
-    prs.save(output_file)
+    template.prs.save(output_file)
 
     # Report results
     print(f"Saved updated presentation to: {output_file}")
-    print(f"Processed {len(prs.slides)} slides")
-    print(f"  - Shapes processed: {shapes_processed}")
-    print(f"  - Shapes cleared: {shapes_cleared}")
-    print(f"  - Shapes replaced: {shapes_replaced}")
+    print(f"Processed {len(template.prs.slides)} slides")
+    print(f"  - Shapes processed: {stats['shapes_processed']}")
+    print(f"  - Shapes cleared: {stats['shapes_cleared']}")
+    print(f"  - Shapes replaced: {stats['shapes_replaced']}")
+
+
+def load_batch_manifest(manifest_path: str) -> List[Tuple[str, str]]:
+    """Load (replacements_json, output_pptx) pairs from a manifest file.
+
+    The manifest is either a JSON array or JSON Lines. Each entry is an object
+    with "replacements" and "output" keys, or a two-element list.
+    """
+    text = Path(manifest_path).read_text(encoding="utf-8")
+    try:
+        entries = json.loads(text)
+        if not isinstance(entries, list):
+            entries = [entries]
+    except json.JSONDecodeError:
+        entries = [json.loads(line) for line in text.splitlines() if line.strip()]
+
+    pairs = []
+    for entry in entries:
+        if isinstance(entry, dict):
+            pairs.append((entry["replacements"], entry["output"]))
+        else:
+            json_file, output_file = entry
+            pairs.append((json_file, output_file))
+    return pairs
+
+
+# Per-process template of batch worker processes (see _init_batch_worker)
+_worker_template: Optional[ReplacementTemplate] = None
+
+
+def _init_batch_worker(pptx_file: str) -> None:
+    """Pool initializer: load the template and its inventory once per worker."""
+    global _worker_template
+    _worker_template = ReplacementTemplate(pptx_file)
+
+
+def _render_pair(task: Tuple[str, str, bool]) -> Dict[str, Any]:
+    json_file, output_file, clear_unlisted = task
+    return _worker_template.render(  # type: ignore[union-attr]
+        json_file, output_file, clear_unlisted
+    )
+
+
+def apply_replacement_batch(
+    pptx_file: str,
+    pairs: Iterable[Tuple[str, str]],
+    jobs: Optional[int] = None,
+    clear_unlisted: bool = True,
+) -> Iterator[Dict[str, Any]]:
+    """Apply many replacement sets to one template, yielding reports as they finish.
+
+    Each worker process loads the template and its inventory once, then
+    renders its share of the outputs from that copy. An output is saved only
+    if it passes the same checks as apply_replacements.
+
+    Args:
+        pptx_file: Path to the template PowerPoint file
+        pairs: Iterable of (replacements_json, output_pptx) tuples
+        jobs: Number of worker processes (default: CPU count). 1 runs in-process.
+        clear_unlisted: Also clear shapes that a replacement set does not list
+
+    Yields:
+        dict: Report from ReplacementTemplate.render for each output, in
+        completion order
+    """
+    jobs = jobs or os.cpu_count() or 1
+    tasks = [
+        (str(json_file), str(output_file), clear_unlisted)
+        for json_file, output_file in pairs
+    ]
+
+    if jobs == 1 or len(tasks) <= 1:
+        _init_batch_worker(pptx_file)
+        for task in tasks:
+            yield _render_pair(task)
+        return
+
+    with multiprocessing.Pool(
+        processes=min(jobs, len(tasks)),
+        initializer=_init_batch_worker,
+        initargs=(pptx_file,),
+    ) as pool:
+        yield from pool.imap_unordered(_render_pair, tasks)
+
+
+def batch_main(argv: List[str]) -> None:
+    """Command-line entry point for --batch."""
+    parser = argparse.ArgumentParser(
+        prog="replace.py --batch",
+        description="Render many decks from one template, one replacement JSON each.",
+    )
+    parser.add_argument("template", help="Template PowerPoint file (.pptx)")
+    parser.add_argument(
+        "manifest",
+        help='JSON array or JSON Lines of {"replacements": ..., "output": ...}',
+    )
+    parser.add_argument(
+        "--jobs", type=int, help="Worker processes (default: CPU count)"
+    )
+    parser.add_argument(
+        "--only-listed",
+        action="store_true",
+        help="Touch only the shapes each replacement JSON lists",
+    )
+    args = parser.parse_args(argv)
+
+    if not Path(args.template).exists():
+        print(f"Error: Input file '{args.template}' not found")
+        sys.exit(1)
+
+    pairs = load_batch_manifest(args.manifest)
+    start = time.perf_counter()
+    total = saved = 0
+    for report in apply_replacement_batch(
+        args.template, pairs, jobs=args.jobs, clear_unlisted=not args.only_listed
+    ):
+        total += 1
+        saved += report["saved"]
+        print(json.dumps(report, ensure_ascii=False), flush=True)
+
+    elapsed = time.perf_counter() - start
+    rate = total / elapsed if elapsed > 0 else 0.0
+    print(
+        f"Rendered {total} outputs in {elapsed:.2f}s ({rate:.1f} outputs/s): "
+        f"{saved} saved, {total - saved} with issues",
+        file=sys.stderr,
+    )
+    sys.exit(0 if saved == total else 1)
 
 
 def main():
     """Main entry point for command-line usage."""
-    if len(sys.argv) != 4:
+    if len(sys.argv) > 1 and sys.argv[1] == "--batch":
+        batch_main(sys.argv[2:])
+
+    args = sys.argv[1:]
+    only_listed = "--only-listed" in args
+    if only_listed:
+        args.remove("--only-listed")
+
+    if len(args) != 3:
         print(__doc__)
         sys.exit(1)
 
-    input_pptx = Path(sys.argv[1])
-    replacements_json = Path(sys.argv[2])
-    output_pptx = Path(sys.argv[3])
+    input_pptx = Path(args[0])
+    replacements_json = Path(args[1])
+    output_pptx = Path(args[2])
 
     if not input_pptx.exists():
         print(f"Error: Input file '{input_pptx}' not found")
@@ -372,7 +688,12 @@ def main():
         sys.exit(1)
 
     try:
-        apply_replacements(str(input_pptx), str(replacements_json), str(output_pptx))
+        apply_replacements(
+            str(input_pptx),
+            str(replacements_json),
+            str(output_pptx),
+            clear_unlisted=not only_listed,
+        )
     except Exception as e:
         print(f"Error applying replacements: {e}")
         import traceback
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Fast text measurement and line wrapping for overflow estimation.
+
+PIL's basic text layout is additive: the width of a string is the sum of its
+glyph advances plus a kerning adjustment for each adjacent pair. TextMeasurer
+caches those advances and pair adjustments per font, measures each word once
+and wraps a line in a single greedy pass, giving the same results as
+measuring every candidate line with ImageDraw.textlength.
+
+When PIL lays text out with libraqm (its default when libraqm is installed),
+widths are not additive even for Latin text: ligatures span three or more
+glyphs, contextual lookups and kerning across the space between words depend
+on wider context. Lines in such fonts are wrapped by PIL unchanged, and each
+wrapped line is remembered per font, so repeated text is measured once.
+
+Classes:
+    TextMeasurer: Cached width measurement and wrapping for one font
+
+Main Functions:
+    get_measurer: Return the shared TextMeasurer for a font object
+
+Usage (benchmark fast vs. PIL wrapping on a deck):
+    python text_metrics.py presentation.pptx [--width 300] [--repeat 3]
+"""
+
+import argparse
+import sys
+import time
+import weakref
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from PIL import Image, ImageDraw, ImageFont
+
+# Shared 1x1 canvas used for all PIL measurements
+_DRAW = ImageDraw.Draw(Image.new("RGB", (1, 1)))
+
+_measurers: "weakref.WeakKeyDictionary[object, TextMeasurer]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def pil_text_width(text: str, font) -> float:
+    """Measure text exactly as the inventory always has."""
+    return _DRAW.textlength(text, font=font)
+
+
+def wrap_text_line_pil(line: str, max_width_px: float, font) -> List[str]:
+    """Reference wrapper: measure the growing candidate line for every word."""
+    if not line:
+        return [""]
+
+    if pil_text_width(line, font) <= max_width_px:
+        return [line]
+
+    # Need to wrap - split into words
+    wrapped = []
+    words = line.split(" ")
+    current_line = ""
+
+    for word in words:
+        test_line = current_line + (" " if current_line else "") + word
+        if pil_text_width(test_line, font) <= max_width_px:
+            current_line = test_line
+        else:
+            if current_line:
+                wrapped.append(current_line)
+            current_line = word
+
+    if current_line:
+        wrapped.append(current_line)
+
+    return wrapped
+
+
+class TextMeasurer:
+    """Cached glyph metrics and greedy line wrapping for one font."""
+
+    def __init__(self, font):
+        self.font = font
+        # libraqm shapes text, so widths are not a sum of per-glyph parts
+        self.shaped = getattr(font, "layout_engine", None) == ImageFont.Layout.RAQM
+        self._advances: Dict[str, float] = {}
+        self._kerning: Dict[Tuple[str, str], float] = {}
+        self._words: Dict[str, float] = {}
+        self._wrapped: Dict[Tuple[str, float], List[str]] = {}
+
+    def _advance(self, char: str) -> float:
+        advance = self._advances.get(char)
+        if advance is None:
+            advance = self._advances[char] = pil_text_width(char, self.font)
+        return advance
+
+    def _kern(self, left: str, right: str) -> float:
+        pair = (left, right)
+        kern = self._kerning.get(pair)
+        if kern is None:
+            kern = self._kerning[pair] = (
+                pil_text_width(left + right, self.font)
+                - self._advance(left)
+                - self._advance(right)
+            )
+        return kern
+
+    def width(self, text: str) -> float:
+        """Width of text in pixels, equal to ImageDraw.textlength."""
+        if self.shaped:
+            return pil_text_width(text, self.font)
+        if not text:
+            return 0.0
+        width = self._advance(text[0])
+        for left, right in zip(text, text[1:]):
+            width += self._advance(right) + self._kern(left, right)
+        return width
+
+    def word_width(self, word: str) -> float:
+        """Width of a word, measured once per font."""
+        width = self._words.get(word)
+        if width is None:
+            width = self._words[word] = self.width(word)
+        return width
+
+    def wrap(self, line: str, max_width_px: float) -> List[str]:
+        """Wrap a single line of text to fit within max_width_px.
+
+        Produces the same lines as wrap_text_line_pil in one pass over the words.
+        """
+        if self.shaped:
+            key = (line, max_width_px)
+            wrapped = self._wrapped.get(key)
+            if wrapped is None:
+                wrapped = self._wrapped[key] = wrap_text_line_pil(
+                    line, max_width_px, self.font
+                )
+            return list(wrapped)
+        if not line:
+            return [""]
+
+        if self.width(line) <= max_width_px:
+            return [line]
+
+        wrapped = []
+        current: List[str] = []  # Words of the current line
+        current_width = 0.0
+        last_char = ""  # Last character of the current line ("" if empty)
+
+        for word in line.split(" "):
+            if last_char:
+                # current + " " + word
+                test_width = (
+                    current_width + self._kern(last_char, " ") + self._advance(" ")
+                )
+                if word:
+                    test_width += self._kern(" ", word[0]) + self.word_width(word)
+            else:
+                test_width = self.word_width(word)
+
+            if test_width <= max_width_px:
+                if last_char:
+                    current.append(word)
+                    last_char = word[-1] if word else " "
+                else:
+                    current = [word]
+                    last_char = word[-1] if word else ""
+                current_width = test_width
+            else:
+                if last_char:
+                    wrapped.append(" ".join(current))
+                current = [word]
+                current_width = self.word_width(word)
+                last_char = word[-1] if word else ""
+
+        if last_char:
+            wrapped.append(" ".join(current))
+
+        return wrapped
+
+
+def get_measurer(font) -> TextMeasurer:
+    """Return the TextMeasurer for a font object, sharing caches across calls."""
+    measurer = _measurers.get(font)
+    if measurer is None:
+        measurer = _measurers[font] = TextMeasurer(font)
+    return measurer
+
+
+def main():
+    """Benchmark cached wrapping against PIL measurement on a deck's paragraphs."""
+    from font_registry import get_font_registry
+    from pptx import Presentation
+
+    parser = argparse.ArgumentParser(
+        description="Compare fast text wrapping with PIL measurement on a presentation."
+    )
+    parser.add_argument("input", help="Input PowerPoint file (.pptx)")
+    parser.add_argument(
+        "--width", type=int, default=300, help="Wrap width in pixels (default: 300)"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Timing repetitions (default: 3)"
+    )
+    args = parser.parse_args()
+
+    registry = get_font_registry()
+    lines = []
+    for slide in Presentation(args.input).slides:
+        for shape in slide.shapes:
+            if not getattr(shape, "has_text_frame", False):
+                continue
+            for paragraph in shape.text_frame.paragraphs:
+                if not paragraph.text.strip():
+                    continue
+                font = paragraph.runs[0].font if paragraph.runs else None
+                font_name = (font.name if font else None) or "Arial"
+                font_size = int(font.size.pt) if font and font.size else 14
+                for line in paragraph.text.split("\n"):
+                    lines.append((line, registry.font(font_name, font_size)))
+
+    if not lines:
+        print("No text found")
+        sys.exit(1)
+
+    def run(wrap):
+        best = None
+        results = None
+        for _ in range(args.repeat):
+            _measurers.clear()
+            start = time.perf_counter()
+            results = [wrap(line, font) for line, font in lines]
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return results, best
+
+    pil_results, pil_time = run(
+        lambda line, font: wrap_text_line_pil(line, args.width, font)
+    )
+    fast_results, fast_time = run(
+        lambda line, font: get_measurer(font).wrap(line, args.width)
+    )
+
+    words = sum(len(line.split(" ")) for line, _ in lines)
+    mismatches = sum(1 for a, b in zip(pil_results, fast_results) if a != b)
+    print(f"{Path(args.input).name}: {len(lines)} lines, {words} words")
+    print(f"  PIL textlength per candidate line: {pil_time * 1000:.1f} ms")
+    print(f"  Cached glyph metrics:              {fast_time * 1000:.1f} ms")
+    print(f"  Speedup: {pil_time / fast_time:.1f}x, mismatched wraps: {mismatches}")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
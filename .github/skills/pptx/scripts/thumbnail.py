@@ -20,6 +20,7 @@ Grid limits by column count:
 
 Usage:
     python thumbnail.py input.pptx [output_prefix] [--cols N] [--outline-placeholders]
+                        [--jobs N] [--render-cache DIR]
 
 Examples:
     python thumbnail.py presentation.pptx
@@ -38,21 +39,38 @@ Examples:
 
     python thumbnail.py template.pptx analysis --outline-placeholders
     # Creates thumbnail grids with red outlines around text placeholders
+
+Pages are rasterized by parallel pdftoppm workers over page ranges (--jobs,
+default: CPU count), and each grid is assembled as soon as its pages are done.
+Slides are rendered at just the resolution the thumbnails need, and outlines
+are drawn on the scaled thumbnails.
+
+With --render-cache DIR (or $PPTX_RENDER_CACHE), rendered slides are cached
+by a hash of the slide and everything it uses, and only slides changed since
+an earlier run are rendered again. Slides with slide number fields are also
+rendered again when they move; date fields keep the date of the cached run.
 """
 
 import argparse
+import itertools
+import math
+import os
 import subprocess
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Set, Tuple
 
-from inventory import extract_text_inventory
+from inventory_lxml import iter_text_regions
 from PIL import Image, ImageDraw, ImageFont
 from pptx import Presentation
+from render_cache import RenderCache, get_default_cache
 
 # Constants
 THUMBNAIL_WIDTH = 300  # Fixed thumbnail width in pixels
-CONVERSION_DPI = 100  # DPI for PDF to image conversion
+CONVERSION_DPI = 100  # Reference DPI that outline stroke widths are defined at
+RASTER_CHUNK_PAGES = 10  # Most pages one pdftoppm worker renders per call
 MAX_COLS = 6  # Maximum number of columns
 DEFAULT_COLS = 5  # Default number of columns
 JPEG_QUALITY = 95  # JPEG compression quality
@@ -86,6 +104,18 @@ def main():
         action="store_true",
         help="Outline text placeholders with a colored border",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        metavar="N",
+        help="Number of parallel pdftoppm workers (default: CPU count)",
+    )
+    parser.add_argument(
+        "--render-cache",
+        metavar="DIR",
+        help="Cache rendered slides in DIR and render only changed slides "
+        "(default: $PPTX_RENDER_CACHE if set)",
+    )
 
     args = parser.parse_args()
 
@@ -107,24 +137,34 @@ def main():
 
     try:
         with tempfile.TemporaryDirectory() as temp_dir:
-            # Get placeholder regions if outlining is enabled
+            # Load the presentation once for hidden slides and text regions
+            analysis = analyze_presentation(input_path, args.outline_placeholders)
             placeholder_regions = None
             slide_dimensions = None
             if args.outline_placeholders:
-                print("Extracting placeholder regions...")
-                placeholder_regions, slide_dimensions = get_placeholder_regions(
-                    input_path
-                )
+                placeholder_regions = analysis.text_regions
+                slide_dimensions = analysis.slide_dimensions
                 if placeholder_regions:
                     print(f"Found placeholders on {len(placeholder_regions)} slides")
 
-            # Convert slides to images
-            slide_images = convert_to_images(input_path, Path(temp_dir), CONVERSION_DPI)
-            if not slide_images:
+            # Convert slides to images (rendered while the grids are assembled)
+            render_cache = (
+                RenderCache(args.render_cache)
+                if args.render_cache
+                else get_default_cache()
+            )
+            slide_count, slide_images = convert_to_images(
+                input_path,
+                analysis,
+                Path(temp_dir),
+                jobs=args.jobs,
+                cache=render_cache,
+            )
+            if not slide_count:
                 print("Error: No slides found")
                 sys.exit(1)
 
-            print(f"Found {len(slide_images)} slides")
+            print(f"Found {slide_count} slides")
 
             # Create grids (max cols×(cols+1) images per grid)
             grid_files = create_grids(
@@ -150,68 +190,173 @@ def create_hidden_slide_placeholder(size):
     """Create placeholder image for hidden slides."""
     img = Image.new("RGB", size, color="#F0F0F0")
     draw = ImageDraw.Draw(img)
-    line_width = max(5, min(size) // 100)
+    line_width = max(1, min(size) // 100)
     draw.line([(0, 0), size], fill="#CCCCCC", width=line_width)
     draw.line([(size[0], 0), (0, size[1])], fill="#CCCCCC", width=line_width)
     return img
 
 
-def get_placeholder_regions(pptx_path):
-    """Extract ALL text regions from the presentation.
+class PresentationAnalysis(NamedTuple):
+    """What the thumbnail steps need from a presentation, read in one pass."""
 
-    Returns a tuple of (placeholder_regions, slide_dimensions).
-    text_regions is a dict mapping slide indices to lists of text regions.
-    Each region is a dict with 'left', 'top', 'width', 'height' in inches.
-    slide_dimensions is a tuple of (width_inches, height_inches).
+    prs: Any  # The loaded python-pptx Presentation
+    hidden_slides: Set[int]  # 1-based numbers of hidden slides
+    text_regions: Dict[int, List[Dict[str, float]]]  # By 0-based slide index
+    slide_dimensions: Tuple[float, float]  # (width_inches, height_inches)
+
+
+def analyze_presentation(pptx_path, text_regions=True):
+    """Load a presentation once and read hidden slides and text regions.
+
+    Text regions cover every shape the inventory lists (all shapes with
+    text). They are read straight from the slide XML transforms, with
+    placeholder positions inherited from the layout and master, since
+    outlining only needs geometry.
+
+    Returns a PresentationAnalysis. Each text region is a dict with 'left',
+    'top', 'width', 'height' in inches; text_regions is empty unless
+    requested.
     """
+    print("Analyzing presentation...")
     prs = Presentation(str(pptx_path))
-    inventory = extract_text_inventory(pptx_path, prs)
-    placeholder_regions = {}
+
+    # Find hidden slides (1-based indexing for display)
+    hidden_slides = set()
+    regions_by_slide = {}
+    for slide_idx, slide in enumerate(prs.slides):
+        if slide.element.get("show") == "0":
+            hidden_slides.add(slide_idx + 1)
+        if not text_regions:
+            continue
+
+        slide_layout = slide.slide_layout
+        regions = [
+            {"left": left, "top": top, "width": width, "height": height}
+            for left, top, width, height in iter_text_regions(
+                slide.shapes._spTree,
+                slide_layout.element,
+                slide_layout.slide_master.element,
+            )
+        ]
+        if regions:
+            regions_by_slide[slide_idx] = regions
+
+    print(f"Total slides: {len(prs.slides)}")
+    if hidden_slides:
+        print(f"Hidden slides: {sorted(hidden_slides)}")
 
     # Get actual slide dimensions in inches (EMU to inches conversion)
     slide_width_inches = (prs.slide_width or 9144000) / 914400.0
     slide_height_inches = (prs.slide_height or 5143500) / 914400.0
 
-    for slide_key, shapes in inventory.items():
-        # Extract slide index from "slide-N" format
-        slide_idx = int(slide_key.split("-")[1])
-        regions = []
-
-        for shape_key, shape_data in shapes.items():
-            # The inventory only contains shapes with text, so all shapes should be highlighted
-            regions.append(
-                {
-                    "left": shape_data.left,
-                    "top": shape_data.top,
-                    "width": shape_data.width,
-                    "height": shape_data.height,
-                }
-            )
+    return PresentationAnalysis(
+        prs,
+        hidden_slides,
+        regions_by_slide,
+        (slide_width_inches, slide_height_inches),
+    )
 
-        if regions:
-            placeholder_regions[slide_idx] = regions
 
-    return placeholder_regions, (slide_width_inches, slide_height_inches)
+def convert_to_images(
+    pptx_path,
+    analysis,
+    temp_dir,
+    dpi=None,
+    jobs=None,
+    width=THUMBNAIL_WIDTH,
+    cache=None,
+):
+    """Convert PowerPoint to images via PDF, handling hidden slides.
 
+    analysis is the PresentationAnalysis of pptx_path (see
+    analyze_presentation).
 
-def convert_to_images(pptx_path, temp_dir, dpi):
-    """Convert PowerPoint to images via PDF, handling hidden slides."""
-    # Detect hidden slides
-    print("Analyzing presentation...")
-    prs = Presentation(str(pptx_path))
+    Slides are rendered at dpi, by default the lowest resolution that makes
+    them at least width pixels wide, so no detail is rendered only to be
+    scaled away.
+
+    With a cache (a RenderCache), slides whose image is cached are hidden in a
+    copy of the deck before it is converted, so only the other slides are
+    rendered; their images are added to the cache.
+
+    Returns a tuple of (slide_count, slide_images). slide_images yields one
+    image path per slide in slide order; pages are rasterized by parallel
+    pdftoppm workers (see rasterize_pages) and each is yielded as soon as it
+    and the pages before it are done.
+    """
+    prs = analysis.prs
     total_slides = len(prs.slides)
+    hidden_slides = analysis.hidden_slides
+
+    if dpi is None:
+        dpi = math.ceil(width / analysis.slide_dimensions[0])
+
+    # Look up visible slides in the render cache
+    visible_slides = [
+        (slide_num, slide)
+        for slide_num, slide in enumerate(prs.slides, start=1)
+        if slide_num not in hidden_slides
+    ]
+    slide_keys = {}
+    cached_images = {}
+    if cache is not None:
+        context = f"{prs.slide_width}x{prs.slide_height}@{dpi}"
+        for slide_num, slide in visible_slides:
+            slide_keys[slide_num] = cache.slide_key(slide, context, slide_num)
+            cached_image = cache.get(slide_keys[slide_num])
+            if cached_image is not None:
+                cached_images[slide_num] = cached_image
+    render_slides = [
+        (slide_num, slide)
+        for slide_num, slide in visible_slides
+        if slide_num not in cached_images
+    ]
+    if cached_images:
+        print(
+            f"Rendering {len(render_slides)} of {len(visible_slides)} visible slides "
+            f"({len(cached_images)} from render cache)"
+        )
 
-    # Find hidden slides (1-based indexing for display)
-    hidden_slides = {
-        idx + 1
-        for idx, slide in enumerate(prs.slides)
-        if slide.element.get("show") == "0"
-    }
+    rendered_images = iter(())
+    if render_slides:
+        if cached_images:
+            # Export a copy of the deck with the cached slides hidden
+            render_path = temp_dir / "render" / pptx_path.name
+            render_path.parent.mkdir()
+            for slide_num in cached_images:
+                prs.slides[slide_num - 1].element.set("show", "0")
+            prs.save(str(render_path))
+            for slide_num in cached_images:
+                prs.slides[slide_num - 1].element.attrib.pop("show")
+        else:
+            render_path = pptx_path
+        pdf_path = render_pdf(render_path, temp_dir)
 
-    print(f"Total slides: {total_slides}")
-    if hidden_slides:
-        print(f"Hidden slides: {sorted(hidden_slides)}")
+        # Convert PDF to images (hidden slides are not exported to the PDF)
+        print(f"Converting to images at {dpi} DPI...")
+        rendered_images = rasterize_pages(
+            pdf_path, temp_dir, dpi, len(render_slides), jobs
+        )
+
+    def visible_images():
+        for slide_num, _ in visible_slides:
+            if slide_num in cached_images:
+                yield cached_images[slide_num]
+                continue
+            image_path = next(rendered_images, None)
+            if image_path is None:
+                return
+            if slide_num in slide_keys:
+                cache.put(slide_keys[slide_num], image_path)
+            yield image_path
+
+    return total_slides, with_hidden_placeholders(
+        visible_images(), total_slides, hidden_slides, temp_dir
+    )
 
+
+def render_pdf(pptx_path, temp_dir):
+    """Convert a presentation to PDF in temp_dir with soffice; return the PDF path."""
     pdf_path = temp_dir / f"{pptx_path.stem}.pdf"
 
     # Convert to PDF
@@ -231,44 +376,95 @@ def convert_to_images(pptx_path, temp_dir, dpi):
     )
     if result.returncode != 0 or not pdf_path.exists():
         raise RuntimeError("PDF conversion failed")
+    return pdf_path
+
+
+def rasterize_pages(pdf_path, temp_dir, dpi, page_count, jobs=None):
+    """Rasterize PDF pages with parallel pdftoppm workers over page ranges.
 
-    # Convert PDF to images
-    print(f"Converting to images at {dpi} DPI...")
+    Yields page image paths in page order. Each range is yielded as soon as it
+    and the ranges before it are done, while the workers carry on with the
+    ranges after it.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    chunk_pages = max(1, min(RASTER_CHUNK_PAGES, math.ceil(page_count / jobs)))
+    page_ranges = [
+        (first, min(first + chunk_pages - 1, page_count))
+        for first in range(1, page_count + 1, chunk_pages)
+    ]
+
+    pool = ThreadPoolExecutor(max_workers=jobs)
+    try:
+        futures = [
+            pool.submit(rasterize_page_range, pdf_path, temp_dir, dpi, first, last)
+            for first, last in page_ranges
+        ]
+        for future in futures:
+            yield from future.result()
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+def rasterize_page_range(pdf_path, temp_dir, dpi, first, last):
+    """Rasterize pages first..last (1-based) with pdftoppm; return paths in order."""
+    prefix = f"pages{first}"
     result = subprocess.run(
-        ["pdftoppm", "-jpeg", "-r", str(dpi), str(pdf_path), str(temp_dir / "slide")],
+        [
+            "pdftoppm",
+            "-jpeg",
+            "-r",
+            str(dpi),
+            "-f",
+            str(first),
+            "-l",
+            str(last),
+            str(pdf_path),
+            str(temp_dir / prefix),
+        ],
         capture_output=True,
         text=True,
     )
     if result.returncode != 0:
         raise RuntimeError("Image conversion failed")
 
-    visible_images = sorted(temp_dir.glob("slide-*.jpg"))
+    # pdftoppm names pages <prefix>-<page number>.jpg, zero-padded to the
+    # width of the document's page count
+    return sorted(
+        temp_dir.glob(f"{prefix}-*.jpg"),
+        key=lambda path: int(path.stem.rsplit("-", 1)[1]),
+    )
 
-    # Create full list with placeholders for hidden slides
-    all_images = []
-    visible_idx = 0
 
-    # Get placeholder dimensions from first visible slide
-    if visible_images:
-        with Image.open(visible_images[0]) as img:
-            placeholder_size = img.size
-    else:
-        placeholder_size = (1920, 1080)
+def with_hidden_placeholders(visible_images, total_slides, hidden_slides, temp_dir):
+    """Yield one image per slide, drawing placeholders for hidden slides.
+
+    Placeholders take the size of the visible slide images.
+    """
+    visible_images = iter(visible_images)
+    placeholder_size = None
 
     for slide_num in range(1, total_slides + 1):
         if slide_num in hidden_slides:
+            if placeholder_size is None:
+                # Get placeholder dimensions from the next visible slide
+                next_image = next(visible_images, None)
+                if next_image is None:
+                    placeholder_size = (1920, 1080)
+                else:
+                    with Image.open(next_image) as img:
+                        placeholder_size = img.size
+                    visible_images = itertools.chain([next_image], visible_images)
+
             # Create placeholder image for hidden slide
             placeholder_path = temp_dir / f"hidden-{slide_num:03d}.jpg"
             placeholder_img = create_hidden_slide_placeholder(placeholder_size)
             placeholder_img.save(placeholder_path, "JPEG")
-            all_images.append(placeholder_path)
+            yield placeholder_path
         else:
             # Use the actual visible slide image
-            if visible_idx < len(visible_images):
-                all_images.append(visible_images[visible_idx])
-                visible_idx += 1
-
-    return all_images
+            image_path = next(visible_images, None)
+            if image_path is not None:
+                yield image_path
 
 
 def create_grids(
@@ -279,7 +475,16 @@ def create_grids(
     placeholder_regions=None,
     slide_dimensions=None,
 ):
-    """Create multiple thumbnail grids from slide images, max cols×(cols+1) images per grid."""
+    """Create multiple thumbnail grids from slide images, max cols×(cols+1) images per grid.
+
+    image_paths may be any iterable, such as the iterator from
+    convert_to_images; each grid is built as soon as its images are available.
+    slide_dimensions (width, height in inches) is required with
+    placeholder_regions, since images may be rendered at any resolution.
+    """
+    if placeholder_regions and slide_dimensions is None:
+        raise ValueError("slide_dimensions is required to outline placeholders")
+
     # Maximum images per grid is cols × (cols + 1) for better proportions
     max_images_per_grid = cols * (cols + 1)
     grid_files = []
@@ -289,19 +494,21 @@ def create_grids(
     )
 
     # Split images into chunks
-    for chunk_idx, start_idx in enumerate(
-        range(0, len(image_paths), max_images_per_grid)
-    ):
-        end_idx = min(start_idx + max_images_per_grid, len(image_paths))
-        chunk_images = image_paths[start_idx:end_idx]
-
+    images = iter(image_paths)
+    chunk_images = list(itertools.islice(images, max_images_per_grid))
+    start_idx = 0
+    chunk_idx = 0
+    while chunk_images:
         # Create grid for this chunk
         grid = create_grid(
             chunk_images, cols, width, start_idx, placeholder_regions, slide_dimensions
         )
 
+        # Look one image ahead to know whether this is the only grid
+        next_images = list(itertools.islice(images, 1))
+
         # Generate output filename
-        if len(image_paths) <= max_images_per_grid:
+        if chunk_idx == 0 and not next_images:
             # Single grid - use base filename without suffix
             grid_filename = output_path
         else:
@@ -315,6 +522,12 @@ def create_grids(
         grid.save(str(grid_filename), quality=JPEG_QUALITY)
         grid_files.append(str(grid_filename))
 
+        start_idx += len(chunk_images)
+        chunk_idx += 1
+        chunk_images = next_images + list(
+            itertools.islice(images, max_images_per_grid - len(next_images))
+        )
+
     return grid_files
 
 
@@ -326,7 +539,14 @@ def create_grid(
     placeholder_regions=None,
     slide_dimensions=None,
 ):
-    """Create thumbnail grid from slide images with optional placeholder outlining."""
+    """Create thumbnail grid from slide images with optional placeholder outlining.
+
+    slide_dimensions (width, height in inches) is required with
+    placeholder_regions.
+    """
+    if placeholder_regions and slide_dimensions is None:
+        raise ValueError("slide_dimensions is required to outline placeholders")
+
     font_size = int(width * FONT_SIZE_RATIO)
     label_padding = int(font_size * LABEL_PADDING_RATIO)
 
@@ -375,58 +595,21 @@ def create_grid(
         y_thumbnail = y_base + label_padding + font_size + label_padding
 
         with Image.open(img_path) as img:
-            # Get original dimensions before thumbnail
-            orig_w, orig_h = img.size
+            # Decode JPEGs straight at the smallest scale that still covers
+            # the thumbnail, then scale down the rest of the way
+            img.draft("RGB", (width, height))
+            img.thumbnail((width, height), Image.Resampling.LANCZOS)
+            if img.mode != "RGB":
+                img = img.convert("RGB")
 
             # Apply placeholder outlines if enabled
             if placeholder_regions and (start_slide_num + i) in placeholder_regions:
-                # Convert to RGBA for transparency support
-                if img.mode != "RGBA":
-                    img = img.convert("RGBA")
-
-                # Get the regions for this slide
-                regions = placeholder_regions[start_slide_num + i]
-
-                # Calculate scale factors using actual slide dimensions
-                if slide_dimensions:
-                    slide_width_inches, slide_height_inches = slide_dimensions
-                else:
-                    # Fallback: estimate from image size at CONVERSION_DPI
-                    slide_width_inches = orig_w / CONVERSION_DPI
-                    slide_height_inches = orig_h / CONVERSION_DPI
-
-                x_scale = orig_w / slide_width_inches
-                y_scale = orig_h / slide_height_inches
-
-                # Create a highlight overlay
-                overlay = Image.new("RGBA", img.size, (255, 255, 255, 0))
-                overlay_draw = ImageDraw.Draw(overlay)
-
-                # Highlight each placeholder region
-                for region in regions:
-                    # Convert from inches to pixels in the original image
-                    px_left = int(region["left"] * x_scale)
-                    px_top = int(region["top"] * y_scale)
-                    px_width = int(region["width"] * x_scale)
-                    px_height = int(region["height"] * y_scale)
-
-                    # Draw highlight outline with red color and thick stroke
-                    # Using a bright red outline instead of fill
-                    stroke_width = max(
-                        5, min(orig_w, orig_h) // 150
-                    )  # Thicker proportional stroke width
-                    overlay_draw.rectangle(
-                        [(px_left, px_top), (px_left + px_width, px_top + px_height)],
-                        outline=(255, 0, 0, 255),  # Bright red, fully opaque
-                        width=stroke_width,
-                    )
-
-                # Composite the overlay onto the image using alpha blending
-                img = Image.alpha_composite(img, overlay)
-                # Convert back to RGB for JPEG saving
-                img = img.convert("RGB")
+                draw_placeholder_outlines(
+                    img,
+                    placeholder_regions[start_slide_num + i],
+                    slide_dimensions,
+                )
 
-            img.thumbnail((width, height), Image.Resampling.LANCZOS)
             w, h = img.size
             tx = x + (width - w) // 2
             ty = y_thumbnail + (height - h) // 2
@@ -446,5 +629,44 @@ def create_grid(
     return grid
 
 
+def draw_placeholder_outlines(img, regions, slide_dimensions):
+    """Outline text regions on a (scaled) slide image in bright red.
+
+    Args:
+        img: RGB slide image, drawn on in place
+        regions: Dicts with 'left', 'top', 'width', 'height' in inches
+        slide_dimensions: Tuple of (width_inches, height_inches)
+    """
+    slide_width_inches, slide_height_inches = slide_dimensions
+    x_scale = img.width / slide_width_inches
+    y_scale = img.height / slide_height_inches
+
+    # Stroke as thick as the proportional stroke at CONVERSION_DPI would be
+    # once scaled down to this image
+    reference_width = slide_width_inches * CONVERSION_DPI
+    reference_height = slide_height_inches * CONVERSION_DPI
+    stroke_width = max(
+        1,
+        round(
+            max(5, int(min(reference_width, reference_height)) // 150)
+            * img.width
+            / reference_width
+        ),
+    )
+
+    draw = ImageDraw.Draw(img)
+    for region in regions:
+        # Convert from inches to pixels in this image
+        px_left = int(region["left"] * x_scale)
+        px_top = int(region["top"] * y_scale)
+        px_width = int(region["width"] * x_scale)
+        px_height = int(region["height"] * y_scale)
+        draw.rectangle(
+            [(px_left, px_top), (px_left + px_width, px_top + px_height)],
+            outline=(255, 0, 0),
+            width=stroke_width,
+        )
+
+
 if __name__ == "__main__":
     main()